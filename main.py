@@ -1,7 +1,12 @@
 import os
 import sys
+import time
 import runpy
 import shutil
+import hashlib
+import compileall
+
+LAUNCHED_AT = time.perf_counter()   # start of the startup timing report
 # import visitorRegisterDetails
 # import visitorQRconfig
 
@@ -9,23 +14,57 @@ import shutil
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 SRC_DIR = os.path.join(BASE_DIR, "src")
 LOGIN_DIR = os.path.join(SRC_DIR, "Api", "Homepage")
-PYCACHE_DIR = os.path.join(BASE_DIR, "__all_pycache__")
+PYCACHE_ROOT = os.path.join(BASE_DIR, "__all_pycache__")
 
-# --- Centralized cache path ---
+# --- Centralized, persistent cache path (one folder per interpreter, e.g. cpython-312) ---
+PYCACHE_DIR = os.path.join(PYCACHE_ROOT, sys.implementation.cache_tag)
+SOURCE_STAMP = os.path.join(PYCACHE_DIR, "sources.sha1")
 sys.pycache_prefix = PYCACHE_DIR
 
-# --- Clean pycache before running ---
+# --- Bytecode cache ---
+def sources_fingerprint():
+    """Hash of every source file's path, size and mtime under src/ (changes when any file is edited, added or removed)."""
+    digest = hashlib.sha1()
+    for folder, dirs, files in os.walk(SRC_DIR):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for name in sorted(files):
+            if name.endswith(".py"):
+                st = os.stat(os.path.join(folder, name))
+                digest.update(f"{os.path.relpath(os.path.join(folder, name), SRC_DIR)}|{st.st_size}|{st.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+def prepare_bytecode_cache():
+    """
+    Keeps compiled files between launches. Sources are only recompiled when the fingerprint changed;
+    Python's own per-file mtime check covers anything edited in between, and site-packages modules
+    are compiled once into the same folder on first import. Returns a note for the startup report.
+    """
+    os.makedirs(PYCACHE_DIR, exist_ok=True)
+    fingerprint = sources_fingerprint()
+    try:
+        with open(SOURCE_STAMP, encoding="utf-8") as f:
+            if f.read().strip() == fingerprint:
+                return "up to date"
+    except OSError:
+        pass
+
+    print("🛠 Sources changed, refreshing bytecode cache...")
+    compileall.compile_dir(SRC_DIR, quiet=1)   # only rewrites files whose source is newer
+    with open(SOURCE_STAMP, "w", encoding="utf-8") as f:
+        f.write(fingerprint)
+    return "recompiled changed sources"
+
 def clean_pycache():
-    """Deletes centralized cache folder before running."""
-    if os.path.exists(PYCACHE_DIR):
+    """Deletes the centralized cache folder (python main.py --clean-pycache)."""
+    if os.path.exists(PYCACHE_ROOT):
         print("🧹 Cleaning old cache files...")
-        shutil.rmtree(PYCACHE_DIR)
-    os.makedirs(PYCACHE_DIR, exist_ok=True)
-    print("✅ Cache directory ready.")
+        shutil.rmtree(PYCACHE_ROOT, ignore_errors=True)
 
 # --- Ensure import paths ---
-if SRC_DIR not in sys.path:
-    sys.path.insert(0, SRC_DIR)
+# Shared modules are imported as src.Api... only. src/ itself stays off sys.path: importing them a second
+# time as Api... would create separate module copies (own session pool, caches, local store, breaker).
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
 if LOGIN_DIR not in sys.path:
     sys.path.insert(0, LOGIN_DIR)
 
@@ -37,21 +76,12 @@ def start_login():
 
 # --- Main Entry Point ---
 if __name__ == "__main__":
-    clean_pycache()
+    from src.Api.Common_signature import startup_timing
+    startup_timing.start(LAUNCHED_AT)
+
+    if "--profile-imports" in sys.argv:
+        os.environ["VMS_IMPORT_PROFILE"] = "1"  # Ui.py prints the import cost of each screen on first use
+    if "--clean-pycache" in sys.argv:
+        clean_pycache()
+    startup_timing.mark("bytecode cache", prepare_bytecode_cache())
     start_login()
-
-    #  Cleanup after app closes
-    print("Cleaning up pycache after app closes...")
-    shutil.rmtree(PYCACHE_DIR, ignore_errors=True)
-    print("Pycache deleted successfully.")
-
-
-
-
-
-
-
-
-
-
-
@@ -0,0 +1,5 @@
+# Process-wide state lives in this package (pooled Artemis session, response cache, single-flight,
+# local store, circuit breaker, metrics). A second import name would create a second copy of all of it,
+# e.g. "Api.Common_signature" when src/ is on sys.path, so only the canonical name is allowed.
+if __name__ != "src.Api.Common_signature":
+    raise ImportError(f"Import this package as src.Api.Common_signature, not {__name__}")
@@ -3,14 +3,119 @@ from tkinter import ttk
 from PIL import Image, ImageTk
 import os
 
+# --- VIRTUAL MODE DEFAULTS ---
+ROW_HEIGHT = 44     # Fixed pixel height of one row when virtual=True (matches pady=12 labels)
+OVERSCAN = 4        # Extra rows built above/below the viewport so fast scrolling doesn't show gaps
+
+
+class _RowSlot:
+    """
+    One reusable row of cells (a label per column + the action buttons).
+    Cells are gridded into 'parent' at grid row 'row'; show() repaints only what changed.
+    """
+    def __init__(self, grid, parent, row):
+        self.grid = grid
+        self.row = row
+        self.row_data = None
+        self.key = None
+        self.index = None
+        self.bg = None
+        self.window = None  # Canvas window id (virtual mode only)
+        self.hidden = False
+        self.labels = []
+
+        for col_idx in range(len(grid.columns)):
+            # padx=10 is inside the label, grid(padx=0) keeps cells touching
+            lbl = tk.Label(parent, font=("Segoe UI", 10), fg="#555", anchor="w", pady=12, padx=10)
+            lbl.grid(row=row, column=col_idx, sticky="nsew", padx=0, pady=0)
+            self.labels.append(lbl)
+        self.texts = [None] * len(self.labels)
+
+        self.action_frame = tk.Frame(parent)
+        self.action_frame.grid(row=row, column=len(grid.columns), sticky="nsew", padx=0, pady=0)
+        self.btn_container = tk.Frame(self.action_frame)
+        self.btn_container.pack(expand=True)
+
+        self.buttons = []
+        # Commands read self.row_data at click time, so recycling a slot never needs a rebind
+        if grid.icon_edit:
+            btn_edit = tk.Button(self.btn_container, image=grid.icon_edit, bd=0, cursor="hand2",
+                                 command=lambda: grid.edit_cmd(self.row_data))
+            btn_edit.pack(side="left", padx=5)
+            self.buttons.append(btn_edit)
+        if grid.icon_delete:
+            btn_del = tk.Button(self.btn_container, image=grid.icon_delete, bd=0, cursor="hand2",
+                                command=lambda: grid.delete_cmd(self.row_data))
+            btn_del.pack(side="left", padx=5)
+            self.buttons.append(btn_del)
+
+        self.cells = self.labels + [self.action_frame]
+        self.widgets = self.cells + [self.btn_container] + self.buttons
+        # No per-widget bindings: pointer events reach the grid's single hover handler via a shared bindtag
+        for w in self.widgets:
+            w.bindtags((grid.hover_tag,) + w.bindtags())
+
+    def show(self, row_data, bg_color):
+        """ Points the slot at a new record; only labels whose text differs are reconfigured """
+        self.row_data = row_data
+        for i, (col_key, _, _) in enumerate(self.grid.columns):
+            text = self.grid.format_cell(row_data, col_key)
+            if self.texts[i] != text:
+                self.labels[i].configure(text=text)
+                self.texts[i] = text
+        if self.bg != bg_color:
+            self.set_bg(bg_color)
+            self.bg = bg_color
+
+    def set_bg(self, color):
+        for w in self.labels: w.configure(bg=color)
+        self.action_frame.configure(bg=color)
+        self.btn_container.configure(bg=color)
+        for b in self.buttons: b.configure(bg=color, activebackground=color)
+
+    def place_at(self, row):
+        """ Grid mode: moves (or un-hides) the cells to grid row 'row' """
+        if self.hidden or self.row != row:
+            for w in self.cells: w.grid_configure(row=row)
+            self.row = row
+            self.hidden = False
+
+    def hide(self):
+        self.key = None
+        self.index = None
+        if self.hidden: return
+        if self.window is not None:
+            self.grid.canvas.itemconfigure(self.window, state="hidden")
+        else:
+            for w in self.cells: w.grid_remove()
+        self.hidden = True
+
+
 class ActionGrid(tk.Frame):
-    def __init__(self, parent, columns, edit_command=None, delete_command=None):
+    def __init__(self, parent, columns, edit_command=None, delete_command=None,
+                 virtual=False, row_height=ROW_HEIGHT, overscan=OVERSCAN, row_key=None):
         super().__init__(parent, bg="white")
         self.columns = columns  # Format: (key, title, weight_int)
         self.edit_cmd = edit_command
         self.delete_cmd = delete_command
         self.hover_color = "#EBF5FB"
-        self.row_widgets = {}
+
+        # row_key: field name (or callable) giving a stable id per record.
+        # With it, render_data() leaves rows whose id and text are unchanged completely untouched.
+        self.row_key = row_key
+        self._message = None
+
+        # Hover is delegated: one motion handler maps the pointer's y to a row index
+        self.hover_tag = f"ActionGridRow{id(self)}"
+        self._shown = {}        # row index -> slot currently displaying it
+        self._hover_idx = None
+
+        # Virtual mode: only the rows inside the viewport (+ overscan) get widgets
+        self.virtual = virtual
+        self.row_height = row_height
+        self.overscan = overscan
+        self._data = []
+        self._slots = []
 
         # --- IMAGE LOADING ---
         current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -23,20 +128,28 @@ class ActionGrid(tk.Frame):
         # --- HEADER FRAME ---
         self.header_frame = tk.Frame(self, bg="#EAECEE", height=40, pady=0)
         self.header_frame.pack(fill="x")
-        
+
         # --- BODY (SCROLLABLE) ---
         self.canvas = tk.Canvas(self, bg="white", highlightthickness=0)
         self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
-        
+
         self.body_frame = tk.Frame(self.canvas, bg="white")
-        
-        self.body_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
+
+        if not self.virtual:
+            self.body_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
         self.frame_id = self.canvas.create_window((0, 0), window=self.body_frame, anchor="nw")
-        
+
         # FORCE FULL WIDTH
-        self.canvas.bind("<Configure>", lambda e: self.canvas.itemconfig(self.frame_id, width=e.width))
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+
+        self.canvas.configure(yscrollcommand=self._on_yview)
 
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        # --- HOVER (one handler for the whole body) ---
+        for target in (self.canvas, self.body_frame):
+            target.bindtags((self.hover_tag,) + target.bindtags())
+        self.bind_class(self.hover_tag, "<Motion>", self._on_pointer_motion)
+        self.bind_class(self.hover_tag, "<Leave>", self._on_pointer_leave)
+        self.bind("<Destroy>", self._on_destroy, add="+")
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
 
@@ -44,30 +157,33 @@ class ActionGrid(tk.Frame):
         # ALIGNMENT ENGINE (The Fix)
         # We apply the EXACT SAME grid configuration to Header & Body
         # ============================================================
-        
+
         # 1. Setup Data Columns
         for i, (_, col_title, weight) in enumerate(self.columns):
-            # Calculate a minimum width based on weight to prevent crushing
-            # Weight 1 -> 80px, Weight 3 -> 240px
-            min_w = weight * 80 
-            
             # Configure Header
-            self.header_frame.grid_columnconfigure(i, weight=weight, minsize=min_w)
+            self.header_frame.grid_columnconfigure(i, weight=weight, minsize=weight * 80)
             lbl = tk.Label(self.header_frame, text=col_title, font=("Segoe UI", 10, "bold"), 
                            bg="#EAECEE", fg="#333", anchor="w")
             lbl.grid(row=0, column=i, sticky="ew", padx=5)
 
-            # Configure Body (Identical Settings)
-            self.body_frame.grid_columnconfigure(i, weight=weight, minsize=min_w)
-
         # 2. Setup Action Column (Fixed Width)
         action_col_idx = len(self.columns)
         self.header_frame.grid_columnconfigure(action_col_idx, weight=0, minsize=100)
-        self.body_frame.grid_columnconfigure(action_col_idx, weight=0, minsize=100)
-        
+
         tk.Label(self.header_frame, text="Actions", font=("Segoe UI", 10, "bold"), 
                  bg="#EAECEE", fg="#333", anchor="center").grid(row=0, column=action_col_idx, sticky="ew", padx=9)
 
+        # Configure Body (Identical Settings)
+        self.configure_columns(self.body_frame)
+
+    def configure_columns(self, frame):
+        """ Applies the header's column weights/min widths to a body container """
+        for i, (_, _, weight) in enumerate(self.columns):
+            # Calculate a minimum width based on weight to prevent crushing
+            # Weight 1 -> 80px, Weight 3 -> 240px
+            frame.grid_columnconfigure(i, weight=weight, minsize=weight * 80)
+        frame.grid_columnconfigure(len(self.columns), weight=0, minsize=100)
+
     def load_icon(self, path):
         if not os.path.exists(path): return None
         try:
@@ -75,78 +191,197 @@ class ActionGrid(tk.Frame):
             return ImageTk.PhotoImage(img)
         except: return None
 
-    def render_data(self, data_list):
-        for widget in self.body_frame.winfo_children(): widget.destroy()
-        self.row_widgets = {}
+    def format_cell(self, row_data, col_key):
+        val = str(row_data.get(col_key, "-"))
+        if len(val) > 40: val = val[:37] + "..."
+        return val
+
+    def key_of(self, row_data):
+        if self.row_key is None: return None
+        if callable(self.row_key): return self.row_key(row_data)
+        return row_data.get(self.row_key)
 
+    def show_message(self, text):
+        """ Replaces the rows with a single centered status line (e.g. 'Loading...') """
+        self._data = []
+        self._hide_slots()
+        if self.virtual:
+            self.canvas.itemconfigure(self.frame_id, state="normal")
+            self.canvas.configure(scrollregion=(0, 0, 0, 0))
+        if self._message is None:
+            self._message = tk.Label(self.body_frame, bg="white", pady=20)
+        self._message.configure(text=text)
+        self._message.grid(row=0, column=0, columnspan=len(self.columns)+1)
+
+    def show_loading(self):
+        """ Shows 'Loading...' on an empty grid; existing rows stay up until the new data arrives """
+        if not self._data:
+            self.show_message("Loading...")
+
+    def render_data(self, data_list):
         if not data_list:
-            tk.Label(self.body_frame, text="No records found", bg="white", pady=20).grid(row=0, column=0, columnspan=len(self.columns)+1)
+            self.show_message("No records found")
+            return
+
+        if self._message is not None:
+            self._message.grid_remove()
+
+        if self.virtual:
+            self._render_virtual(data_list)
             return
 
+        self._data = list(data_list)
+        self._clear_hover()
+        colors = ["white", "#F8F9F9"]
+
+        # 1. Rows whose key is already on screen keep their slot (moved if their position changed)
+        keys = [self.key_of(r) for r in self._data]
+        by_key = {slot.key: slot for slot in self._slots if slot.key is not None}
+        assigned = [by_key.pop(k, None) if k is not None else None for k in keys]
+
+        # 2. Everything else comes from the recycling pool, growing it only when it runs dry
+        taken = {id(slot) for slot in assigned if slot is not None}
+        free = [slot for slot in self._slots if id(slot) not in taken]
+        free.reverse()
+
+        for row_idx, row_data in enumerate(self._data):
+            slot = assigned[row_idx]
+            if slot is None:
+                slot = free.pop() if free else self._new_grid_slot(row_idx)
+            slot.place_at(row_idx)
+            slot.key = keys[row_idx]
+            slot.show(row_data, colors[row_idx % 2])
+            assigned[row_idx] = slot
+
+        self._shown = dict(enumerate(assigned))
+
+        # 3. Leftover slots are hidden, not destroyed, so the next page can reuse them
+        for slot in free: slot.hide()
+
+    def _new_grid_slot(self, row_idx):
+        slot = _RowSlot(self, self.body_frame, row_idx)
+        self._slots.append(slot)
+        return slot
+
+    def _hide_slots(self):
+        self._clear_hover()
+        self._shown = {}
+        for slot in self._slots: slot.hide()
+
+    # ============================================================
+    # HOVER (delegated)
+    # ============================================================
+    def _row_at(self, y_root):
+        """ Row index under a screen y coordinate, or None """
+        if self.virtual:
+            y = self.canvas.canvasy(y_root - self.canvas.winfo_rooty())
+            idx = int(y // self.row_height)
+        else:
+            _, idx = self.body_frame.grid_location(0, y_root - self.body_frame.winfo_rooty())
+        return idx if 0 <= idx < len(self._data) else None
+
+    def _on_pointer_motion(self, event):
+        self._set_hover(self._row_at(event.y_root))
+
+    def _on_pointer_leave(self, event):
+        # Moving between cells of the grid also raises <Leave>; only clear when the pointer left the body
+        w = self.winfo_containing(event.x_root, event.y_root)
+        body = str(self.canvas)
+        if w is None or not (str(w) == body or str(w).startswith(body + ".")):
+            self._set_hover(None)
+
+    def _set_hover(self, idx):
+        """ Recolors only the row being left and the row being entered """
+        if idx == self._hover_idx: return
+        self._clear_hover()
+        slot = self._shown.get(idx)
+        if slot is not None:
+            slot.set_bg(self.hover_color)
+            self._hover_idx = idx
+
+    def _clear_hover(self):
+        slot = self._shown.get(self._hover_idx)
+        if slot is not None and slot.bg is not None:
+            slot.set_bg(slot.bg)
+        self._hover_idx = None
+
+    def _on_destroy(self, event):
+        if event.widget is self:
+            self.unbind_class(self.hover_tag, "<Motion>")
+            self.unbind_class(self.hover_tag, "<Leave>")
+
+    # ============================================================
+    # SCROLL / RESIZE
+    # ============================================================
+    def _on_canvas_configure(self, event):
+        self.canvas.itemconfig(self.frame_id, width=event.width)
+        if self.virtual:
+            for slot in self._slots:
+                self.canvas.itemconfig(slot.window, width=event.width)
+            self._refresh_viewport()
+
+    def _on_yview(self, first, last):
+        self.scrollbar.set(first, last)
+        if self.virtual:
+            self._refresh_viewport()
+
+    # ============================================================
+    # VIRTUAL MODE (constant widget count regardless of row count)
+    # ============================================================
+    def _render_virtual(self, data_list):
+        self._data = list(data_list)
+        self.canvas.itemconfigure(self.frame_id, state="hidden")
+
+        # Indices may now point at different records; show() still skips labels whose text is unchanged
+        for slot in self._slots: slot.index = None
+
+        width = self.canvas.winfo_width()
+        self.canvas.configure(scrollregion=(0, 0, width, len(self._data) * self.row_height))
+        self._refresh_viewport()
+
+    def _new_slot(self):
+        frame = tk.Frame(self.canvas, bg="white", height=self.row_height)
+        frame.grid_propagate(False)
+        frame.grid_rowconfigure(0, weight=1)
+        self.configure_columns(frame)
+        frame.bindtags((self.hover_tag,) + frame.bindtags())
+
+        slot = _RowSlot(self, frame, 0)
+        slot.frame = frame
+        slot.window = self.canvas.create_window((0, 0), window=frame, anchor="nw",
+                                                width=self.canvas.winfo_width(), height=self.row_height,
+                                                state="hidden")
+        slot.hidden = True
+        self._slots.append(slot)
+        return slot
+
+    def _refresh_viewport(self):
+        if not self._data: return
+        self._clear_hover()
+
+        top = int(self.canvas.canvasy(0))
+        height = max(self.canvas.winfo_height(), self.row_height)
+        first = max(top // self.row_height - self.overscan, 0)
+        last = min((top + height) // self.row_height + self.overscan + 1, len(self._data))
+
+        # Keep slots that still show a visible index; everything else is free for reuse
+        wanted = set(range(first, last))
+        free = []
+        for slot in self._slots:
+            if slot.index in wanted:
+                wanted.discard(slot.index)
+            else:
+                free.append(slot)
+
         colors = ["white", "#F8F9F9"]
+        for idx in sorted(wanted):
+            slot = free.pop() if free else self._new_slot()
+            slot.index = idx
+            slot.show(self._data[idx], colors[idx % 2])
+            self.canvas.coords(slot.window, 0, idx * self.row_height)
+            if slot.hidden:
+                self.canvas.itemconfigure(slot.window, state="normal")
+                slot.hidden = False
 
-        for row_idx, row_data in enumerate(data_list):
-            bg_color = colors[row_idx % 2]
-            current_widgets = [] 
-
-            # --- RENDER COLUMNS ---
-            for col_idx, (col_key, _, _) in enumerate(self.columns):
-                val = str(row_data.get(col_key, "-"))
-                if len(val) > 40: val = val[:37] + "..."
-                
-                # CRITICAL FIX: 
-                # padx=10 IS INSIDE THE LABEL constructor.
-                # grid(padx=0) ensures cells touch each other.
-                lbl = tk.Label(self.body_frame, text=val, font=("Segoe UI", 10), 
-                               bg=bg_color, fg="#555", anchor="w", 
-                               pady=12, padx=10) 
-                
-                # sticky="nsew" forces the background to fill the grid cell completely
-                lbl.grid(row=row_idx, column=col_idx, sticky="nsew", padx=0, pady=0)
-                
-                current_widgets.append(lbl)
-
-            # --- ACTION COLUMN ---
-            action_frame = tk.Frame(self.body_frame, bg=bg_color)
-            action_frame.grid(row=row_idx, column=len(self.columns), sticky="nsew", padx=0, pady=0)
-            current_widgets.append(action_frame)
-
-            # Center container for buttons
-            btn_container = tk.Frame(action_frame, bg=bg_color)
-            btn_container.pack(expand=True) # Centers vertically/horizontally
-            current_widgets.append(btn_container)
-
-            # Buttons
-            if self.icon_edit:
-                btn_edit = tk.Button(btn_container, image=self.icon_edit, bg=bg_color, bd=0, cursor="hand2",
-                                     activebackground=bg_color, command=lambda d=row_data: self.edit_cmd(d))
-                btn_edit.image = self.icon_edit
-                btn_edit.pack(side="left", padx=5)
-                current_widgets.append(btn_edit)
-
-            if self.icon_delete:
-                btn_del = tk.Button(btn_container, image=self.icon_delete, bg=bg_color, bd=0, cursor="hand2",
-                                    activebackground=bg_color, command=lambda d=row_data: self.delete_cmd(d))
-                btn_del.image = self.icon_delete
-                btn_del.pack(side="left", padx=5)
-                current_widgets.append(btn_del)
-
-            # --- HOVER LOGIC ---
-            self.row_widgets[row_idx] = (current_widgets, bg_color)
-            for w in current_widgets:
-                w.bind("<Enter>", lambda e, r=row_idx: self.on_enter(r))
-                w.bind("<Leave>", lambda e, r=row_idx: self.on_leave(r))
-
-    def on_enter(self, row_idx):
-        if row_idx in self.row_widgets:
-            widgets, _ = self.row_widgets[row_idx]
-            for w in widgets:
-                try: w.configure(bg=self.hover_color)
-                except: pass
-
-    def on_leave(self, row_idx):
-        if row_idx in self.row_widgets:
-            widgets, original_bg = self.row_widgets[row_idx]
-            for w in widgets:
-                try: w.configure(bg=original_bg)
-                except: pass
\ No newline at end of file
+        for slot in free: slot.hide()
+        self._shown = {slot.index: slot for slot in self._slots if slot.index is not None}
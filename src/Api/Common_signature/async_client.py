@@ -0,0 +1,198 @@
+import asyncio
+import functools
+import queue
+import threading
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+
+from . import common_signature_api as api
+
+# async_client.py
+
+DEFAULT_CONCURRENCY = 4     # Max Artemis requests in flight from the background loop
+POLL_INTERVAL_MS = 30       # How often Tk drains finished results while requests are pending
+
+
+# ------------------------------------------------------------
+# BACKGROUND EVENT LOOP CLIENT
+# ------------------------------------------------------------
+class AsyncArtemisClient:
+    """
+    Runs an asyncio event loop on a daemon thread and issues signed Artemis requests from it.
+    Requests use the same create_signature() headers and the same pooled session as call_api;
+    the blocking socket work runs in a small executor so the loop itself never stalls.
+    """
+
+    def __init__(self, max_concurrency=DEFAULT_CONCURRENCY):
+        self.max_concurrency = max_concurrency
+        self._loop = None
+        self._thread = None
+        self._executor = None
+        self._semaphore = None
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return self
+            self._ready.clear()
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="artemis-io")
+            self._thread = threading.Thread(target=self._run_loop, name="artemis-loop", daemon=True)
+            self._thread.start()
+        self._ready.wait()
+        return self
+
+    def _run_loop(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    async def request(self, api_path, payload_dict=None, method="POST", timeout=10):
+        """ Coroutine: returns parsed JSON or raises (see common_signature_api.request_json) """
+        async with self._semaphore:
+            call = functools.partial(api.request_json, api_path, payload_dict, method=method, timeout=timeout)
+            return await self._loop.run_in_executor(self._executor, call)
+
+    async def run(self, fn, *args):
+        """ Coroutine: runs any blocking API helper (e.g. a multi-page fetch) in the executor """
+        async with self._semaphore:
+            return await self._loop.run_in_executor(self._executor, functools.partial(fn, *args))
+
+    def submit_call(self, fn, *args):
+        """ Thread-safe: schedules fn(*args) on the loop and returns a concurrent.futures.Future """
+        self.start()
+        return asyncio.run_coroutine_threadsafe(self.run(fn, *args), self._loop)
+
+    def submit(self, api_path, payload_dict=None, method="POST", timeout=10):
+        """ Thread-safe: schedules a request on the loop and returns a concurrent.futures.Future """
+        self.start()
+        coro = self.request(api_path, payload_dict, method=method, timeout=timeout)
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def stop(self):
+        with self._lock:
+            if not self._loop: return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=2)
+            self._executor.shutdown(wait=False)
+            self._loop = None
+            self._thread = None
+
+
+# ------------------------------------------------------------
+# TK BRIDGE (worker thread -> Tk main thread)
+# ------------------------------------------------------------
+class TkBridge:
+    """
+    Thread-safe callback queue drained on the Tk main thread with after().
+    Polling only runs while there are results outstanding.
+    """
+
+    def __init__(self, root, poll_ms=POLL_INTERVAL_MS):
+        self.root = root
+        self.poll_ms = poll_ms
+        self._queue = queue.Queue()
+        self._pending = 0
+        self._polling = False
+
+    def expect(self):
+        """ Main thread: register one outstanding result and make sure the drain loop is running """
+        self._pending += 1
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_ms, self._drain)
+
+    def post(self, fn, *args):
+        """ Any thread: queue fn(*args) to run on the Tk thread """
+        self._queue.put((fn, args))
+
+    def _drain(self):
+        while True:
+            try:
+                fn, args = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            self._pending -= 1
+            try:
+                fn(*args)
+            except Exception as e:
+                print(f"⚠️ Async callback error: {e}")
+
+        if self._pending > 0:
+            self.root.after(self.poll_ms, self._drain)
+        else:
+            self._polling = False
+
+
+# ------------------------------------------------------------
+# SHARED INSTANCES + HELPER USED BY SCREENS
+# ------------------------------------------------------------
+_client = None
+_bridges = {}
+
+def get_client():
+    global _client
+    if _client is None:
+        _client = AsyncArtemisClient()
+    return _client.start()
+
+def get_bridge(widget):
+    root = widget._root()
+    bridge = _bridges.get(str(root))
+    if bridge is None or bridge.root is not root:
+        bridge = TkBridge(root)
+        _bridges[str(root)] = bridge
+    return bridge
+
+def call_api_async(widget, api_path, payload_dict=None, on_success=None, on_error=None, method="POST", timeout=10):
+    """
+    Non-blocking replacement for call_api().
+    on_success(res) / on_error(exc) run on the Tk thread; they are skipped if 'widget' was destroyed meanwhile.
+    Without on_error the standard call_api error dialog is shown.
+    """
+    future = get_client().submit(api_path, payload_dict, method=method, timeout=timeout)
+    return _deliver_to_tk(widget, future, on_success, on_error)
+
+def run_async(widget, fn, *args, on_success=None, on_error=None):
+    """ Same as call_api_async() but for any blocking function, e.g. list(iter_records(...)) """
+    future = get_client().submit_call(fn, *args)
+    return _deliver_to_tk(widget, future, on_success, on_error)
+
+def _deliver_to_tk(widget, future, on_success, on_error):
+    bridge = get_bridge(widget)
+    bridge.expect()
+
+    def deliver(fut):
+        # Always post exactly once: the bridge keeps polling until every expected result has arrived
+        if fut.cancelled():
+            bridge.post(_cancelled)
+            return
+        try:
+            result, error = fut.result(), None
+        except BaseException as e:
+            result, error = None, e
+        bridge.post(_finish, widget, result, error, on_success, on_error)
+
+    future.add_done_callback(deliver)
+    return future
+
+def _cancelled():
+    """ Cancelled request: nobody is waiting for it, only the bridge's pending count is settled """
+
+def _finish(widget, result, error, on_success, on_error):
+    try:
+        if not widget.winfo_exists(): return
+    except tk.TclError:
+        return
+
+    if error is not None:
+        if on_error: on_error(error)
+        else: api.report_api_error(error)
+    elif on_success:
+        on_success(result)
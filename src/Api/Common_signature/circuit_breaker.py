@@ -0,0 +1,145 @@
+import threading
+import time
+
+import requests
+
+# circuit_breaker.py
+
+FAILURE_THRESHOLD = 3     # Consecutive host failures that open the circuit
+RESET_TIMEOUT = 15.0      # Seconds to stay open before letting one probe request through
+CONNECT_TIMEOUT = 3.05    # Connect phase timeout used by request_json (read timeout stays per call)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """ Raised instead of sending a request while the Artemis host is considered down """
+    def __init__(self, retry_in):
+        super().__init__(f"Artemis host unavailable (next probe in {retry_in:.0f}s)")
+        self.retry_in = retry_in
+
+
+def is_host_failure(error):
+    """ Failures that say something about the host itself (not about one bad request) """
+    status = getattr(error, "status_code", None)
+    if status is not None:
+        return status >= 500
+    return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+
+# ------------------------------------------------------------
+# BREAKER
+# ------------------------------------------------------------
+class CircuitBreaker:
+    """
+    closed    -> requests flow; FAILURE_THRESHOLD consecutive host failures open the circuit
+    open      -> requests fail immediately with CircuitOpenError for RESET_TIMEOUT seconds
+    half_open -> exactly one probe request is let through; success closes, failure re-opens
+    """
+
+    def __init__(self, failure_threshold=FAILURE_THRESHOLD, reset_timeout=RESET_TIMEOUT, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._listeners = []
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._state
+
+    def add_listener(self, fn):
+        """ fn(old_state, new_state) is called on whichever thread caused the change """
+        self._listeners.append(fn)
+
+    def _set_state(self, new_state):
+        # Lock held by caller; listeners are notified after it is released
+        old, self._state = self._state, new_state
+        return (old, new_state) if old != new_state else None
+
+    def _notify(self, change):
+        if not change: return
+        print(f"🔌 Artemis circuit {change[0]} -> {change[1]}")
+        for fn in list(self._listeners):
+            try:
+                fn(*change)
+            except Exception as e:
+                print(f"⚠️ Circuit listener error: {e}")
+
+    def before_call(self):
+        """ Raises CircuitOpenError when the request must not be sent """
+        change = None
+        with self._lock:
+            if self._state == OPEN:
+                waited = self._clock() - self._opened_at
+                if waited < self.reset_timeout:
+                    raise CircuitOpenError(self.reset_timeout - waited)
+                change = self._set_state(HALF_OPEN)
+            if self._state == HALF_OPEN:
+                if self._probe_in_flight:
+                    raise CircuitOpenError(0)
+                self._probe_in_flight = True
+        self._notify(change)
+
+    def raise_if_open(self):
+        """ For retry loops already inside call(): stop once the circuit opened (never starts a probe) """
+        with self._lock:
+            if self._state == OPEN:
+                raise CircuitOpenError(max(0.0, self.reset_timeout - (self._clock() - self._opened_at)))
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._probe_in_flight = False
+            change = self._set_state(CLOSED)
+        self._notify(change)
+
+    def record_failure(self):
+        change = None
+        with self._lock:
+            self._failures += 1
+            was_probe, self._probe_in_flight = self._probe_in_flight, False
+            if was_probe or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+                change = self._set_state(OPEN)
+        self._notify(change)
+
+    def release(self):
+        """ Attempt ended without telling anything about the host (e.g. an API error code) """
+        with self._lock:
+            if self._probe_in_flight:
+                self._probe_in_flight = False
+                self._failures = 0
+                change = self._set_state(CLOSED)
+            else:
+                change = None
+        self._notify(change)
+
+    def call(self, fn, *args, **kwargs):
+        self.before_call()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            if is_host_failure(e): self.record_failure()
+            else: self.release()
+            raise
+        self.record_success()
+        return result
+
+    def snapshot(self):
+        with self._lock:
+            retry_in = max(0.0, self.reset_timeout - (self._clock() - self._opened_at)) if self._state == OPEN else 0.0
+            return {"state": self._state, "failures": self._failures, "retry_in": round(retry_in, 1)}
+
+
+# ------------------------------------------------------------
+# SHARED INSTANCE (one Artemis host)
+# ------------------------------------------------------------
+breaker = CircuitBreaker()
@@ -1,14 +1,24 @@
 # common_api.py
 
 import requests
-import hmac
-import hashlib
 import base64
 import json
+import os
+import atexit
+import threading
+import time
 import urllib3
 from tkinter import messagebox
 import tkinter as tk
 
+from .http_session import ArtemisSession
+from .response_cache import ResponseCache, cache_key
+from .metrics import registry as metrics
+from . import retry
+from .signer import Signer
+from .singleflight import SingleFlight
+from .circuit_breaker import breaker, CircuitOpenError, CONNECT_TIMEOUT, is_host_failure
+
 # Suppress InsecureRequestWarning for unverified HTTPS requests
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -27,44 +37,100 @@ def get_access_token():
 # --- Artemis API Details (Constants) ---
 APP_KEY = "11566257"
 APP_SECRET = "DBntId5f4LZPfW1Ik5Yh"
-HOST = "127.0.0.1"
-BASE_URL = f"https://{HOST}" 
+HOST = os.environ.get("ARTEMIS_HOST", "127.0.0.1")
+BASE_URL = os.environ.get("ARTEMIS_BASE_URL", f"https://{HOST}")  # e.g. http://127.0.0.1:8080 for tools/mock_artemis_server.py
 
 
 # ------------------------------------------------------------
-# SIGNATURE CREATION
+# SHARED HTTP SESSION (keep-alive connection pool)
 # ------------------------------------------------------------
-def create_signature(method, body, api_path):
-    """Creates the necessary HMAC-SHA256 signature and headers for the API request."""
-    accept = "application/json"
-    content_type = "application/json;charset=UTF-8"
-
-    # Use the JSON body directly for MD5 hash
-    content_md5 = base64.b64encode(hashlib.md5(body.encode('utf-8')).digest()).decode('utf-8')
-    signature_headers = "x-ca-key"
-    headers_to_sign = f"x-ca-key:{APP_KEY}\n"
-
-    string_to_sign = (
-        f"{method}\n"
-        f"{accept}\n"
-        f"{content_md5}\n"
-        f"{content_type}\n"
-        f"{headers_to_sign}"
-        f"{api_path}"
+_session = None
+_session_lock = threading.Lock()
+
+def configure_session(**pool_options):
+    """
+    Replaces the shared session with one built from the given pool options
+    (pool_connections, pool_maxsize, pool_block, keep_alive).
+    """
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = ArtemisSession(**pool_options)
+    return _session
+
+def get_session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = ArtemisSession()
+        return _session
+
+def session_stats():
+    """ Connection-reuse counters for the shared pool (requests / connections / reused) """
+    return get_session().stats()
+
+def close_session():
+    """ Closes all pooled sockets. Called automatically at interpreter exit. """
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+atexit.register(close_session)
+
+
+# ------------------------------------------------------------
+# RESPONSE CACHE (read-only reference lists; see response_cache.TTL)
+# ------------------------------------------------------------
+response_cache = ResponseCache()
+
+def invalidate_cache(*api_paths):
+    """ Drops cached responses of the given endpoints (all endpoints when called without arguments) """
+    return response_cache.invalidate(*api_paths)
+
+def cache_stats():
+    return response_cache.stats()
+
+
+# ------------------------------------------------------------
+# REQUEST COALESCING (identical reads in flight share one request)
+# ------------------------------------------------------------
+in_flight = SingleFlight()
+
+def coalescing_stats():
+    return in_flight.stats()
+
+
+def breaker_state():
+    """ Artemis host health as seen by the circuit breaker: {"state", "failures", "retry_in"} """
+    return breaker.snapshot()
+
+
+# ------------------------------------------------------------
+# METRICS (per-endpoint counters; see metrics.py)
+# ------------------------------------------------------------
+def _observe(api_path, started, body, response=None, code=None, error=None):
+    metrics.record(
+        api_path,
+        (time.perf_counter() - started) * 1000,
+        status=response.status_code if response is not None else None,
+        code=code,
+        bytes_out=len(body.encode("utf-8")),
+        bytes_in=len(response.content) if response is not None else 0,
+        error=type(error).__name__ if error is not None else None,
     )
 
-    hmac_sha256 = hmac.new(APP_SECRET.encode('utf-8'), string_to_sign.encode('utf-8'), hashlib.sha256)
-    signature = base64.b64encode(hmac_sha256.digest()).decode('utf-8')
 
-    headers = {
-        "Accept": accept,
-        "Content-MD5": content_md5,
-        "Content-Type": content_type,
-        "X-Ca-Key": APP_KEY,
-        "X-Ca-Signature-Headers": signature_headers,
-        "X-Ca-Signature": signature
-    }
-    return headers
+# ------------------------------------------------------------
+# SIGNATURE CREATION
+# ------------------------------------------------------------
+signer = Signer(APP_KEY, APP_SECRET)
+
+def create_signature(method, body, api_path):
+    """Creates the necessary HMAC-SHA256 signature and headers for the API request."""
+    return signer.headers(method, body, api_path)
 
 
 # ------------------------------------------------------------
@@ -80,16 +146,26 @@ def send_to_api(data_payload, api_path, clear_callback):
         headers = create_signature("POST", body, api_path)
         URL = f"{BASE_URL}{api_path}"
 
-        response = requests.post(URL, headers=headers, data=body, verify=False, timeout=10)
+        started = time.perf_counter()
+        try:
+            response = breaker.call(_post_checked, URL, headers=headers, data=body,
+                                    timeout=(CONNECT_TIMEOUT, 10))
+        except ArtemisHTTPError as e:
+            response = e.response   # 5xx: counted as a host failure, then reported below like any non-200
+        except Exception as e:
+            _observe(api_path, started, body, error=e)
+            raise
 
         if response.status_code == 200:
             try:
                 res = response.json()
-            except json.JSONDecodeError:
+            except json.JSONDecodeError as e:
+                _observe(api_path, started, body, response, error=e)
                 messagebox.showerror("Response Error", f"Failed to parse JSON response.\n\nText: {response.text}")
                 return
 
             api_code = res.get("code")
+            _observe(api_path, started, body, response, code=api_code)
             api_msg = res.get("msg", "Unknown error")
             api_data = res.get("data", "")
 
@@ -120,54 +196,168 @@ def send_to_api(data_payload, api_path, clear_callback):
                 messagebox.showerror("API Error", f"Code: {api_code}\nMsg: {api_msg}\nDetail: {api_data}")
 
         else:
+            _observe(api_path, started, body, response, code=str(response.status_code))
             messagebox.showerror("HTTP Error", f"Status = {response.status_code}\nResponse: {response.text}")
 
     except requests.exceptions.ConnectionError:
         messagebox.showerror("Connection Error", f"Could not connect to API host: {HOST}")
+    except CircuitOpenError as e:
+        messagebox.showerror("Connection Error", f"{e}\n\nThe visitor was not registered. Please try again shortly.")
     except Exception as e:
         messagebox.showerror("Unhandled Error", str(e))
 
+def _post_checked(url, **kwargs):
+    """ POST for breaker.call(): a 5xx raises ArtemisHTTPError (carrying .response) so it counts as a host failure """
+    response = get_session().post(url, **kwargs)
+    if response.status_code >= 500:
+        error = ArtemisHTTPError(response.status_code, response.text, response.headers)
+        error.response = response
+        raise error
+    return response
+
 def get_visitor_list(page_no=1, page_size=16,
                      appoint_start=None, appoint_end=None):
+    api_path = "/artemis/api/visitor/v1/appointment/appointmentlist"
+
+    body_dict = {
+        "pageNo": page_no,
+        "pageSize": page_size
+    }
+
+    if appoint_start and appoint_end:
+        body_dict["appointStartTime"] = appoint_start
+        body_dict["appointEndTime"] = appoint_end
+
+    # Through request_json so concurrent identical queries (dashboard + list) share one request
     try:
-        api_path = "/artemis/api/visitor/v1/appointment/appointmentlist"
+        data = request_json(api_path, body_dict)
+    except Exception as e:
+        print("API ERROR:", e)
+        return []
 
-        body_dict = {
-            "pageNo": page_no,
-            "pageSize": page_size
-        }
+    if isinstance(data, dict) and str(data.get("code")) == "0":
+        return data.get("data", {}).get("list", [])
+    return []
 
-        if appoint_start and appoint_end:
-            body_dict["appointStartTime"] = appoint_start
-            body_dict["appointEndTime"] = appoint_end
+# ------------------------------------------------------------
+# ERRORS (raised by request_json, shown by report_api_error)
+# ------------------------------------------------------------
+class ArtemisHTTPError(Exception):
+    """ Non-200 HTTP status from the Artemis host """
+    def __init__(self, status_code, text, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+class ArtemisResponseError(Exception):
+    """ 200 response whose body is not valid JSON """
+    def __init__(self, text):
+        super().__init__("Invalid JSON response")
+        self.text = text
+
+class ArtemisAPIError(Exception):
+    """ Valid response carrying a non-"0" Artemis result code """
+    def __init__(self, code, msg):
+        super().__init__(f"Code {code}: {msg}")
+        self.code = code
+        self.msg = msg
 
-        body = json.dumps(body_dict)
 
-        headers = create_signature("POST", body, api_path)
+# ------------------------------------------------------------
+# RAW REQUEST (no UI; safe to call from worker threads)
+# ------------------------------------------------------------
+def request_json(api_path, payload_dict=None, method="POST", timeout=10, use_cache=True,
+                 idempotency_key=None, retry_policy=None):
+    """
+    Signs and sends one request and returns the parsed JSON body.
+    Raises ArtemisHTTPError / ArtemisResponseError / requests exceptions instead of showing dialogs.
+    Successful responses of cacheable endpoints are reused until their TTL expires (use_cache=False skips
+    the lookup but still refreshes the entry); writes invalidate the related cached lists.
+    Transient failures are retried per retry.classify(api_path); an add/create endpoint is only retried
+    after a failed connect, or on any transient error when the caller passes an idempotency_key.
+    While the circuit breaker is open nothing is sent: cacheable reads return the last good response
+    (even if expired) and everything else raises CircuitOpenError immediately.
+    Concurrent identical reads (same method, path and payload) share one request and its parsed result.
+    """
+    if use_cache:
+        cached = response_cache.get(api_path, payload_dict)
+        if cached is not None:
+            metrics.record_cache_hit(api_path)
+            return cached
 
-        url = f"{BASE_URL}{api_path}"
+    fetch = lambda: _fetch(api_path, payload_dict, method, timeout, use_cache, idempotency_key, retry_policy)
+    if retry.classify(api_path) == retry.READ and not idempotency_key:
+        return in_flight.do((method, cache_key(api_path, payload_dict)), fetch)
+    return fetch()
 
-        response = requests.post(
-            url,
-            headers=headers,
-            data=body,
-            verify=False,
-            timeout=10
-        )
+def _fetch(api_path, payload_dict, method, timeout, use_cache, idempotency_key, retry_policy):
+    body = json.dumps(payload_dict or {})
+    headers = create_signature(method, body, api_path)
+    if idempotency_key:
+        headers[retry.IDEMPOTENCY_HEADER] = str(idempotency_key)
 
-        if response.status_code == 200:
-            data = response.json()
+    policy = retry_policy or retry.default_policy
 
-            if data.get("code") == "0":
-                return data.get("data", {}).get("list", [])
-            else:
-                return []
+    def attempt(attempt_timeout):
+        breaker.raise_if_open()   # another call opened the circuit meanwhile: no further retries
+        return _send_once(api_path, payload_dict, method, body, headers, attempt_timeout)
 
-        return []
+    try:
+        # One breaker outcome per logical call: only a call whose retries all failed counts as a failure
+        return breaker.call(policy.run, api_path, attempt, timeout, idempotency_key=idempotency_key)
     except Exception as e:
-        print("API ERROR:", e)
-        return []
-    
+        if use_cache and (isinstance(e, CircuitOpenError) or is_host_failure(e)):
+            stale = response_cache.get_stale(api_path, payload_dict)
+            if stale is not None:
+                print(f"📦 Host unavailable, serving last cached response for {api_path}")
+                metrics.record_cache_hit(api_path)
+                return stale
+        raise
+
+def _send_once(api_path, payload_dict, method, body, headers, timeout):
+    URL = f"{BASE_URL}{api_path}"
+
+    print(f"📡 Calling API: {URL}")  # Debug log
+    started = time.perf_counter()
+    try:
+        response = get_session().request(method, URL, headers=headers, data=body,
+                                         timeout=(min(CONNECT_TIMEOUT, timeout), timeout))
+    except Exception as e:
+        _observe(api_path, started, body, error=e)
+        raise
+    response_cache.note_write(api_path)
+
+    if response.status_code != 200:
+        _observe(api_path, started, body, response, code=str(response.status_code))
+        raise ArtemisHTTPError(response.status_code, response.text, response.headers)
+    try:
+        res = response.json()
+    except ValueError as e:
+        _observe(api_path, started, body, response, error=e)
+        raise ArtemisResponseError(response.text)
+    _observe(api_path, started, body, response, code=res.get("code") if isinstance(res, dict) else None)
+
+    if isinstance(res, dict) and str(res.get("code")) == "0":
+        response_cache.put(api_path, payload_dict, res)
+    return res
+
+def report_api_error(exc):
+    """ Shows the standard error dialog for an exception raised by request_json (main thread only) """
+    if isinstance(exc, ArtemisResponseError):
+        messagebox.showerror("Response Error", f"Invalid JSON Response:\n\n{exc.text}")
+    elif isinstance(exc, ArtemisAPIError):
+        messagebox.showerror("API Error", f"Code: {exc.code}\nMsg: {exc.msg}")
+    elif isinstance(exc, ArtemisHTTPError):
+        messagebox.showerror("HTTP Error", f"Status = {exc.status_code}\nResponse: {exc.text}")
+    elif isinstance(exc, requests.exceptions.ConnectionError):
+        messagebox.showerror("Connection Error", f"Cannot connect to API host: {HOST}")
+    elif isinstance(exc, CircuitOpenError):
+        messagebox.showerror("Connection Error", f"{exc}\n\nCached data is shown where available.")
+    else:
+        messagebox.showerror("API Error", str(exc))
+
+
 # ------------------------------------------------------------
 # UNIVERSAL CALL FUNCTION (used by visitor_list_single)
 # ------------------------------------------------------------
@@ -177,27 +367,7 @@ def call_api(api_path, payload_dict=None, method="POST", timeout=10):
     Used in visitor_list_single.py
     """
     try:
-        body = json.dumps(payload_dict or {})
-        headers = create_signature(method, body, api_path)
-        URL = f"{BASE_URL}{api_path}"
-
-        print(f"📡 Calling API: {URL}")  # Debug log
-        response = requests.request(method, URL, headers=headers, data=body, verify=False, timeout=timeout)
-
-        if response.status_code == 200:
-            try:
-                return response.json()
-            except json.JSONDecodeError:
-                messagebox.showerror("Response Error", f"Invalid JSON Response:\n\n{response.text}")
-                return None
-        else:
-            messagebox.showerror("HTTP Error", f"Status = {response.status_code}\nResponse: {response.text}")
-            return None
-
-    except requests.exceptions.ConnectionError:
-        messagebox.showerror("Connection Error", f"Cannot connect to API host: {HOST}")
+        return request_json(api_path, payload_dict, method=method, timeout=timeout)
     except Exception as e:
-        messagebox.showerror("API Error", str(e))
+        report_api_error(e)
         return None
-    
-    
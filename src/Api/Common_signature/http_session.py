@@ -0,0 +1,128 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# http_session.py
+
+# --- Pool Defaults ---
+DEFAULT_POOL_CONNECTIONS = 4    # Number of distinct hosts kept in the pool manager
+DEFAULT_POOL_MAXSIZE = 10       # Max open keep-alive sockets per host
+DEFAULT_POOL_BLOCK = False      # True -> wait for a free socket instead of opening an extra one
+DEFAULT_KEEP_ALIVE = True
+
+
+# ------------------------------------------------------------
+# POOLED SESSION (one TCP/TLS handshake per socket, not per call)
+# ------------------------------------------------------------
+class ArtemisSession:
+    """
+    Owns a pooled, keep-alive requests.Session for the Artemis host.
+    All API entry points share one instance so sockets are reused between calls.
+    """
+
+    def __init__(self, pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                 pool_block=DEFAULT_POOL_BLOCK, keep_alive=DEFAULT_KEEP_ALIVE, verify=False):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.verify = verify
+
+        self._lock = threading.Lock()
+        self._session = None
+        self._adapter = None
+        self._closed = False
+
+        # Counters carried over from sessions that were already closed
+        self._retired_requests = 0
+        self._retired_connections = 0
+
+    # ---------------- internal ----------------
+    def _build(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.verify = self.verify
+        session.headers["Connection"] = "keep-alive" if self.keep_alive else "close"
+        return session, adapter
+
+    def _get(self):
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("ArtemisSession is closed")
+            if self._session is None:
+                self._session, self._adapter = self._build()
+            return self._session
+
+    def _pool_totals(self):
+        """ Sums request/connection counters across every host pool held by the adapter """
+        requests_sent = 0
+        connections_opened = 0
+        if self._adapter is not None:
+            pools = self._adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None: continue
+                requests_sent += getattr(pool, "num_requests", 0)
+                connections_opened += getattr(pool, "num_connections", 0)
+        return requests_sent, connections_opened
+
+    # ---------------- public ----------------
+    def request(self, method, url, **kwargs):
+        """ Same call shape as requests.request(), but routed through the shared pool """
+        kwargs.setdefault("verify", self.verify)
+        return self._get().request(method, url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def stats(self):
+        """
+        Connection-reuse counters.
+        'reused' = requests that went out on an already-open socket (no new handshake).
+        """
+        with self._lock:
+            live_requests, live_connections = self._pool_totals()
+            total_requests = self._retired_requests + live_requests
+            total_connections = self._retired_connections + live_connections
+        return {
+            "requests": total_requests,
+            "connections": total_connections,
+            "reused": max(total_requests - total_connections, 0),
+            "pool_maxsize": self.pool_maxsize,
+            "closed": self._closed,
+        }
+
+    def reset(self):
+        """ Drops all pooled sockets (e.g. after the host IP changes) but keeps the object usable """
+        with self._lock:
+            self._retire()
+
+    def close(self):
+        """ Closes every pooled socket; further requests raise RuntimeError """
+        with self._lock:
+            self._retire()
+            self._closed = True
+
+    def _retire(self):
+        if self._session is None: return
+        live_requests, live_connections = self._pool_totals()
+        self._retired_requests += live_requests
+        self._retired_connections += live_connections
+        try:
+            self._session.close()
+        finally:
+            self._session = None
+            self._adapter = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,71 @@
+import builtins
+import importlib.util
+import os
+import sys
+import threading
+import time
+
+# import_profile.py
+
+ENV_FLAG = "VMS_IMPORT_PROFILE"   # "1" -> Ui.py reports how long each screen took to import
+
+
+def enabled():
+    return os.environ.get(ENV_FLAG) == "1"
+
+
+# ------------------------------------------------------------
+# IMPORT TIMER (-X importtime style, for one import at a time)
+# ------------------------------------------------------------
+class ImportTimer:
+    """
+    Times every module imported for the first time inside the 'with' block by wrapping __import__.
+    rows holds (self_us, cumulative_us, depth, name) in completion order, like 'python -X importtime'.
+    Modules that were already loaded cost nothing and are not listed; submodules pulled in through
+    'from package import module' are counted in the importing module's self time.
+    """
+
+    def __init__(self):
+        self.rows = []
+        self.total_ms = 0.0
+        self._stack = []
+        self._original = None
+
+    def __enter__(self):
+        self._original = builtins.__import__
+        self._thread_id = threading.get_ident()   # imports on other threads are passed through untimed
+        builtins.__import__ = self._timed_import
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        builtins.__import__ = self._original
+        self.total_ms = (time.perf_counter() - self._started) * 1000
+        return False
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        full_name = name
+        if level:
+            try:
+                full_name = importlib.util.resolve_name("." * level + name, (globals or {}).get("__package__"))
+            except (ImportError, ValueError):
+                pass
+        if not name or full_name in sys.modules or threading.get_ident() != self._thread_id:
+            return self._original(name, globals, locals, fromlist, level)
+
+        self._stack.append(0.0)   # time spent in nested first-time imports
+        started = time.perf_counter()
+        try:
+            return self._original(name, globals, locals, fromlist, level)
+        finally:
+            cumulative = (time.perf_counter() - started) * 1e6
+            nested = self._stack.pop()
+            if self._stack: self._stack[-1] += cumulative
+            self.rows.append((cumulative - nested, cumulative, len(self._stack), full_name))
+
+    def report(self, label, top=8):
+        """ Summary line plus the slowest modules by self time """
+        lines = [f"⏱ import {label}: {self.total_ms:.1f} ms ({len(self.rows)} new modules)"]
+        for self_us, cumulative_us, depth, name in sorted(self.rows, reverse=True)[:top]:
+            lines.append(f"    self {self_us / 1000:8.1f} ms | cumulative {cumulative_us / 1000:8.1f} ms | {name}")
+        return "\n".join(lines)
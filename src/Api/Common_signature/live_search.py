@@ -0,0 +1,65 @@
+# live_search.py
+
+DEBOUNCE_MS = 350   # Quiet time after the last keystroke before the search runs
+
+
+# ------------------------------------------------------------
+# DEBOUNCED SEARCH-AS-YOU-TYPE
+# ------------------------------------------------------------
+class LiveSearch:
+    """
+    Runs on_search() once the given StringVars have stopped changing for delay_ms.
+    Every keystroke re-arms the timer, so fast typing produces a single search; a search is skipped
+    when the (stripped) values are the same as for the previous one.
+    flush() runs the search immediately (Enter key / Search button) and drops any pending timer.
+    Stale responses are the screen's business: each screen already tags its requests (load_seq) and
+    ignores results for anything but the latest one.
+    Traces are removed when 'widget' is destroyed, so rebuilding a screen does not leak callbacks.
+    """
+
+    def __init__(self, widget, variables, on_search, delay_ms=DEBOUNCE_MS):
+        self.widget = widget
+        self.variables = list(variables)
+        self.on_search = on_search
+        self.delay_ms = delay_ms
+        self._after_id = None
+        self._last = self._values()
+        self._traces = [(var, var.trace_add("write", self._changed)) for var in self.variables]
+        widget.bind("<Destroy>", self._on_destroy, add="+")
+
+    def _values(self):
+        return tuple(var.get().strip() for var in self.variables)
+
+    def _changed(self, *_):
+        self.cancel()
+        self._after_id = self.widget.after(self.delay_ms, self._fire)
+
+    def _fire(self):
+        self._after_id = None
+        values = self._values()
+        if values == self._last: return
+        self._last = values
+        self.on_search()
+
+    def flush(self):
+        self.cancel()
+        self._last = self._values()
+        self.on_search()
+
+    def cancel(self):
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def _on_destroy(self, event):
+        if event.widget is not self.widget: return
+        self.cancel()
+        for var, trace_id in self._traces:
+            try:
+                var.trace_remove("write", trace_id)
+            except Exception:
+                pass
+        self._traces = []
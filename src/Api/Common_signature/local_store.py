@@ -0,0 +1,314 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+# local_store.py
+
+# --- Database Location (project root, next to main.py) ---
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../../"))
+DEFAULT_DB_PATH = os.environ.get("VMS_CACHE_DB", os.path.join(PROJECT_ROOT, "vms_cache.sqlite3"))  # or configure(path)
+
+
+# ------------------------------------------------------------
+# ENTITY DEFINITIONS
+#   api     : list endpoint the table mirrors
+#   key     : candidate fields for the primary key (first non-empty wins)
+#   columns : indexed lookup columns -> dotted path inside the record
+#   payload : extra list filters sent on a full refresh (optional)
+# ------------------------------------------------------------
+ENTITIES = {
+    "persons": {
+        "api": "/artemis/api/resource/v1/person/personList",
+        "key": ("personId", "personCode"),
+        "columns": {"personCode": "personCode", "personName": "personName", "phoneNo": "phoneNo"},
+    },
+    "vehicles": {
+        "api": "/artemis/api/resource/v1/vehicle/vehicleList",
+        "key": ("vehicleId", "plateNo"),
+        "columns": {"plateNo": "plateNo", "personName": "personName", "vehicleGroupIndexCode": "vehicleGroupIndexCode"},
+    },
+    "vehicle_groups": {
+        "api": "/artemis/api/resource/v1/vehicleGroup/vehicleGroupList",
+        "key": ("vehicleGroupIndexCode",),
+        "columns": {"vehicleGroupName": "vehicleGroupName"},
+    },
+    "appointments": {
+        "api": "/artemis/api/visitor/v1/appointment/appointmentlist",
+        "key": ("appointID", "appointRecordId"),
+        "columns": {"appointID": "appointID", "visitorId": "visitorInfo.visitorId",
+                    "visitorName": "visitorInfo.visitorName", "appointStartTime": "appointStartTime"},
+    },
+    "doors": {
+        "api": "/artemis/api/resource/v1/acsDoor/acsDoorList",
+        "key": ("doorIndexCode",),
+        "columns": {"doorName": "doorName", "acsDevIndexCode": "acsDevIndexCode"},
+    },
+    "regions": {
+        "api": "/artemis/api/resource/v1/regions",
+        "key": ("indexCode",),
+        "columns": {"name": "name", "parentIndexCode": "parentIndexCode"},
+        "payload": {"treeCode": "0"},
+    },
+    "visit_records": {
+        "api": "/artemis/api/visitor/v1/register/getVistorRegisterRecord",
+        "key": ("recordId",),
+        "columns": {"visitorStatus": "visitorStatus", "fullName": "visitorBaseInfo.fullName",
+                    "visitStartTime": "visitorBaseInfo.visitStartTime"},
+    },
+}
+
+
+def _dig(record, path):
+    value = record
+    for part in path.split("."):
+        if not isinstance(value, dict): return None
+        value = value.get(part)
+    return None if value is None else str(value)
+
+
+def record_key(entity, record):
+    for field in ENTITIES[entity]["key"]:
+        value = record.get(field)
+        if value not in (None, ""):
+            return str(value)
+    return None
+
+
+# ------------------------------------------------------------
+# SQLITE MIRROR
+# ------------------------------------------------------------
+class LocalStore:
+    """
+    SQLite mirror of the Artemis list endpoints.
+    Each table stores the raw record as JSON plus a few indexed columns for lookups and filtering.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or DEFAULT_DB_PATH
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._listeners = []
+        self._create_schema()
+
+    def _create_schema(self):
+        with self._lock, self._conn:
+            for entity, spec in ENTITIES.items():
+                cols = "".join(f", {c} TEXT" for c in spec["columns"])
+                self._conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {entity} (key TEXT PRIMARY KEY{cols}, data TEXT NOT NULL, synced_at REAL)"
+                )
+                for c in spec["columns"]:
+                    self._conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{entity}_{c} ON {entity}({c})")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state (entity TEXT PRIMARY KEY, synced_at REAL, mark TEXT)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS page_checksums (entity TEXT, page_no INTEGER, checksum TEXT, "
+                "PRIMARY KEY (entity, page_no))"
+            )
+
+    # ---------------- writes ----------------
+    def add_listener(self, fn):
+        """
+        fn(entity, records, removed_keys, replaced) after every committed write, on the writer's thread
+        (outside the store lock). replaced=True means 'records' is now the entity's complete content.
+        """
+        self._listeners.append(fn)
+
+    def _notify(self, entity, records=(), removed=(), replaced=False):
+        for fn in list(self._listeners):
+            try:
+                fn(entity, records, removed, replaced)
+            except Exception as e:
+                print(f"⚠️ Local store listener error: {e}")
+
+    def _prepare(self, entity, records):
+        spec = ENTITIES[entity]
+        cols = list(spec["columns"])
+        now = time.time()
+        rows = []
+        for r in records:
+            key = record_key(entity, r)
+            if key is None: continue
+            rows.append([key] + [_dig(r, spec["columns"][c]) for c in cols] + [json.dumps(r), now])
+
+        names = ", ".join(["key"] + cols + ["data", "synced_at"])
+        marks = ", ".join("?" * (len(cols) + 3))
+        return f"INSERT OR REPLACE INTO {entity} ({names}) VALUES ({marks})", rows
+
+    def upsert(self, entity, records):
+        """ Inserts or replaces records; returns how many had a usable key """
+        sql, rows = self._prepare(entity, records)
+        if not rows: return 0
+        with self._lock, self._conn:
+            self._conn.executemany(sql, rows)
+        self._notify(entity, records=records)
+        return len(rows)
+
+    def replace_all(self, entity, records, mark=None):
+        """ Full refresh in one transaction: the table afterwards holds exactly 'records' """
+        sql, rows = self._prepare(entity, records)
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {entity}")
+            self._conn.executemany(sql, rows)
+            self._conn.execute("INSERT OR REPLACE INTO sync_state (entity, synced_at, mark) VALUES (?, ?, ?)",
+                               (entity, time.time(), mark))
+        self._notify(entity, records=records, replaced=True)
+        return len(rows)
+
+    def delete(self, entity, **where):
+        """ e.g. store.delete("persons", personCode="DK008") """
+        clause, params = self._where(entity, where)
+        with self._lock, self._conn:
+            keys = [row["key"] for row in self._conn.execute(f"SELECT key FROM {entity}{clause}", params)]
+            count = self._conn.execute(f"DELETE FROM {entity}{clause}", params).rowcount
+        self._notify(entity, removed=keys)
+        return count
+
+    def delete_keys(self, entity, keys):
+        keys = [(str(k),) for k in keys]
+        if not keys: return 0
+        with self._lock, self._conn:
+            count = self._conn.executemany(f"DELETE FROM {entity} WHERE key = ?", keys).rowcount
+        self._notify(entity, removed=[k for (k,) in keys])
+        return count
+
+    def save_page_checksums(self, entity, checksums):
+        """ Replaces the stored {page_no: checksum} map of an entity """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM page_checksums WHERE entity = ?", (entity,))
+            self._conn.executemany("INSERT INTO page_checksums (entity, page_no, checksum) VALUES (?, ?, ?)",
+                                   [(entity, int(p), c) for p, c in checksums.items()])
+
+    def mark_synced(self, entity, mark=None):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO sync_state (entity, synced_at, mark) VALUES (?, ?, ?)",
+                               (entity, time.time(), mark))
+
+    # ---------------- reads ----------------
+    def _where(self, entity, where=None, like=None, between=None):
+        valid = set(ENTITIES[entity]["columns"]) | {"key"}
+        parts, params = [], []
+        for col, (low, high) in (between or {}).items():
+            if col not in valid: raise ValueError(f"{entity} has no indexed column '{col}'")
+            parts.append(f"{col} BETWEEN ? AND ?")
+            params += [str(low), str(high)]
+        for col, value in (where or {}).items():
+            if col not in valid: raise ValueError(f"{entity} has no indexed column '{col}'")
+            parts.append(f"{col} = ?")
+            params.append(str(value))
+        for col, value in (like or {}).items():
+            if col not in valid: raise ValueError(f"{entity} has no indexed column '{col}'")
+            parts.append(f"{col} LIKE ? ESCAPE '\\'")
+            escaped = str(value).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            params.append(f"%{escaped}%")
+        clause = (" WHERE " + " AND ".join(parts)) if parts else ""
+        return clause, params
+
+    def query(self, entity, where=None, like=None, limit=None, offset=0, order_by="rowid", between=None):
+        """
+        Returns parsed records; 'where' = exact matches, 'like' = substring matches,
+        'between' = {column: (low, high)} inclusive ranges, all on indexed columns
+        """
+        clause, params = self._where(entity, where, like, between)
+        sql = f"SELECT data FROM {entity}{clause} ORDER BY {order_by}"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [int(limit), int(offset)]
+        with self._lock:
+            return [json.loads(row["data"]) for row in self._conn.execute(sql, params)]
+
+    def count(self, entity, where=None, like=None, between=None):
+        clause, params = self._where(entity, where, like, between)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {entity}{clause}", params).fetchone()[0]
+
+    def get(self, entity, key):
+        with self._lock:
+            row = self._conn.execute(f"SELECT data FROM {entity} WHERE key = ?", (str(key),)).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def keys(self, entity):
+        with self._lock:
+            return {row["key"] for row in self._conn.execute(f"SELECT key FROM {entity}")}
+
+    def column_values(self, entity, column):
+        """ {key: value} of one indexed column, e.g. start times for window reconciliation """
+        if column not in ENTITIES[entity]["columns"]: raise ValueError(f"{entity} has no indexed column '{column}'")
+        with self._lock:
+            return {row["key"]: row[column] for row in self._conn.execute(f"SELECT key, {column} FROM {entity}")}
+
+    def page_checksums(self, entity):
+        with self._lock:
+            rows = self._conn.execute("SELECT page_no, checksum FROM page_checksums WHERE entity = ?", (entity,))
+            return {row["page_no"]: row["checksum"] for row in rows}
+
+    def last_synced(self, entity):
+        with self._lock:
+            row = self._conn.execute("SELECT synced_at, mark FROM sync_state WHERE entity = ?", (entity,)).fetchone()
+        return (row["synced_at"], row["mark"]) if row else (None, None)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# ------------------------------------------------------------
+# SHARED INSTANCE + HELPERS USED BY SCREENS
+# ------------------------------------------------------------
+_store = None
+_store_lock = threading.Lock()
+
+def get_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = LocalStore()
+        return _store
+
+def configure(path):
+    """ Points the shared store (and new LocalStore()s) at another database file, e.g. a temp file for tools/benchmark.py """
+    global _store, DEFAULT_DB_PATH
+    with _store_lock:
+        DEFAULT_DB_PATH = path
+        if _store is not None and _store.path != path:
+            _store.close()
+            _store = None
+
+def remember(entity, records):
+    """ Best-effort write-through from a screen's API response; never breaks the screen """
+    try:
+        return get_store().upsert(entity, records or [])
+    except Exception as e:
+        print(f"⚠️ Local store write failed ({entity}): {e}")
+        return 0
+
+def forget(entity, **where):
+    try:
+        return get_store().delete(entity, **where)
+    except Exception as e:
+        print(f"⚠️ Local store delete failed ({entity}): {e}")
+        return 0
+
+def cached_page(entity, page, page_size, where=None, like=None):
+    """ (rows, total) for one page straight from SQLite; ([], 0) if the store is unavailable """
+    try:
+        store = get_store()
+        rows = store.query(entity, where=where, like=like, limit=page_size, offset=(page - 1) * page_size)
+        return rows, store.count(entity, where=where, like=like)
+    except Exception as e:
+        print(f"⚠️ Local store read failed ({entity}): {e}")
+        return [], 0
+
+def refresh_entity(entity, fetch_all=None):
+    """ Pulls the whole endpoint (all pages) and replaces the table; returns the record count """
+    if fetch_all is None:
+        from .pagination import fetch_all
+    spec = ENTITIES[entity]
+    records = fetch_all(spec["api"], spec.get("payload"))
+    return get_store().replace_all(entity, records)
@@ -0,0 +1,178 @@
+import threading
+import time
+from collections import Counter
+
+# metrics.py
+
+# Latency histogram upper bounds in milliseconds (last bucket is +Inf)
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+# ------------------------------------------------------------
+# PER-ENDPOINT COUNTERS
+# ------------------------------------------------------------
+class EndpointMetrics:
+    """ Counters for one Artemis path; only touched while the registry lock is held """
+
+    def __init__(self):
+        self.calls = 0
+        self.cache_hits = 0
+        self.errors = Counter()        # Artemis result code (or exception name) -> count
+        self.http_status = Counter()   # HTTP status -> count
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.latency_sum_ms = 0.0
+        self.latency_max_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def observe(self, elapsed_ms):
+        self.latency_sum_ms += elapsed_ms
+        self.latency_max_ms = max(self.latency_max_ms, elapsed_ms)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def quantile_ms(self, q):
+        """ Upper bound of the bucket holding the q-quantile (None without samples) """
+        total = sum(self.buckets)
+        if not total: return None
+        rank = q * total
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return LATENCY_BUCKETS_MS[i] if i < len(LATENCY_BUCKETS_MS) else float("inf")
+        return float("inf")
+
+    def as_dict(self):
+        timed = sum(self.buckets)
+        return {
+            "calls": self.calls,
+            "cache_hits": self.cache_hits,
+            "errors": dict(self.errors),
+            "error_count": sum(self.errors.values()),
+            "http_status": dict(self.http_status),
+            "bytes_out": self.bytes_out,
+            "bytes_in": self.bytes_in,
+            "avg_ms": round(self.latency_sum_ms / timed, 2) if timed else None,
+            "max_ms": round(self.latency_max_ms, 2),
+            "p50_ms": self.quantile_ms(0.50),
+            "p95_ms": self.quantile_ms(0.95),
+            "p99_ms": self.quantile_ms(0.99),
+            "buckets": list(self.buckets),
+        }
+
+
+# ------------------------------------------------------------
+# REGISTRY
+# ------------------------------------------------------------
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+        self.started_at = time.time()
+
+    def _get(self, api_path):
+        m = self._endpoints.get(api_path)
+        if m is None:
+            m = self._endpoints[api_path] = EndpointMetrics()
+        return m
+
+    def record(self, api_path, elapsed_ms, status=None, code=None, bytes_out=0, bytes_in=0, error=None):
+        """
+        One request that went to the host.
+        code  : Artemis result code; anything but "0" counts as an error
+        error : exception name when no usable response came back (timeout, connection refused, ...)
+        """
+        with self._lock:
+            m = self._get(api_path)
+            m.calls += 1
+            m.bytes_out += bytes_out
+            m.bytes_in += bytes_in
+            m.observe(elapsed_ms)
+            if status is not None: m.http_status[str(status)] += 1
+            if error: m.errors[error] += 1
+            elif code is not None and str(code) != "0": m.errors[str(code)] += 1
+
+    def record_cache_hit(self, api_path):
+        with self._lock:
+            self._get(api_path).cache_hits += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {path: m.as_dict() for path, m in sorted(self._endpoints.items())}
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+            self.started_at = time.time()
+
+    # ---------------- Prometheus text format ----------------
+    def to_prometheus(self):
+        lines = []
+
+        def family(name, kind, help_text):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        snap = self.snapshot()
+
+        family("artemis_requests_total", "counter", "Requests sent to the Artemis host")
+        for path, m in snap.items():
+            lines.append(f'artemis_requests_total{{endpoint="{_esc(path)}"}} {m["calls"]}')
+
+        family("artemis_cache_hits_total", "counter", "Requests answered from the response cache")
+        for path, m in snap.items():
+            lines.append(f'artemis_cache_hits_total{{endpoint="{_esc(path)}"}} {m["cache_hits"]}')
+
+        family("artemis_errors_total", "counter", "Failed requests by Artemis code or exception")
+        for path, m in snap.items():
+            for code, n in sorted(m["errors"].items()):
+                lines.append(f'artemis_errors_total{{endpoint="{_esc(path)}",code="{_esc(code)}"}} {n}')
+
+        family("artemis_http_responses_total", "counter", "Responses by HTTP status")
+        for path, m in snap.items():
+            for status, n in sorted(m["http_status"].items()):
+                lines.append(f'artemis_http_responses_total{{endpoint="{_esc(path)}",status="{status}"}} {n}')
+
+        family("artemis_request_bytes_total", "counter", "Request body bytes sent")
+        for path, m in snap.items():
+            lines.append(f'artemis_request_bytes_total{{endpoint="{_esc(path)}"}} {m["bytes_out"]}')
+
+        family("artemis_response_bytes_total", "counter", "Response body bytes received")
+        for path, m in snap.items():
+            lines.append(f'artemis_response_bytes_total{{endpoint="{_esc(path)}"}} {m["bytes_in"]}')
+
+        family("artemis_request_duration_seconds", "histogram", "Request latency")
+        with self._lock:
+            sums = {path: m.latency_sum_ms for path, m in self._endpoints.items()}
+        for path, m in snap.items():
+            label = f'endpoint="{_esc(path)}"'
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS_MS, m["buckets"]):
+                cumulative += count
+                lines.append(f'artemis_request_duration_seconds_bucket{{{label},le="{bound / 1000:g}"}} {cumulative}')
+            cumulative += m["buckets"][-1]
+            lines.append(f'artemis_request_duration_seconds_bucket{{{label},le="+Inf"}} {cumulative}')
+            lines.append(f'artemis_request_duration_seconds_sum{{{label}}} {sums.get(path, 0) / 1000:.6f}')
+            lines.append(f'artemis_request_duration_seconds_count{{{label}}} {cumulative}')
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        """ Writes the text exposition format, e.g. for node_exporter's textfile collector """
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        return path
+
+
+def _esc(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# ------------------------------------------------------------
+# SHARED INSTANCE
+# ------------------------------------------------------------
+registry = MetricsRegistry()
@@ -0,0 +1,77 @@
+import json
+import time
+from collections import OrderedDict
+
+from .async_client import run_async
+
+# page_cache.py
+
+DEFAULT_MAX_PAGES = 6      # Pages kept per screen (current page and its neighbours, plus a few visited)
+DEFAULT_MAX_AGE = 60       # Seconds a page may be shown without asking Artemis again
+
+
+# ------------------------------------------------------------
+# PER-SCREEN PAGE CACHE WITH NEIGHBOUR PREFETCH
+# ------------------------------------------------------------
+class PageCache:
+    """
+    Keeps the pages of one list screen, keyed by (filters, page number).
+    After page N renders, prefetch() loads N+1 and N-1 in the background so Next / Prev render at once.
+    A lookup with different filters than the previous one clears the cache (new search = new pages);
+    invalidate() clears it after an edit or delete and discards prefetches still in flight.
+    All methods run on the Tk thread (prefetch results are delivered there by run_async).
+    """
+
+    def __init__(self, max_pages=DEFAULT_MAX_PAGES, max_age=DEFAULT_MAX_AGE):
+        self.max_pages = max_pages
+        self.max_age = max_age
+        self._pages = OrderedDict()   # page -> (stored_at, value)
+        self._filters = None
+        self._pending = set()
+        self._generation = 0
+
+    def _use_filters(self, filters):
+        key = json.dumps(filters or {}, sort_keys=True)
+        if key != self._filters:
+            self.invalidate()
+            self._filters = key
+
+    def get(self, filters, page):
+        self._use_filters(filters)
+        entry = self._pages.get(page)
+        if entry is None or time.monotonic() - entry[0] > self.max_age:
+            return None
+        self._pages.move_to_end(page)
+        return entry[1]
+
+    def put(self, filters, page, value):
+        self._use_filters(filters)
+        self._pages[page] = (time.monotonic(), value)
+        self._pages.move_to_end(page)
+        while len(self._pages) > self.max_pages:
+            self._pages.popitem(last=False)
+
+    def invalidate(self):
+        self._pages.clear()
+        self._pending.clear()
+        self._generation += 1
+
+    def prefetch(self, widget, filters, page, total_pages, fetch):
+        """
+        Loads the neighbours of 'page' that are not cached yet; fetch(page_no) runs on a worker thread
+        and returns the value to cache (None = do not cache, e.g. an error code).
+        """
+        self._use_filters(filters)
+        generation = self._generation
+        for n in (page + 1, page - 1):
+            if n < 1 or n > total_pages or n in self._pending or self.get(filters, n) is not None:
+                continue
+            self._pending.add(n)
+            run_async(widget, fetch, n,
+                      on_success=lambda value, n=n: self._prefetched(generation, filters, n, value),
+                      on_error=lambda e, n=n: self._pending.discard(n))
+
+    def _prefetched(self, generation, filters, page, value):
+        if generation != self._generation: return   # invalidated meanwhile
+        self._pending.discard(page)
+        if value is not None: self.put(filters, page, value)
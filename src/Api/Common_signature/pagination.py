@@ -0,0 +1,112 @@
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+from . import common_signature_api as api
+
+# pagination.py
+
+DEFAULT_PAGE_SIZE = 100   # Artemis accepts up to 500 on most list endpoints; 100 keeps each response small
+DEFAULT_BULK_WORKERS = 4  # Parallel page requests in fetch_all(); keep <= the session's pool_maxsize
+
+
+def default_extract(data):
+    """ Standard Artemis list block: {"list": [...], "total": N} """
+    return data.get("list") or [], data.get("total")
+
+
+# ------------------------------------------------------------
+# PAGE STREAMING
+# ------------------------------------------------------------
+def fetch_page(api_path, base, page_no, page_size, page_key="pageNo", size_key="pageSize",
+               extract=default_extract, fetch=None):
+    """ One page request -> (rows, total). Raises ArtemisAPIError on a non-"0" result code. """
+    body = dict(base)
+    body[page_key] = page_no
+    body[size_key] = page_size
+
+    res = (fetch or api.request_json)(api_path, body)
+    if not res or str(res.get("code")) != "0":
+        raise api.ArtemisAPIError(res.get("code") if res else None, res.get("msg", "No response") if res else "No response")
+    return extract(res.get("data") or {})
+
+
+def iter_pages(api_path, payload=None, page_size=DEFAULT_PAGE_SIZE, start_page=1,
+               page_key="pageNo", size_key="pageSize", extract=default_extract, fetch=None):
+    """
+    Yields (page_no, rows, total) for each page of a list endpoint, requesting the next page only
+    when the caller asks for it. Stops on an empty/short page or once 'total' records were seen.
+    Raises ArtemisAPIError for a non-"0" result code (and request_json errors for transport failures).
+    """
+    fetch = fetch or api.request_json
+    base = dict(payload or {})
+    page_no = start_page
+    seen = 0
+
+    while True:
+        rows, total = fetch_page(api_path, base, page_no, page_size, page_key, size_key, extract, fetch)
+        yield page_no, rows, total
+
+        seen += len(rows)
+        if len(rows) < page_size: return
+        if total is not None and seen >= int(total): return
+        page_no += 1
+
+
+def iter_records(api_path, payload=None, page_size=DEFAULT_PAGE_SIZE, limit=None, **page_options):
+    """
+    Yields every record of a list endpoint across all pages, lazily.
+    'limit' caps the number of records yielded (None = whole dataset).
+    """
+    if limit is not None:
+        if limit <= 0: return
+        page_size = min(page_size, limit)
+    count = 0
+    for _, rows, _ in iter_pages(api_path, payload, page_size=page_size, **page_options):
+        for row in rows:
+            yield row
+            count += 1
+            if limit is not None and count >= limit: return
+
+
+# ------------------------------------------------------------
+# BULK FETCH (pages 2..N in parallel once page 1 reports 'total')
+# ------------------------------------------------------------
+def fetch_all(api_path, payload=None, page_size=DEFAULT_PAGE_SIZE, max_workers=DEFAULT_BULK_WORKERS,
+              limit=None, page_key="pageNo", size_key="pageSize", extract=default_extract, fetch=None):
+    """
+    Returns every record of a list endpoint as one list, in server order.
+    Page 1 is fetched first to learn 'total'; the remaining pages are requested concurrently
+    over a bounded thread pool. Falls back to sequential paging when the endpoint reports no total.
+    """
+    fetch = fetch or api.request_json
+    options = dict(page_key=page_key, size_key=size_key, extract=extract, fetch=fetch)
+
+    first_pages = iter_pages(api_path, payload, page_size=page_size, **options)
+    _, records, total = next(first_pages)
+    records = list(records)
+
+    if total is None:
+        # No total -> page count unknown, keep walking pages one by one
+        for _, rows, _ in first_pages:
+            records.extend(rows)
+            if limit is not None and len(records) >= limit: break
+        return records[:limit] if limit is not None else records
+    first_pages.close()
+
+    wanted = int(total) if limit is None else min(int(total), limit)
+    if len(records) < page_size or len(records) >= wanted:
+        return records[:wanted]
+
+    last_page = math.ceil(wanted / page_size)
+    base = dict(payload or {})
+
+    def get_page(page_no):
+        rows, _ = fetch_page(api_path, base, page_no, page_size, page_key, size_key, extract, fetch)
+        return rows
+
+    # executor.map keeps results in page order regardless of completion order
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="artemis-bulk") as pool:
+        for rows in pool.map(get_page, range(2, last_page + 1)):
+            records.extend(rows)
+
+    return records[:wanted]
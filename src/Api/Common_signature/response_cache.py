@@ -0,0 +1,136 @@
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+
+# response_cache.py
+
+DEFAULT_MAX_ENTRIES = 256   # LRU bound across all endpoints
+
+# --- Base Paths ---
+_RESOURCE = "/artemis/api/resource/v1"
+
+PERSON_LIST = f"{_RESOURCE}/person/personList"
+VEHICLE_LIST = f"{_RESOURCE}/vehicle/vehicleList"
+VEHICLE_GROUP_LIST = f"{_RESOURCE}/vehicleGroup/vehicleGroupList"
+REGIONS = f"{_RESOURCE}/regions"
+SUB_REGIONS = f"{_RESOURCE}/regions/subRegions"
+ACS_DEVICE_LIST = f"{_RESOURCE}/acsDevice/acsDeviceList"
+ACS_DOOR_LIST = f"{_RESOURCE}/acsDoor/acsDoorList"
+ACS_DOOR_ADVANCE_LIST = f"{_RESOURCE}/acsDoor/advance/acsDoorList"
+
+
+# ------------------------------------------------------------
+# POLICY
+#   TTL      : seconds a successful response of a read-only endpoint may be reused
+#   INVALIDATES : write endpoint -> cached list endpoints it makes stale
+# ------------------------------------------------------------
+TTL = {
+    VEHICLE_GROUP_LIST: 300,
+    REGIONS: 600,
+    SUB_REGIONS: 600,
+    ACS_DEVICE_LIST: 600,
+    ACS_DOOR_LIST: 120,
+    ACS_DOOR_ADVANCE_LIST: 120,
+    PERSON_LIST: 30,
+}
+
+INVALIDATES = {
+    f"{_RESOURCE}/person/single/add": (PERSON_LIST,),
+    f"{_RESOURCE}/person/single/update": (PERSON_LIST, VEHICLE_LIST),
+    f"{_RESOURCE}/person/single/delete": (PERSON_LIST, VEHICLE_LIST),
+    f"{_RESOURCE}/vehicle/single/add": (VEHICLE_LIST,),
+    f"{_RESOURCE}/vehicle/single/update": (VEHICLE_LIST,),
+    f"{_RESOURCE}/vehicle/single/delete": (VEHICLE_LIST, VEHICLE_GROUP_LIST),
+    f"{_RESOURCE}/vehicleGroup/single/add": (VEHICLE_GROUP_LIST,),
+    f"{_RESOURCE}/vehicleGroup/single/update": (VEHICLE_GROUP_LIST, VEHICLE_LIST),
+    f"{_RESOURCE}/vehicleGroup/single/delete": (VEHICLE_GROUP_LIST, VEHICLE_LIST),
+    f"{_RESOURCE}/org/single/add": (REGIONS, SUB_REGIONS),
+}
+
+
+def cache_key(api_path, payload_dict=None):
+    """ Endpoint path + canonical JSON of the payload (key order and spacing do not matter) """
+    return api_path + "|" + json.dumps(payload_dict or {}, sort_keys=True, separators=(",", ":"))
+
+
+# ------------------------------------------------------------
+# LRU + TTL CACHE
+# ------------------------------------------------------------
+class ResponseCache:
+    """
+    Thread-safe LRU cache of parsed Artemis responses.
+    Only endpoints listed in 'ttl' are cached; hits return a deep copy so screens can mutate rows freely.
+    Expired entries stay until they are replaced, invalidated or evicted, so get_stale() can still serve
+    them while the Artemis host is down.
+    """
+
+    def __init__(self, ttl=TTL, invalidates=INVALIDATES, max_entries=DEFAULT_MAX_ENTRIES, clock=time.monotonic):
+        self.ttl = dict(ttl)
+        self.invalidates = dict(invalidates)
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries = OrderedDict()   # key -> (api_path, expires_at, response)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def cacheable(self, api_path):
+        return self.ttl.get(api_path, 0) > 0
+
+    def get(self, api_path, payload_dict=None):
+        """ Fresh cached response or None """
+        if not self.cacheable(api_path): return None
+        key = cache_key(api_path, payload_dict)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= self._clock():
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            response = entry[2]
+        return copy.deepcopy(response)
+
+    def get_stale(self, api_path, payload_dict=None):
+        """ Last good response regardless of TTL (None if never cached); for use while the host is down """
+        with self._lock:
+            entry = self._entries.get(cache_key(api_path, payload_dict))
+            response = entry[2] if entry is not None else None
+        return copy.deepcopy(response) if response is not None else None
+
+    def put(self, api_path, payload_dict, response):
+        if not self.cacheable(api_path): return
+        key = cache_key(api_path, payload_dict)
+        expires_at = self._clock() + self.ttl[api_path]
+        with self._lock:
+            self._entries[key] = (api_path, expires_at, copy.deepcopy(response))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, *api_paths):
+        """ Drops every cached payload of the given endpoints; no arguments clears everything """
+        with self._lock:
+            if not api_paths:
+                dropped = len(self._entries)
+                self._entries.clear()
+                return dropped
+            paths = set(api_paths)
+            stale = [k for k, entry in self._entries.items() if entry[0] in paths]
+            for k in stale:
+                del self._entries[k]
+            return len(stale)
+
+    def note_write(self, api_path):
+        """ Called after every request that reached the host; invalidates the lists a write endpoint affects """
+        related = self.invalidates.get(api_path)
+        return self.invalidate(*related) if related else 0
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "max_entries": self.max_entries,
+                    "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
@@ -0,0 +1,160 @@
+import random
+import re
+import threading
+import time
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+# retry.py
+
+# --- Defaults ---
+DEFAULT_MAX_ATTEMPTS = 4        # First try + 3 retries
+DEFAULT_BASE_DELAY = 0.25       # Seconds; doubled per retry before jitter
+DEFAULT_MAX_DELAY = 3.0         # Cap for a single backoff sleep
+DEFAULT_DEADLINE = 12.0         # Total seconds for all attempts of one call, sleeps included
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Retries may add at most this fraction on top of first attempts (plus a small floor),
+# so an outage does not turn every request into four.
+BUDGET_RATIO = 0.2
+BUDGET_MIN_TOKENS = 10
+
+IDEMPOTENCY_HEADER = "X-Idempotency-Key"
+
+
+# ------------------------------------------------------------
+# ENDPOINT CLASSIFICATION
+#   read   : list / query endpoints         -> retry on any transient failure
+#   update : update / delete (same result)  -> retry on any transient failure
+#   create : add / register / check-out ... -> retry only if the request never left
+#            (connect timeout / refused), unless the caller passes an idempotency key
+# ------------------------------------------------------------
+READ = "read"
+UPDATE = "update"
+CREATE = "create"
+
+_READ_PATTERNS = re.compile(
+    r"(list$|List$|/regions(/subRegions)?$|/qr/get$|/getVisitorStatus$|/visitorInfo$|/visitorinfo$"
+    r"|/getVistorRegisterRecord$|/groupinfo$)"
+)
+_UPDATE_PATTERNS = re.compile(r"(/update$|/delete$)")
+
+OVERRIDES = {
+    # path -> class, for endpoints whose name does not tell
+}
+
+
+def classify(api_path):
+    if api_path in OVERRIDES: return OVERRIDES[api_path]
+    if _READ_PATTERNS.search(api_path): return READ
+    if _UPDATE_PATTERNS.search(api_path): return UPDATE
+    return CREATE
+
+
+# ------------------------------------------------------------
+# RETRY BUDGET (token bucket shared by all calls)
+# ------------------------------------------------------------
+class RetryBudget:
+    def __init__(self, ratio=BUDGET_RATIO, min_tokens=BUDGET_MIN_TOKENS):
+        self.ratio = ratio
+        self.max_tokens = float(min_tokens)
+        self._tokens = float(min_tokens)
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        """ Every first attempt earns 'ratio' of a retry """
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self):
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+# ------------------------------------------------------------
+# POLICY
+# ------------------------------------------------------------
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter under a total deadline.
+    run(api_path, attempt_fn) calls attempt_fn(timeout) until it succeeds, the error is not retryable
+    for the endpoint's class, attempts or budget run out, or the deadline would be exceeded.
+    """
+
+    def __init__(self, max_attempts=DEFAULT_MAX_ATTEMPTS, base_delay=DEFAULT_BASE_DELAY,
+                 max_delay=DEFAULT_MAX_DELAY, deadline=DEFAULT_DEADLINE, budget=None,
+                 sleep=time.sleep, clock=time.monotonic, rng=random.random):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.budget = budget or RetryBudget()
+        self._sleep = sleep
+        self._clock = clock
+        self._rng = rng
+
+    def backoff(self, retry_no, retry_after=None):
+        """ Full jitter: uniform(0, min(max_delay, base * 2^n)); a server Retry-After wins if larger """
+        delay = self._rng() * min(self.max_delay, self.base_delay * (2 ** retry_no))
+        if retry_after: delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+    def should_retry(self, kind, error):
+        status = getattr(error, "status_code", None)
+        if status is not None:
+            return kind != CREATE and status in RETRY_STATUSES
+        if _never_sent(error):
+            return True   # never reached the host; safe even for creates
+        if kind == CREATE:
+            return False
+        return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+    def run(self, api_path, attempt_fn, timeout, idempotency_key=None):
+        kind = classify(api_path)
+        if idempotency_key: kind = UPDATE
+        started = self._clock()
+        self.budget.deposit()
+
+        attempt = 0
+        while True:
+            remaining = self.deadline - (self._clock() - started)
+            try:
+                return attempt_fn(max(0.5, min(timeout, remaining)))
+            except Exception as e:
+                attempt += 1
+                if attempt >= self.max_attempts or not self.should_retry(kind, e):
+                    raise
+                delay = self.backoff(attempt - 1, _retry_after(e))
+                if self._clock() - started + delay >= self.deadline or not self.budget.withdraw():
+                    raise
+                print(f"🔁 Retry {attempt}/{self.max_attempts - 1} for {api_path} in {delay:.2f}s ({type(e).__name__})")
+                self._sleep(delay)
+
+
+def _never_sent(error):
+    """ Connect timeout / connection refused: the request body was never transmitted """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError):
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return isinstance(reason, NewConnectionError)
+    return False
+
+
+def _retry_after(error):
+    value = (getattr(error, "headers", None) or {}).get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+# ------------------------------------------------------------
+# SHARED INSTANCE
+# ------------------------------------------------------------
+default_policy = RetryPolicy()
@@ -0,0 +1,107 @@
+import tkinter as tk
+from collections import OrderedDict
+
+# screen_manager.py
+
+MAX_ALIVE_SCREENS = 4   # Kept-alive screens (home + the list screens people switch between); oldest is destroyed
+
+
+# ------------------------------------------------------------
+# KEEP-ALIVE SCREEN MANAGER
+# ------------------------------------------------------------
+class ScreenManager:
+    """
+    Owns the content area below the header. Each screen is rendered into its own host frame.
+
+    show(name, build, refresh) keeps the screen alive: switching away only pack_forget()s its host, and
+    switching back packs it again and calls refresh() (reload data, not widgets). At most 'max_alive'
+    screens stay resident; the least recently shown one is destroyed.
+    A kept screen is rebuilt instead of reused if it replaced its own widgets in the meantime (e.g. the
+    list opened its edit form in place), so returning never lands on a half-finished form.
+
+    show_transient(build) is for forms and rarely used screens: a fresh host that is destroyed on the
+    next navigation, i.e. the old clear-and-rebuild behaviour.
+    build(host) is the screen's usual entry point (show_list(host), load_home_screen(host), ...).
+    """
+
+    def __init__(self, container, max_alive=MAX_ALIVE_SCREENS, bg=None):
+        self.container = container
+        self.max_alive = max_alive
+        self.bg = bg
+        self._screens = OrderedDict()   # name -> (host, children right after build)
+        self._current = None            # (name or None for transient, host)
+
+    @property
+    def current(self):
+        return self._current[0] if self._current else None
+
+    def show(self, name, build, refresh=None):
+        entry = self._screens.get(name)
+        if entry is not None and not self._intact(*entry):
+            self.drop(name)
+            entry = None
+
+        if entry is None:
+            host = self._swap_in(name)
+            build(host)
+            self._screens[name] = (host, tuple(host.winfo_children()))
+            self._evict()
+            return host
+
+        host = entry[0]
+        self._screens.move_to_end(name)
+        if self._current is None or self._current[1] is not host:
+            self._hide_current()
+            host.pack(fill="both", expand=True)
+            self._current = (name, host)
+        if refresh:
+            refresh()
+        return host
+
+    def show_transient(self, build):
+        host = self._swap_in(None)
+        build(host)
+        return host
+
+    def drop(self, name):
+        """ Destroys a kept screen (next show() rebuilds it) """
+        entry = self._screens.pop(name, None)
+        if entry is None: return
+        if self._current and self._current[1] is entry[0]:
+            self._current = None
+        entry[0].destroy()
+
+    def clear(self):
+        for name in list(self._screens):
+            self.drop(name)
+        self._hide_current()
+
+    # ---------------- internals ----------------
+    def _intact(self, host, children):
+        try:
+            return bool(children) and host.winfo_exists() and tuple(host.winfo_children()) == children
+        except tk.TclError:
+            return False
+
+    def _swap_in(self, name):
+        self._hide_current()
+        host = tk.Frame(self.container, bg=self.bg) if self.bg else tk.Frame(self.container)
+        host.pack(fill="both", expand=True)
+        self._current = (name, host)
+        return host
+
+    def _hide_current(self):
+        if self._current is None: return
+        name, host = self._current
+        self._current = None
+        try:
+            if name is None: host.destroy()   # transient screen
+            else: host.pack_forget()
+        except tk.TclError:
+            pass
+
+    def _evict(self):
+        while len(self._screens) > self.max_alive:
+            name = next(iter(self._screens))
+            print(f"♻️ Screen cache full, releasing '{name}'")
+            self.drop(name)
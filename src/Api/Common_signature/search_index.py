@@ -0,0 +1,220 @@
+import threading
+
+from . import local_store
+
+# search_index.py
+
+# Appointment fields searched by the appointment list (dotted paths; alternatives for renamed fields)
+APPOINTMENT_FIELDS = (
+    "visitorName", "visitorInfo.visitorName",
+    "visitorInfo.visitorGivenName", "visitorInfo.visitorFamilyName",
+    "visitorInfo.phoneNo", "phoneNo",
+    "visitorInfo.certificateNo", "certificateNo",
+    "receptionistName",
+    "visitReasonName", "visitorReasonName",
+    "visitorInfo.plateNo", "plateNo",
+)
+
+
+def _dig(record, path):
+    value = record
+    for part in path.split("."):
+        if not isinstance(value, dict): return None
+        value = value.get(part)
+    return value
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+COMPACT_MIN_DEAD = 1000   # Dropped ids tolerated in the posting lists before they are rebuilt
+
+
+# ------------------------------------------------------------
+# INVERTED INDEX
+# ------------------------------------------------------------
+class SearchIndex:
+    """
+    In-memory inverted index over a set of records.
+    Each record's searchable fields are lowercased once into a text blob and the record gets an
+    increasing integer id; every trigram of the blob maps to the ascending list of ids containing it.
+    A query is split on whitespace and every term must match (AND):
+      3+ characters : substring anywhere in the blob
+      1-2 characters: start of any word ("ra" finds "Rahul", not "Suresh")
+    The shortest candidate list drives the scan, each candidate is confirmed against the blob, and the
+    scan stops once 'limit' matches are found, so even a query matching everything stays cheap.
+    Results come back in insertion order.
+    Re-adding a record with unchanged searchable text keeps its id and postings. Otherwise the old id
+    is dropped, and once dropped ids outnumber live ones the posting lists are rebuilt without them.
+    """
+
+    def __init__(self, fields, key_fn):
+        self.fields = fields
+        self.key_fn = key_fn
+        self._ids = {}        # key -> current id
+        self._docs = {}       # id -> record (ids of removed / replaced records are dropped here only)
+        self._text = {}       # id -> " " + lowercase blob
+        self._grams = {}      # trigram -> ascending ids (may still list dropped ids; skipped on read)
+        self._dead = 0        # dropped ids still listed in _grams
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._docs)
+
+    def _blob(self, record):
+        parts = []
+        for path in self.fields:
+            value = _dig(record, path)
+            if value not in (None, ""): parts.append(str(value).lower())
+        return " " + " ".join(dict.fromkeys(parts))   # drop duplicates (visitorName is often in two places)
+
+    def _add(self, key, record):
+        text = self._blob(record)
+        old = self._ids.get(key)
+        if old is not None:
+            if self._text[old] == text:   # same searchable text (e.g. a page saved again): postings still valid
+                self._docs[old] = record
+                return
+            self._drop(old)
+        doc_id = self._next_id
+        self._next_id += 1
+        self._ids[key] = doc_id
+        self._docs[doc_id] = record
+        self._text[doc_id] = text
+        grams = self._grams
+        for gram in _trigrams(text):
+            postings = grams.get(gram)
+            if postings is None: grams[gram] = [doc_id]
+            else: postings.append(doc_id)
+
+    def _drop(self, doc_id):
+        del self._docs[doc_id]
+        del self._text[doc_id]
+        self._dead += 1
+
+    def _compact(self):
+        """ Rebuilds the posting lists from the live ids once dropped ids dominate them """
+        if self._dead < max(COMPACT_MIN_DEAD, len(self._docs)): return
+        grams = {}
+        for doc_id, text in self._text.items():   # ascending: ids are assigned in insertion order
+            for gram in _trigrams(text):
+                postings = grams.get(gram)
+                if postings is None: grams[gram] = [doc_id]
+                else: postings.append(doc_id)
+        self._grams = grams
+        self._dead = 0
+
+    # ---------------- writes ----------------
+    def add(self, records):
+        with self._lock:
+            for r in records:
+                key = self.key_fn(r)
+                if key is not None: self._add(key, r)
+            self._compact()
+
+    def remove(self, keys):
+        with self._lock:
+            for key in keys:
+                doc_id = self._ids.pop(key, None)
+                if doc_id is not None: self._drop(doc_id)
+            self._compact()
+
+    def rebuild(self, records):
+        with self._lock:
+            self._ids, self._docs, self._text, self._grams = {}, {}, {}, {}
+            self._next_id = self._dead = 0
+            for r in records:
+                key = self.key_fn(r)
+                if key is not None: self._add(key, r)
+
+    # ---------------- reads ----------------
+    def _candidates(self, needle):
+        """ Ascending ids that may contain 'needle' (None when it is too short to narrow anything down) """
+        if len(needle) < 3: return None
+        best = None
+        for gram in _trigrams(needle):
+            postings = self._grams.get(gram)
+            if postings is None: return []
+            if best is None or len(postings) < len(best): best = postings
+        return best
+
+    def search(self, query, limit=None):
+        """ Records matching every whitespace-separated term of 'query' (all records if it is empty) """
+        # Short terms are matched at word starts, i.e. as " " + term against the space-prefixed blob
+        needles = [t if len(t) >= 3 else " " + t for t in dict.fromkeys(query.lower().split())]
+        results = []
+        with self._lock:
+            driver = None
+            for term in needles:
+                candidates = self._candidates(term)
+                if candidates is not None and (driver is None or len(candidates) < len(driver)):
+                    driver = candidates
+            if driver is None: driver = self._docs   # dicts keep insertion (= id) order
+
+            text = self._text
+            for doc_id in driver:
+                blob = text.get(doc_id)
+                if blob is None: continue
+                for term in needles:
+                    if term not in blob: break
+                else:
+                    results.append(self._docs[doc_id])
+                    if limit and len(results) >= limit: break
+        return results
+
+
+# ------------------------------------------------------------
+# SHARED APPOINTMENT INDEX (over every appointment in the local store)
+#   Built once on a background thread, then kept current from the store's write notifications.
+# ------------------------------------------------------------
+_appointments = SearchIndex(APPOINTMENT_FIELDS, key_fn=lambda r: local_store.record_key("appointments", r))
+_ready = False
+_subscribed = False
+_started = False
+_state_lock = threading.Lock()
+
+def _on_store_write(entity, records, removed, replaced):
+    if entity != "appointments": return
+    with _state_lock:
+        if not _ready: return   # the build in progress reads the store after this write
+        if replaced: _appointments.rebuild(records)
+        else:
+            if removed: _appointments.remove(removed)
+            if records: _appointments.add(records)
+
+def build_appointment_index():
+    """ Loads every stored appointment into the index (blocking); later writes are applied incrementally """
+    global _ready, _subscribed
+    store = local_store.get_store()
+    with _state_lock:
+        if _ready: return _appointments
+        if not _subscribed:
+            store.add_listener(_on_store_write)
+            _subscribed = True
+        _appointments.rebuild(store.query("appointments"))
+        _ready = True
+    print(f"🔎 Appointment search index ready ({len(_appointments)} records)")
+    return _appointments
+
+def warm_up():
+    """ Starts building the appointment index on a background thread (no-op once started) """
+    global _started
+    with _state_lock:
+        start, _started = not _started, True
+    if start:
+        threading.Thread(target=_safe_build, name="appointment-index", daemon=True).start()
+
+def search_appointments(query, limit=None):
+    """ Stored appointments matching 'query', or None while the index is not built yet (see warm_up) """
+    if not _ready:
+        warm_up()
+        return None
+    return _appointments.search(query, limit=limit)
+
+def _safe_build():
+    try:
+        build_appointment_index()
+    except Exception as e:
+        print(f"⚠️ Appointment index build failed: {e}")
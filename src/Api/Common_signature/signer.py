@@ -0,0 +1,84 @@
+import base64
+import hashlib
+import hmac
+import threading
+from collections import OrderedDict
+
+# signer.py
+
+DEFAULT_MAX_ENTRIES = 512     # Memoized (method, body, path) signatures
+MAX_MEMO_BODY = 4096          # Larger bodies (bulk writes) are signed but not remembered
+
+ACCEPT = "application/json"
+CONTENT_TYPE = "application/json;charset=UTF-8"
+SIGNATURE_HEADERS = "x-ca-key"
+
+
+# ------------------------------------------------------------
+# SIGNER
+# ------------------------------------------------------------
+class Signer:
+    """
+    Artemis HMAC-SHA256 request signer.
+    The keyed HMAC state is built once and copy()'d per request (skips re-encoding the secret and the
+    key padding rounds). List queries are signed with identical bodies over and over during pagination
+    and refresh, so (Content-MD5, signature) pairs are memoized per (method, body, path) in a bounded LRU.
+    """
+
+    def __init__(self, app_key, app_secret, max_entries=DEFAULT_MAX_ENTRIES):
+        self.app_key = app_key
+        self.max_entries = max_entries
+        self._base = hmac.new(app_secret.encode("utf-8"), digestmod=hashlib.sha256)
+        self._headers_to_sign = f"x-ca-key:{app_key}\n"
+        self._memo = OrderedDict()   # (method, body, path) -> (content_md5, signature)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def sign(self, method, body, api_path):
+        """ Returns (content_md5, signature) for one request """
+        key = (method, body, api_path)
+        with self._lock:
+            cached = self._memo.get(key)
+            if cached is not None:
+                self._memo.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        content_md5 = base64.b64encode(hashlib.md5(body.encode("utf-8")).digest()).decode("utf-8")
+        string_to_sign = (
+            f"{method}\n"
+            f"{ACCEPT}\n"
+            f"{content_md5}\n"
+            f"{CONTENT_TYPE}\n"
+            f"{self._headers_to_sign}"
+            f"{api_path}"
+        )
+        mac = self._base.copy()
+        mac.update(string_to_sign.encode("utf-8"))
+        result = (content_md5, base64.b64encode(mac.digest()).decode("utf-8"))
+
+        if len(body) <= MAX_MEMO_BODY:
+            with self._lock:
+                self._memo[key] = result
+                while len(self._memo) > self.max_entries:
+                    self._memo.popitem(last=False)
+        return result
+
+    def headers(self, method, body, api_path):
+        """ Fresh header dict for one request (callers may add their own headers to it) """
+        content_md5, signature = self.sign(method, body, api_path)
+        return {
+            "Accept": ACCEPT,
+            "Content-MD5": content_md5,
+            "Content-Type": CONTENT_TYPE,
+            "X-Ca-Key": self.app_key,
+            "X-Ca-Signature-Headers": SIGNATURE_HEADERS,
+            "X-Ca-Signature": signature,
+        }
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._memo), "max_entries": self.max_entries,
+                    "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,70 @@
+import copy
+import threading
+
+# singleflight.py
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.waiters = 0
+        self.result = None
+        self.error = None
+
+
+# ------------------------------------------------------------
+# SINGLE-FLIGHT
+# ------------------------------------------------------------
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls: the first caller for a key runs fn(), callers arriving while it
+    is in flight wait and receive the same outcome (a deep copy of the result, or the same exception).
+    Nothing is remembered once the call finishes; that is the response cache's job.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+                leader = True
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            result = fn()
+        except BaseException as e:
+            call.error = e
+            self._finish(key, call)
+            call.done.set()
+            raise
+
+        # Followers copy from a private snapshot, so the leader may mutate its own result right away
+        if self._finish(key, call): call.result = copy.deepcopy(result)
+        call.done.set()
+        return result
+
+    def _finish(self, key, call):
+        """ Unregisters the call (no one can join after this) and returns how many callers are waiting """
+        with self._lock:
+            del self._calls[key]
+            return call.waiters
+
+    def stats(self):
+        with self._lock:
+            return {"in_flight": len(self._calls), "leaders": self.leaders, "coalesced": self.coalesced}
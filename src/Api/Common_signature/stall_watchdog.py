@@ -0,0 +1,145 @@
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+
+# stall_watchdog.py
+
+HEARTBEAT_MS = 100          # How often the Tk loop is asked to check in
+STALL_THRESHOLD_MS = 250    # Report once the loop has not checked in for this long
+MAX_REPORTS = 50            # Recent stalls kept in memory (see StallWatchdog.reports)
+
+# --- Log Location (project root, next to main.py) ---
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../../"))
+DEFAULT_LOG_PATH = os.path.join(PROJECT_ROOT, "ui_stalls.log")
+
+
+# ------------------------------------------------------------
+# WATCHDOG
+# ------------------------------------------------------------
+class StallWatchdog:
+    """
+    Detects Tk event-loop stalls.
+    The Tk thread stamps a heartbeat with after(); a side thread watches the stamp and, once it is older
+    than the threshold, captures the Tk thread's stack with sys._current_frames(). The stack is taken
+    while the stall is still in progress, so it points at the handler that is blocking.
+    One stall produces one report, logged when the loop recovers (with the full duration).
+    """
+
+    def __init__(self, root, threshold_ms=STALL_THRESHOLD_MS, heartbeat_ms=HEARTBEAT_MS,
+                 log_path=DEFAULT_LOG_PATH, on_stall=None):
+        self.root = root
+        self.threshold = threshold_ms / 1000.0
+        self.heartbeat_ms = heartbeat_ms
+        self.log_path = log_path
+        self.on_stall = on_stall
+        self.reports = deque(maxlen=MAX_REPORTS)
+
+        self._tk_thread_id = threading.get_ident()   # must be constructed on the Tk thread
+        self._last_beat = time.monotonic()
+        self._pending = None                          # stack captured for the stall in progress
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._after_id = None
+        self._thread = None
+
+    # ---------------- Tk side ----------------
+    def _beat(self):
+        now = time.monotonic()
+        with self._lock:
+            lateness = now - self._last_beat - self.heartbeat_ms / 1000.0
+            self._last_beat = now
+            pending, self._pending = self._pending, None
+
+        if pending is not None:
+            self._report(pending, lateness)
+
+        if not self._stop.is_set():
+            self._after_id = self.root.after(self.heartbeat_ms, self._beat)
+
+    # ---------------- side thread ----------------
+    def _watch(self):
+        poll = min(self.threshold / 2, 0.05)
+        while not self._stop.wait(poll):
+            with self._lock:
+                if self._pending is not None: continue
+                silent = time.monotonic() - self._last_beat
+                if silent < self.threshold + self.heartbeat_ms / 1000.0: continue
+                frame = sys._current_frames().get(self._tk_thread_id)
+                if frame is None: continue
+                self._pending = traceback.extract_stack(frame)
+
+    def _report(self, stack, duration):
+        culprit = _culprit(stack)
+        report = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "duration_ms": round(duration * 1000),
+            "function": f"{culprit.name} ({os.path.basename(culprit.filename)}:{culprit.lineno})" if culprit else "?",
+            "stack": "".join(traceback.format_list(stack)),
+        }
+        self.reports.append(report)
+        print(f"🐢 UI stalled {report['duration_ms']} ms in {report['function']}")
+
+        if self.log_path:
+            try:
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(f"[{report['time']}] UI stalled {report['duration_ms']} ms in {report['function']}\n")
+                    f.write(report["stack"])
+                    f.write("\n")
+            except OSError as e:
+                print(f"⚠️ Could not write stall log: {e}")
+
+        if self.on_stall:
+            try:
+                self.on_stall(report)
+            except Exception as e:
+                print(f"⚠️ Stall callback error: {e}")
+
+    # ---------------- lifecycle ----------------
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return self
+        self._stop.clear()
+        self._last_beat = time.monotonic()
+        self._after_id = self.root.after(self.heartbeat_ms, self._beat)
+        self._thread = threading.Thread(target=self._watch, name="tk-stall-watchdog", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+
+def _culprit(stack):
+    """ Innermost frame that belongs to the app (skips tkinter / requests / stdlib frames) """
+    for frame in reversed(stack):
+        path = os.path.abspath(frame.filename)
+        if path.startswith(PROJECT_ROOT) and os.sep + "site-packages" + os.sep not in path:
+            return frame
+    return stack[-1] if stack else None
+
+
+# ------------------------------------------------------------
+# SHARED INSTANCE
+# ------------------------------------------------------------
+_watchdog = None
+
+def install(root, **options):
+    """ Starts the watchdog for 'root' (call from the Tk thread); returns the instance """
+    global _watchdog
+    if _watchdog is not None:
+        _watchdog.stop()
+    _watchdog = StallWatchdog(root, **options).start()
+    return _watchdog
+
+def get_watchdog():
+    return _watchdog
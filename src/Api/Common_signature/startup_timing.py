@@ -0,0 +1,42 @@
+import time
+
+# startup_timing.py
+
+_started = time.perf_counter()   # reset by start() from main.py; import time otherwise
+_marks = []                      # (label, seconds since start, note)
+_reported = False
+
+
+# ------------------------------------------------------------
+# STARTUP TIMING REPORT
+#   main.py calls start() first thing, each startup phase calls mark(), and Ui.py calls
+#   report_when_idle(root) so the total covers everything up to the first drawn frame.
+# ------------------------------------------------------------
+def start(at=None):
+    """ Starts the clock at 'at' (a time.perf_counter() value) or now """
+    global _started
+    _started = time.perf_counter() if at is None else at
+    _marks.clear()
+
+def mark(label, note=""):
+    _marks.append((label, time.perf_counter() - _started, note))
+
+def report():
+    """ One line per phase with its own duration, then the total """
+    lines = ["⏱ Startup timing:"]
+    previous = 0.0
+    for label, at, note in _marks:
+        lines.append(f"    {label:<22} {(at - previous) * 1000:8.1f} ms" + (f"  ({note})" if note else ""))
+        previous = at
+    lines.append(f"    {'total':<22} {previous * 1000:8.1f} ms")
+    return "\n".join(lines)
+
+def report_when_idle(root):
+    """ Prints the report once Tk has drawn the first frame (first idle after the UI was built) """
+    def _done():
+        global _reported
+        if _reported: return
+        _reported = True
+        mark("first frame")
+        print(report())
+    root.after_idle(_done)
@@ -0,0 +1,231 @@
+import functools
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+
+from . import common_signature_api as api
+from . import local_store
+from .pagination import iter_pages
+
+# sync.py
+
+DEFAULT_SYNC_PAGE_SIZE = 500      # Largest page Artemis accepts on the list endpoints
+SCHEDULER_TICK = 5                # Seconds between scheduler checks
+WINDOW_OVERLAP = timedelta(days=1)  # Re-pull this much before the high-water mark to catch late edits
+
+# First sync of a windowed entity covers the same range the dashboard always queried
+INITIAL_WINDOW_START = "2020-01-01T00:00:00+05:30"
+WINDOW_END = "2030-12-31T23:59:59+05:30"
+
+# ------------------------------------------------------------
+# SYNC PLAN
+#   window   : Artemis filters the list by a time range -> only pull [mark - overlap, WINDOW_END]
+#   checksum : no usable filter -> walk the pages, write only pages whose checksum changed
+#   interval : seconds between scheduled runs
+# ------------------------------------------------------------
+SYNC_PLAN = {
+    "appointments": {
+        "mode": "window", "interval": 60,
+        "start_key": "appointStartTime", "end_key": "appointEndTime", "column": "appointStartTime",
+    },
+    "visit_records": {
+        "mode": "window", "interval": 60,
+        "start_key": "visitStartTime", "end_key": "visitEndTime", "column": "visitStartTime",
+        "payload": {"sortField": "visitingTime", "orderType": "0"},
+    },
+    "persons":        {"mode": "checksum", "interval": 300},
+    "vehicles":       {"mode": "checksum", "interval": 300},
+    "vehicle_groups": {"mode": "checksum", "interval": 900},
+    "doors":          {"mode": "checksum", "interval": 900},
+    "regions":        {"mode": "checksum", "interval": 1800},
+}
+
+
+def _now_iso():
+    return datetime.now().astimezone().replace(microsecond=0).isoformat()
+
+
+def _parse_time(value):
+    """ Aware datetime or None; a value without a UTC offset is taken as local time, so results always compare """
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        return parsed if parsed.tzinfo else parsed.astimezone()
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
+
+
+def page_checksum(rows):
+    """ Stable digest of one page (key order inside records does not matter) """
+    blob = json.dumps(rows, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()
+
+
+# ------------------------------------------------------------
+# SYNC ENGINE
+# ------------------------------------------------------------
+class SyncEngine:
+    """
+    Keeps the local SQLite mirror up to date with as little traffic as each endpoint allows.
+    The high-water mark of every entity lives in local_store's sync_state table, so deltas
+    continue where the previous run (or the previous app session) stopped.
+    """
+
+    def __init__(self, store=None, plan=SYNC_PLAN, page_size=DEFAULT_SYNC_PAGE_SIZE, fetch=None):
+        self._store = store
+        self.plan = plan
+        self.page_size = page_size
+        # Sync must see the server state, never a cached reference list
+        self.fetch = fetch or functools.partial(api.request_json, use_cache=False)
+        self._locks = {entity: threading.Lock() for entity in plan}
+        self._listeners = []
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def store(self):
+        return self._store or local_store.get_store()
+
+    def add_listener(self, fn):
+        """ fn(result) is called on the sync thread after every successful run """
+        self._listeners.append(fn)
+
+    # ---------------- one entity ----------------
+    def sync(self, entity):
+        """ Runs one delta pull now and returns a summary dict; concurrent calls for the same entity wait """
+        spec = self.plan[entity]
+        with self._locks[entity]:
+            started = time.time()
+            if spec["mode"] == "window":
+                result = self._sync_window(entity, spec)
+            else:
+                result = self._sync_checksum(entity, spec)
+            result["entity"] = entity
+            result["mode"] = spec["mode"]
+            result["seconds"] = round(time.time() - started, 3)
+
+        print(f"🔄 Synced {entity}: {result['changed']} changed, {result['removed']} removed ({result['seconds']}s)")
+        for fn in list(self._listeners):
+            try:
+                fn(result)
+            except Exception as e:
+                print(f"⚠️ Sync listener error: {e}")
+        return result
+
+    def _sync_window(self, entity, spec):
+        store = self.store
+        _, mark = store.last_synced(entity)
+        pulled_at = _now_iso()
+
+        window_start = INITIAL_WINDOW_START
+        mark_time = _parse_time(mark)
+        if mark_time:
+            window_start = (mark_time - WINDOW_OVERLAP).isoformat()
+
+        payload = dict(spec.get("payload") or {})
+        payload[spec["start_key"]] = window_start
+        payload[spec["end_key"]] = WINDOW_END
+
+        seen = set()
+        fetched = 0
+        for _, rows, _ in iter_pages(local_store.ENTITIES[entity]["api"], payload,
+                                     page_size=self.page_size, fetch=self.fetch):
+            store.upsert(entity, rows)
+            fetched += len(rows)
+            seen.update(k for k in (local_store.record_key(entity, r) for r in rows) if k)
+
+        # Anything we hold inside the pulled window that the server no longer returns was deleted
+        since = _parse_time(window_start)
+        stale = []
+        for key, value in store.column_values(entity, spec["column"]).items():
+            when = _parse_time(value)
+            if key not in seen and when and when >= since:
+                stale.append(key)
+        removed = store.delete_keys(entity, stale)
+
+        store.mark_synced(entity, pulled_at)
+        return {"fetched": fetched, "changed": fetched, "removed": removed, "mark": pulled_at}
+
+    def _sync_checksum(self, entity, spec):
+        store = self.store
+        entity_spec = local_store.ENTITIES[entity]
+        previous = store.page_checksums(entity)
+
+        checksums = {}
+        seen = set()
+        fetched = changed = 0
+        for page_no, rows, _ in iter_pages(entity_spec["api"], entity_spec.get("payload"),
+                                           page_size=self.page_size, fetch=self.fetch):
+            digest = page_checksum(rows)
+            checksums[page_no] = digest
+            fetched += len(rows)
+            seen.update(k for k in (local_store.record_key(entity, r) for r in rows) if k)
+            if previous.get(page_no) != digest:
+                changed += store.upsert(entity, rows)
+
+        # Full walk completed -> rows the server did not return any more are gone
+        removed = store.delete_keys(entity, store.keys(entity) - seen)
+
+        mark = hashlib.sha1("".join(checksums[p] for p in sorted(checksums)).encode()).hexdigest()
+        store.save_page_checksums(entity, checksums)
+        store.mark_synced(entity, mark)
+        return {"fetched": fetched, "changed": changed, "removed": removed, "mark": mark}
+
+    # ---------------- schedule ----------------
+    def due(self, entity, now=None):
+        synced_at, _ = self.store.last_synced(entity)
+        return synced_at is None or (now or time.time()) - synced_at >= self.plan[entity]["interval"]
+
+    def sync_due(self):
+        """ Syncs every entity whose interval has elapsed; one failing entity does not stop the rest """
+        results = {}
+        for entity in self.plan:
+            if self._stop.is_set(): break
+            if not self.due(entity): continue
+            try:
+                results[entity] = self.sync(entity)
+            except Exception as e:
+                err = getattr(e, "msg", None) or str(e)
+                print(f"⚠️ Sync failed ({entity}): {err}")
+        return results
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="artemis-sync", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.sync_due()
+            self._stop.wait(SCHEDULER_TICK)
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+
+# ------------------------------------------------------------
+# SHARED INSTANCE
+# ------------------------------------------------------------
+_engine = None
+_engine_lock = threading.Lock()
+
+def get_engine():
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = SyncEngine()
+        return _engine
+
+def start_scheduler():
+    return get_engine().start()
+
+def sync_entity(entity):
+    """ Immediate delta pull (e.g. a Refresh button); raises like pagination.iter_pages """
+    return get_engine().sync(entity)
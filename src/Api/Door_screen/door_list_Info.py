@@ -1,6 +1,8 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
-from Api.Common_signature import common_signature_api
+from tkinter import ttk
+from src.Api.Common_signature import common_signature_api
+from src.Api.Common_signature.async_client import run_async
+from src.Api.Common_signature.pagination import fetch_all
 
 # ---------------- COLORS ----------------
 HEADER_BG = "#F3F4F6"
@@ -100,21 +102,21 @@ def show_door_list(parent_frame):
         command=lambda: show_door_list(parent_frame)
     ).pack(pady=5)
 
-    # ------------ API CALL ------------
+    # ------------ API CALL (background, all pages) ------------
     api_path = "/artemis/api/resource/v1/acsDevice/acsDeviceList"
-    payload = {"pageNo": 1, "pageSize": 200}
 
-    res = common_signature_api.call_api(api_path, payload)
+    tree.insert("", "end", iid="loading", values=("", "Loading...", "", "", "", ""))
 
-    if not res:
-        messagebox.showerror("Error", "No response from Hikvision API.")
-        return
+    def on_error(error):
+        tree.delete(*tree.get_children())
+        common_signature_api.report_api_error(error)
 
-    if res.get("code") != "0":
-        messagebox.showerror("API Error", res.get("msg", "Unknown error"))
-        return
+    run_async(tree, fetch_all, api_path,
+              on_success=lambda devices: populate_devices(tree, devices), on_error=on_error)
 
-    devices = res.get("data", {}).get("list", [])
+
+def populate_devices(tree, devices):
+    tree.delete(*tree.get_children())
 
     # -------------- Insert Rows --------------
     for i, dev in enumerate(devices):
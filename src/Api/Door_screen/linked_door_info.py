@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from Api.Common_signature import common_signature_api
+from src.Api.Common_signature import common_signature_api
+from src.Api.Common_signature import local_store
 
 # ---------------- COLORS ----------------
 HEADER_BG = "#F3F4F6"
@@ -137,6 +138,7 @@ def show_linked_doors(content_frame):
             return
 
         door_list = ok_res.get("data", {}).get("list", [])
+        local_store.remember("doors", door_list)
 
         if not door_list:
             messagebox.showinfo("Info", "No linked doors found.")
@@ -5,8 +5,12 @@ from tkinter import ttk, messagebox
 # --- IMPORTS ---
 try:
     from src.Api.Common_signature import common_signature_api
+    from src.Api.Common_signature.pagination import iter_records
+    from src.Api.Common_signature import local_store
 except ImportError:
     common_signature_api = None
+    iter_records = None
+    local_store = None
 
 # --- API ENDPOINTS ---
 # Get all regions (root and children)
@@ -34,38 +38,43 @@ def call_api(url, payload):
         print(f"API Error: {e}")
         return None
 
-def fetch_regions(tree):
-    """Fetches all regions and populates the treeview"""
-    # 1. Prepare Payload (Pagination)
-    payload = {
-        "pageNo": 1,
-        "pageSize": 500,
-        "treeCode": "0" # "0" usually fetches the whole tree
-    }
-    
-    print(f"📡 Fetching Regions...")
-    data = call_api(GET_ALL_REGIONS_API, payload)
-    
-    # 2. Clear Tree
+def fetch_regions(tree, fresh=False):
+    """Fetches all regions (every page) and populates the treeview; fresh=True bypasses the response cache"""
+    # 1. Clear Tree
     for item in tree.get_children():
         tree.delete(item)
 
-    # 3. Parse Response
-    if data and data.get("code") == "0":
-        regions = data.get("data", {}).get("list", [])
-        
-        for r in regions:
+    if not iter_records:
+        messagebox.showerror("Error", "Failed to fetch regions: API module missing")
+        return
+
+    # 2. Stream every page ("0" usually fetches the whole tree)
+    print(f"📡 Fetching Regions...")
+    if fresh and hasattr(common_signature_api, 'invalidate_cache'):
+        common_signature_api.invalidate_cache(GET_ALL_REGIONS_API)
+    count = 0
+    regions = []
+    try:
+        for r in iter_records(GET_ALL_REGIONS_API, {"treeCode": "0"}, page_size=500):
             r_name = r.get("name", "Unknown")
             r_code = r.get("indexCode", "-")
             r_parent = r.get("parentIndexCode", "-")
             
             # Insert into Treeview
             tree.insert("", "end", values=(r_name, r_code, r_parent))
-            
-        messagebox.showinfo("Success", f"Fetched {len(regions)} regions.")
-    else:
-        err = data.get("msg") if data else "Unknown Error"
+            regions.append(r)
+            count += 1
+    except Exception as e:
+        err = getattr(e, "msg", None) or str(e)
         messagebox.showerror("Error", f"Failed to fetch regions: {err}")
+        return
+
+    # Complete tree fetched -> replace the local mirror in one go
+    if local_store:
+        try: local_store.get_store().replace_all("regions", regions)
+        except Exception as e: print(f"⚠️ Local store write failed (regions): {e}")
+
+    messagebox.showinfo("Success", f"Fetched {count} regions.")
 
 def show_region_list(parent_frame):
     for w in parent_frame.winfo_children(): w.destroy()
@@ -77,7 +86,7 @@ def show_region_list(parent_frame):
     
     # Refresh Button
     tk.Button(header, text="🔄 Refresh List", bg="#17a2b8", fg="white", 
-              command=lambda: fetch_regions(tree)).pack(side="right", padx=10)
+              command=lambda: fetch_regions(tree, fresh=True)).pack(side="right", padx=10)
 
     # Treeview
     cols = ("Name", "Index Code", "Parent Code")
@@ -1,7 +1,8 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import os, sys  
-from Api.vehicle_screen import vehicle_group_form, vehicle_group_list
+import importlib
+import importlib.util
 import common_header    
 
 # --- THEME CONFIGURATION (Dark Blue + Gold) ---
@@ -19,131 +20,187 @@ print("--- Ui.py: Starting initialization ---")
 # -----------------------------------------
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))
 
-try:
-    from src.Api.visitor_screen import visitor_registerment as visitor_form
-    from src.Api.visitor_screen import visitor_list_Info as visitor_list
-    from src.Api.Common_signature import common_signature_api
-    from src.Api.Door_screen import door_list_Info as door_list
-    from src.Api.Door_screen import linked_door_info as linked_doors
-    from src.Api.Homepage.home_screen import load_home_screen
-    from src.Api.visitor_screen.visitor_group import show_visitor_group_screen 
-    from src.Api.Homepage import common_header
-    import src.Api.visitor_screen.visitor_checkin as visitor_checkin  
-    
-    # Vehicle
-    from src.Api.vehicle_screen import vehicle_form
-    from src.Api.vehicle_screen import vehicle_list
-    from src.Api.vehicle_screen import vehicle_screen
-
-    # Person
-    from src.Api.person_screen import person_form
-    from src.Api.person_screen import person_list  
-
-    from src.Api.vehicle_screen import vehicle_group_list
-    from src.Api.vehicle_screen import vehicle_group_form
-
-    # Visitor Extras
-    from src.Api.visitor_screen import VisitorRegisterDetails as visitorRegisterDetails
-    from src.Api.visitor_screen import VisitorQRconfig as visitorQRconfig
-    import src.Api.visitor_screen.visitor_appointment as visitor_appointment
-    
-    print("✅ Core modules imported successfully")
-
-except Exception as e:
-    print(f"❌ CRITICAL IMPORT ERROR: {e}")
-    # Mocks to prevent crash
-    class MockAPI:
-        def show_create_form(*a): print("Mock: show_create_form")
-        def show_single_visitor_list(*a): print("Mock: show_single_visitor_list")
-        def show_list(*a): print("Mock: show_list")
-        def show_door_list(*a): print("Mock: show_door_list")
-        def show_linked_doors(*a): print("Mock: show_linked_doors")
-
-    visitor_form = MockAPI()
-    visitor_list = MockAPI()
-    door_list = MockAPI()
-    linked_doors = MockAPI()
-    vehicle_form = MockAPI()
-    vehicle_list = MockAPI()
-    vehicle_screen = MockAPI()
-    person_form = MockAPI()
-    person_list = MockAPI()
-    
-    class FakeModule:
-        @staticmethod
-        def render_register_details(parent): pass
-        @staticmethod
-        def render_qr_config(parent): pass
-            
-    visitorRegisterDetails = FakeModule()
-    visitorQRconfig = FakeModule()
-    def load_home_screen(*args, **kwargs): print("Mock: load_home_screen")
-
-
-# DOOR IMPORTS
-region_list = None
-org_creation = None
-area_creation = None
-try: from src.Api.Door_screen import region_list
-except ImportError: pass
-try: from src.Api.Door_screen import org_creation
-except ImportError: pass
-try: from src.Api.Door_screen import area_creation
-except ImportError: pass
+try: from src.Api.Common_signature import import_profile
+except ImportError: import_profile = None
+try: from src.Api.Common_signature import startup_timing
+except ImportError: startup_timing = None
+from src.Api.Common_signature.screen_manager import ScreenManager
+
+
+# -----------------------------------------
+# LAZY SCREEN REGISTRY
+# Screen modules (and their tkcalendar / PIL / requests imports) load on first use, not at startup.
+# Run with VMS_IMPORT_PROFILE=1 (or main.py --profile-imports) to print each screen's import cost.
+# -----------------------------------------
+class LazyScreen:
+    """ Stands in for a screen module; imports it on first attribute access and keeps it """
+    registry = {}   # module path -> LazyScreen
+
+    def __init__(self, module_path):
+        self.module_path = module_path
+        self._module = None
+        LazyScreen.registry[module_path] = self
+
+    def load(self):
+        if self._module is None:
+            self._module = _import_screen(self.module_path)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+    def __bool__(self):
+        """ True if the module exists (checked without importing it) """
+        if self._module is not None: return not isinstance(self._module, MissingScreen)
+        try:
+            return importlib.util.find_spec(self.module_path) is not None
+        except (ImportError, ValueError):
+            return False
+
+
+class MissingScreen:
+    """ Mock for a screen that failed to import; every function just logs """
+    def __init__(self, module_path):
+        self.module_path = module_path
+
+    def __getattr__(self, attr):
+        return lambda *a, **k: print(f"Mock: {self.module_path}.{attr}")
+
+
+def _import_screen(module_path):
+    try:
+        if import_profile and import_profile.enabled():
+            with import_profile.ImportTimer() as timer:
+                module = importlib.import_module(module_path)
+            print(timer.report(module_path))
+            return module
+        return importlib.import_module(module_path)
+    except Exception as e:
+        print(f"❌ IMPORT ERROR ({module_path}): {e}")
+        messagebox.showerror("Module Error", f"Could not load {module_path}:\n{e}")
+        return MissingScreen(module_path)
+
+
+# Visitor
+visitor_form = LazyScreen("src.Api.visitor_screen.visitor_registerment")
+visitor_list = LazyScreen("src.Api.visitor_screen.visitor_list_Info")
+visitor_group = LazyScreen("src.Api.visitor_screen.visitor_group")
+visitor_checkin = LazyScreen("src.Api.visitor_screen.visitor_checkin")
+visitorRegisterDetails = LazyScreen("src.Api.visitor_screen.VisitorRegisterDetails")
+visitorQRconfig = LazyScreen("src.Api.visitor_screen.VisitorQRconfig")
+visitor_appointment = LazyScreen("src.Api.visitor_screen.visitor_appointment")
+
+# Home
+home_screen = LazyScreen("src.Api.Homepage.home_screen")
+diagnostics_screen = LazyScreen("src.Api.Homepage.diagnostics_screen")
+
+# Door
+door_list = LazyScreen("src.Api.Door_screen.door_list_Info")
+linked_doors = LazyScreen("src.Api.Door_screen.linked_door_info")
+region_list = LazyScreen("src.Api.Door_screen.region_list")
+org_creation = LazyScreen("src.Api.Door_screen.org_creation")
+area_creation = LazyScreen("src.Api.Door_screen.area_creation")
+
+# Vehicle
+vehicle_form = LazyScreen("src.Api.vehicle_screen.vehicle_form")
+vehicle_list = LazyScreen("src.Api.vehicle_screen.vehicle_list")
+vehicle_screen = LazyScreen("src.Api.vehicle_screen.vehicle_screen")
+vehicle_group_list = LazyScreen("src.Api.vehicle_screen.vehicle_group_list")
+vehicle_group_form = LazyScreen("src.Api.vehicle_screen.vehicle_group_form")
+
+# Person
+person_form = LazyScreen("src.Api.person_screen.person_form")
+person_list = LazyScreen("src.Api.person_screen.person_list")
+
+# Background services started by init_ui (needed right away, so imported eagerly)
+try: from src.Api.Common_signature import sync
+except ImportError: sync = None
+try: from src.Api.Common_signature import stall_watchdog
+except ImportError: stall_watchdog = None
+if startup_timing: startup_timing.mark("Ui.py imports")
 
 
 # -----------------------------------------
 # WRAPPER FUNCTIONS
 # -----------------------------------------
 def show_add_person():
-    person_form.show_create_form(content_frame, on_success_callback=show_person_list)
+    screens.show_transient(lambda host: person_form.show_create_form(host, on_success_callback=show_person_list))
 
 def show_person_list():
-    person_list.show_list(content_frame)
+    screens.show("person_list", lambda host: person_list.show_list(host, on_saved=show_person_list),
+                 refresh=person_list.refresh)
 
 BG_COLOR = "#D6EAF8"
 root = None
 content_frame = None  
+screens = None   # ScreenManager over content_frame (created in setup_navbar)
 nav = None
 
 # -----------------------------------------
 # NAVIGATION FUNCTIONS
+# Home and the list screens stay alive between visits (screens.show: swap frames + refresh data);
+# forms and the other screens are rebuilt each time (screens.show_transient).
 # -----------------------------------------
-def clear_content():
-    if content_frame:
-        for widget in content_frame.winfo_children():
-            widget.destroy()
-
 def show_home():
-    clear_content()
-    load_home_screen(content_frame)     
+    screens.show("home", home_screen.load_home_screen, refresh=home_screen.refresh_home_screen)
 
 def show_add_visitor():
-    visitor_form.show_register_screen(content_frame, show_home)
+    screens.show_transient(lambda host: visitor_form.show_register_screen(host, show_home))
 
 def show_single_visitor_list_external():
-    visitor_list.show_single_visitor_list(content_frame)
+    screens.show_transient(visitor_list.show_single_visitor_list)
 
 def show_visitor_groups():
-    show_visitor_group_screen(content_frame)
+    screens.show_transient(visitor_group.show_visitor_group_screen)
 
 def show_visitor_register():
-    clear_content()
-    visitorRegisterDetails.render_register_details(content_frame)
+    screens.show_transient(visitorRegisterDetails.render_register_details)
 
 def show_visitor_QR():
-    clear_content()
-    visitorQRconfig.render_qr_config(content_frame, back_callback=content_frame)
+    screens.show_transient(lambda host: visitorQRconfig.render_qr_config(host, back_callback=host))
 
 def show_visitor_checkstatus():
-    clear_content()
-    visitor_checkin.show_checkin_screen(content_frame, show_home)
+    screens.show_transient(lambda host: visitor_checkin.show_checkin_screen(host, show_home))
+
+def show_vehicle_list():
+    screens.show("vehicle_list", lambda host: vehicle_list.show_list(host, on_saved=show_vehicle_list),
+                 refresh=vehicle_list.refresh)
+
+def show_add_vehicle():
+    screens.show_transient(lambda host: vehicle_form.show_vehicle_form(host, show_vehicle_list))
+
+def show_vehicle_group_list():
+    screens.show("vehicle_group_list", lambda host: vehicle_group_list.show_group_list(host, on_saved=show_vehicle_group_list),
+                 refresh=vehicle_group_list.refresh)
+
+def show_add_vehicle_group():
+    screens.show_transient(lambda host: vehicle_group_form.show_group_form(host, show_vehicle_group_list))
+
+def show_parking_list():
+    screens.show_transient(vehicle_screen.show_parking_list)
+
+def show_floor_list():
+    screens.show_transient(vehicle_screen.show_floor_list)
 
 def show_door_list():
-    door_list.show_door_list(content_frame)
+    screens.show_transient(door_list.show_door_list)
 
 def show_linked_doors():
-    linked_doors.show_linked_doors(content_frame)
+    screens.show_transient(linked_doors.show_linked_doors)
+
+def show_region_list():
+    screens.show_transient(region_list.show_region_list)
+
+def show_org_creation():
+    screens.show_transient(org_creation.show_org_creation)
+
+def show_area_creation():
+    screens.show_transient(area_creation.show_area_creation)
+
+def show_diagnostics(event=None):
+    # Hidden screen (Ctrl+Shift+D): per-endpoint API metrics
+    if diagnostics_screen and screens:
+        screens.show_transient(diagnostics_screen.show_diagnostics)
 
 def close_application():
     root.destroy()
@@ -220,16 +277,16 @@ def open_person_dropdown(widget):
 
 def open_vehicle_dropdown(widget):
     menu = create_styled_menu(widget, width=280, height_factor=6)
-    add_menu_item(menu, "Add Vehicle Group", lambda: vehicle_group_form.show_group_form(content_frame, lambda: vehicle_group_list.show_group_list(content_frame)))
-    add_menu_item(menu, "Vehicle Group List", lambda: vehicle_group_list.show_group_list(content_frame))
-    add_menu_item(menu, "Add Vehicle", lambda: vehicle_form.show_vehicle_form(content_frame, lambda: vehicle_list.show_list(content_frame)))
+    add_menu_item(menu, "Add Vehicle Group", show_add_vehicle_group)
+    add_menu_item(menu, "Vehicle Group List", show_vehicle_group_list)
+    add_menu_item(menu, "Add Vehicle", show_add_vehicle)
     # add_menu_item(menu, "Vehicle List", lambda: vehicle_list.show_list(content_frame))
     # Match the function name defined in vehicle_list.py
     # add_menu_item(menu, "Vehicle List", lambda: vehicle_list.show_vehicle_list(content_frame))
     # Use .show_list()
-    add_menu_item(menu, "Vehicle List", lambda: vehicle_list.show_list(content_frame))
-    add_menu_item(menu, "Parking List", lambda: vehicle_screen.show_parking_list(content_frame))
-    add_menu_item(menu, "Floor List", lambda: vehicle_screen.show_floor_list(content_frame))
+    add_menu_item(menu, "Vehicle List", show_vehicle_list)
+    add_menu_item(menu, "Parking List", show_parking_list)
+    add_menu_item(menu, "Floor List", show_floor_list)
     menu.bind("<FocusOut>", lambda e: menu.destroy())
     menu.focus_force()
 
@@ -242,11 +299,11 @@ def open_door_dropdown(widget):
     add_menu_item(menu, "Door List", show_door_list)
     add_menu_item(menu, "Linked Doors", show_linked_doors)
     if region_list:
-        add_menu_item(menu, "Region/Area List", lambda: region_list.show_region_list(content_frame))
+        add_menu_item(menu, "Region/Area List", show_region_list)
     if org_creation:
-        add_menu_item(menu, "Create Org", lambda: org_creation.show_org_creation(content_frame))
+        add_menu_item(menu, "Create Org", show_org_creation)
     elif area_creation:
-        add_menu_item(menu, "Create Area", lambda: area_creation.show_area_creation(content_frame))
+        add_menu_item(menu, "Create Area", show_area_creation)
     menu.bind("<FocusOut>", lambda e: menu.destroy())
     menu.focus_force()
 
@@ -264,9 +321,10 @@ def setup_navbar():
         door_fn=open_door_dropdown,       
         access_fn=lambda: messagebox.showinfo("Info", "Access Control Coming Soon")
     )
-    global content_frame
+    global content_frame, screens
     content_frame = tk.Frame(root, bg=BG_COLOR) 
     content_frame.pack(fill="both", expand=True) 
+    screens = ScreenManager(content_frame, bg=BG_COLOR)
     show_home()
 
 def init_ui():
@@ -279,6 +337,12 @@ def init_ui():
         setup_navbar()
         footer = tk.Label(root, text="© 2025 Indsys Holdings - All rights reserved.", font=("Segoe UI",9), bg=BG_COLOR, fg="#777")
         footer.pack(side="bottom", pady=8)
+        root.bind_all("<Control-Shift-D>", show_diagnostics)
+        if stall_watchdog: stall_watchdog.install(root)
+        if sync: sync.start_scheduler()
+        if startup_timing:
+            startup_timing.mark("build UI")
+            startup_timing.report_when_idle(root)
     except Exception as e:
         messagebox.showerror("Critical Error", f"Failed to load UI:\n{e}")
 
@@ -1,4 +1,11 @@
 import tkinter as tk
+from collections import OrderedDict
+
+# --- IMPORTS ---
+try:
+    from src.Api.Common_signature import circuit_breaker
+except ImportError:
+    circuit_breaker = None
 
 # --- CONFIGURATION ---
 # GRADIENT COLORS (Deep Purple -> Bright Blue)
@@ -9,6 +16,19 @@ HOVER_COLOR = "#FFD700"  # Gold color on hover
 
 FONT_LOGO = ("Segoe UI", 20, "bold")
 FONT_ITEM = ("Segoe UI", 11, "bold")
+FONT_STATUS = ("Segoe UI", 9, "bold")
+
+# Host status dot (circuit breaker state -> color, label)
+STATUS_STYLES = {
+    "closed": ("#34D399", "Online"),
+    "half_open": ("#FBBF24", "Reconnecting..."),
+    "open": ("#F87171", "Offline - cached data"),
+}
+STATUS_POLL_MS = 1000
+
+# Gradient images are rendered for widths rounded up to this step and reused while resizing
+GRADIENT_BUCKET_PX = 64
+GRADIENT_CACHE_SIZE = 8
 
 class GradientHeader(tk.Canvas):
     """
@@ -21,34 +41,54 @@ class GradientHeader(tk.Canvas):
         # Bind resize event to redraw gradient
         self.bind("<Configure>", self._draw_gradient)
         self.items = [] # Store nav items to manage clicks
+        self._gradients = OrderedDict()   # (bucket width, height) -> PhotoImage
+        self._gradient_key = None
 
     def _draw_gradient(self, event=None):
-        """ Draws the horizontal gradient background """
-        self.delete("gradient")
+        """ Shows the horizontal gradient background (one image item, swapped only when the width bucket changes) """
         width = self.winfo_width()
         height = self.winfo_height()
         
         # Don't draw if width is too small (startup)
-        if width < 1: return
-
+        if width < 1 or height < 1: return
+
+        bucket = -(-width // GRADIENT_BUCKET_PX) * GRADIENT_BUCKET_PX
+        key = (bucket, height)
+        if key == self._gradient_key: return
+        self._gradient_key = key
+
+        image = self._gradients.get(key)
+        if image is None:
+            image = self._gradients[key] = self._render_gradient(bucket, height)
+            while len(self._gradients) > GRADIENT_CACHE_SIZE:
+                self._gradients.popitem(last=False)
+        self._gradients.move_to_end(key)
+
+        if self.find_withtag("gradient"):
+            self.itemconfig("gradient", image=image)
+        else:
+            self.create_image(0, 0, image=image, anchor="nw", tags=("gradient",))
+            self.tag_lower("gradient") # Keep gradient behind text
+
+    def _render_gradient(self, width, height):
+        """
+        PhotoImage of the gradient: one row of colors, tiled down to 'height' by Tk.
+        'width' is a bucket; the ramp ends at the narrowest canvas width of that bucket and COLOR_RIGHT
+        fills the rest, so whatever width the image is shown at, its right edge is COLOR_RIGHT.
+        """
         (r1, g1, b1) = self.winfo_rgb(COLOR_LEFT)
         (r2, g2, b2) = self.winfo_rgb(COLOR_RIGHT)
-        
-        # Draw vertical lines to create gradient
-        limit = width
-        r_ratio = (r2 - r1) / limit
-        g_ratio = (g2 - g1) / limit
-        b_ratio = (b2 - b1) / limit
-
-        # Optimization: Draw every 2nd pixel to improve resize performance
-        for i in range(0, limit, 2): 
-            nr = int((r1 + (r_ratio * i)) / 256)
-            ng = int((g1 + (g_ratio * i)) / 256)
-            nb = int((b1 + (b_ratio * i)) / 256)
-            color = "#%4.4x%4.4x%4.4x" % (nr, ng, nb)
-            self.create_line(i, 0, i, height, tags=("gradient",), fill=color, width=3)
-        
-        self.tag_lower("gradient") # Keep gradient behind text
+        last = max(1, width - GRADIENT_BUCKET_PX)   # pixel index where the ramp reaches COLOR_RIGHT
+        r_ratio = (r2 - r1) / last
+        g_ratio = (g2 - g1) / last
+        b_ratio = (b2 - b1) / last
+
+        row = " ".join("#%02x%02x%02x" % (int((r1 + r_ratio * i) / 256),
+                                          int((g1 + g_ratio * i) / 256),
+                                          int((b1 + b_ratio * i) / 256)) for i in (min(i, last) for i in range(width)))
+        image = tk.PhotoImage(master=self, width=width, height=height)
+        image.put("{" + row + "}", to=(0, 0, width, height))
+        return image
 
     def add_logo(self, text, cmd):
         """ Adds the Logo text on the left """
@@ -95,6 +135,32 @@ class GradientHeader(tk.Canvas):
     def add_profile(self):
         """ Adds the Admin Profile on the right """
 
+    def add_status_indicator(self):
+        """ Artemis host status on the right; polls the circuit breaker so worker threads never touch Tk """
+        if circuit_breaker is None: return
+        self.create_oval(0, 0, 10, 10, outline="", tags=("status", "status_dot"))
+        self.create_text(0, 0, fill=TEXT_COLOR, font=FONT_STATUS, anchor="e", tags=("status", "status_text"))
+        self.bind("<Configure>", self._place_status, add="+")
+        self._status_state = None
+        self._poll_status()
+
+    def _place_status(self, event=None):
+        x = self.winfo_width() - 30
+        y = self.winfo_height() // 2
+        self.coords("status_dot", x - 10, y - 5, x, y + 5)
+        self.coords("status_text", x - 16, y)
+
+    def _poll_status(self):
+        snap = circuit_breaker.breaker.snapshot()
+        state = snap["state"]
+        if state != self._status_state:
+            self._status_state = state
+            color, label = STATUS_STYLES.get(state, STATUS_STYLES["closed"])
+            self.itemconfig("status_dot", fill=color)
+            self.itemconfig("status_text", text=label)
+            self._place_status()
+        self.after(STATUS_POLL_MS, self._poll_status)
+
 def render_global_header(root, home_fn, visitor_fn, person_fn, vehicle_fn, door_fn, access_fn):
     """
     Renders the new Gradient Navbar
@@ -119,4 +185,8 @@ def render_global_header(root, home_fn, visitor_fn, person_fn, vehicle_fn, door_
     header.add_nav_items(nav_items)
 
     # 4. Add Profile
-    header.add_profile()
\ No newline at end of file
+    header.add_profile()
+
+    # 5. Host status (circuit breaker)
+    header.add_status_indicator()
+    return header
\ No newline at end of file
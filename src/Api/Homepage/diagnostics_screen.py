@@ -0,0 +1,130 @@
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+from datetime import datetime
+
+# --- IMPORTS ---
+try:
+    from src.Api.Common_signature import common_signature_api
+    from src.Api.Common_signature.metrics import registry
+    from src.Api.Common_signature import stall_watchdog
+except ImportError:
+    common_signature_api = None
+    registry = None
+    stall_watchdog = None
+
+# diagnostics_screen.py  (hidden: Ctrl+Shift+D in Ui.py)
+
+# --- COLORS ---
+BG_MAIN = "#F8F9FA"
+DARK_BLUE_TEXT = "#062F6C"
+TEXT_SEC = "#6B7280"
+
+COLUMNS = (
+    ("endpoint", "Endpoint", 330, "w"),
+    ("calls", "Calls", 60, "center"),
+    ("cache", "Cache Hits", 75, "center"),
+    ("errors", "Errors", 150, "w"),
+    ("status", "HTTP", 90, "center"),
+    ("avg", "Avg ms", 70, "center"),
+    ("p95", "p95 ms", 70, "center"),
+    ("max", "Max ms", 70, "center"),
+    ("bytes", "KB out / in", 110, "center"),
+)
+
+
+def _fmt_ms(value):
+    if value is None: return "-"
+    if value == float("inf"): return ">10s"
+    return f"{value:g}"
+
+
+def refresh(tree, summary_var):
+    for item in tree.get_children():
+        tree.delete(item)
+
+    snap = registry.snapshot() if registry else {}
+    for i, (path, m) in enumerate(snap.items()):
+        errors = ", ".join(f"{code}×{n}" for code, n in sorted(m["errors"].items())) or "-"
+        status = ", ".join(f"{s}×{n}" for s, n in sorted(m["http_status"].items())) or "-"
+        tree.insert("", "end", tags=("even" if i % 2 == 0 else "odd",), values=(
+            path.replace("/artemis/api", ""), m["calls"], m["cache_hits"], errors, status,
+            _fmt_ms(m["avg_ms"]), _fmt_ms(m["p95_ms"]), _fmt_ms(m["max_ms"]),
+            f"{m['bytes_out'] / 1024:.1f} / {m['bytes_in'] / 1024:.1f}",
+        ))
+
+    parts = [f"Endpoints: {len(snap)}", f"Calls: {sum(m['calls'] for m in snap.values())}"]
+    if common_signature_api:
+        s = common_signature_api.session_stats()
+        c = common_signature_api.cache_stats()
+        parts.append(f"Sockets: {s['connections']} opened / {s['reused']} reused")
+        parts.append(f"Cache: {c['entries']} entries, {c['hits']} hits / {c['misses']} misses")
+        parts.append(f"Coalesced: {common_signature_api.coalescing_stats()['coalesced']}")
+        b = common_signature_api.breaker_state()
+        parts.append(f"Circuit: {b['state']}" + (f" (probe in {b['retry_in']:g}s)" if b["state"] == "open" else ""))
+    watchdog = stall_watchdog.get_watchdog() if stall_watchdog else None
+    if watchdog and watchdog.reports:
+        last = watchdog.reports[-1]
+        parts.append(f"UI stalls: {len(watchdog.reports)} (last {last['duration_ms']} ms in {last['function']})")
+    parts.append(f"Updated {datetime.now().strftime('%H:%M:%S')}")
+    summary_var.set("   •   ".join(parts))
+
+
+def export_prometheus(parent):
+    if not registry: return
+    path = filedialog.asksaveasfilename(parent=parent, title="Export Prometheus metrics",
+                                        defaultextension=".prom", initialfile="vms_artemis.prom",
+                                        filetypes=[("Prometheus text", "*.prom"), ("All files", "*.*")])
+    if not path: return
+    try:
+        registry.write_prometheus(path)
+        messagebox.showinfo("Exported", f"Metrics written to:\n{path}")
+    except OSError as e:
+        messagebox.showerror("Export Failed", str(e))
+
+
+def reset_metrics(tree, summary_var):
+    if registry and messagebox.askyesno("Reset", "Clear all collected API metrics?"):
+        registry.reset()
+        refresh(tree, summary_var)
+
+
+def show_diagnostics(parent_frame):
+    for w in parent_frame.winfo_children(): w.destroy()
+    parent_frame.config(bg=BG_MAIN)
+
+    # --- HEADER ---
+    header = tk.Frame(parent_frame, bg=BG_MAIN, pady=20, padx=30)
+    header.pack(fill="x")
+    tk.Label(header, text="API Diagnostics", font=("Segoe UI", 22, "bold"), fg=DARK_BLUE_TEXT, bg=BG_MAIN).pack(side="left")
+
+    summary_var = tk.StringVar(value="-")
+
+    right = tk.Frame(header, bg=BG_MAIN)
+    right.pack(side="right")
+
+    # --- TABLE ---
+    table_outer = tk.Frame(parent_frame, bg="white", highlightbackground="#E5E7EB", highlightthickness=1)
+    table_outer.pack(fill="both", expand=True, padx=30, pady=(0, 10))
+
+    tree = ttk.Treeview(table_outer, columns=[c[0] for c in COLUMNS], show="headings")
+    for key, title, width, anchor in COLUMNS:
+        tree.heading(key, text=title, anchor=anchor)
+        tree.column(key, width=width, anchor=anchor, stretch=(key == "endpoint"))
+    sb = ttk.Scrollbar(table_outer, orient="vertical", command=tree.yview)
+    tree.configure(yscroll=sb.set)
+    sb.pack(side="right", fill="y")
+    tree.pack(fill="both", expand=True)
+    tree.tag_configure("odd", background="white")
+    tree.tag_configure("even", background="#F9FAFB")
+
+    tk.Button(right, text="Export .prom", bg="white", bd=1, padx=12,
+              command=lambda: export_prometheus(parent_frame)).pack(side="right", padx=5)
+    tk.Button(right, text="Reset", bg="white", bd=1, padx=12,
+              command=lambda: reset_metrics(tree, summary_var)).pack(side="right", padx=5)
+    tk.Button(right, text=" ↻ Refresh ", bg="#2563EB", fg="white", bd=0, padx=15, pady=4,
+              command=lambda: refresh(tree, summary_var)).pack(side="right", padx=5)
+
+    tk.Label(parent_frame, textvariable=summary_var, font=("Segoe UI", 9), fg=TEXT_SEC, bg=BG_MAIN,
+             anchor="w").pack(fill="x", padx=30, pady=(0, 15))
+
+    refresh(tree, summary_var)
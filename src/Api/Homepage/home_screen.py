@@ -7,8 +7,12 @@ from datetime import datetime
 # --- IMPORTS ---
 try:
     from src.Api.Common_signature import common_signature_api
+    from src.Api.Common_signature.pagination import fetch_all
+    from src.Api.Common_signature import sync
 except ImportError:
     common_signature_api = None
+    fetch_all = None
+    sync = None
 
 # --- API ENDPOINTS ---
 API_VISITOR_INFO = "/artemis/api/visitor/v1/visitor/visitorInfo"
@@ -23,6 +27,12 @@ HEADER_BG = "#F3F4F6"
 BORDER_COLOR = "#E5E7EB"  
 DARK_BLUE_TEXT = "#062F6C" 
 
+DASHBOARD_ROWS = 500   # Latest appointments shown in the activity table (one Artemis page, as before the mirror)
+
+# Widgets of the rendered dashboard (the screen stays alive between visits, see refresh_home_screen)
+dashboard_stats = None
+dashboard_table = None
+
 
 def call_api(url, payload):
     if not common_signature_api: return None
@@ -51,17 +61,22 @@ def fetch_dashboard_data(vars_dict, tree):
         try: data_info = json.loads(data_info)
         except: pass
 
-    # --- 2. Fetch Appointments ---
-    payload_app = {
-        "pageNo": 1,
-        "pageSize": 500,
-        "appointStartTime": start_time,
-        "appointEndTime": end_time
-    }
-    data_app = call_api(API_APPOINTMENT_LIST, payload_app)
-    if isinstance(data_app, str): 
-        try: data_app = json.loads(data_app)
-        except: pass
+    # --- 2. Appointments: delta pull into the local mirror, then read it back ---
+    app_list = []
+    try:
+        if sync:
+            sync.sync_entity("appointments")
+        else:
+            payload_app = {"appointStartTime": start_time, "appointEndTime": end_time}
+            app_list = fetch_all(API_APPOINTMENT_LIST, payload_app, page_size=DASHBOARD_ROWS, limit=DASHBOARD_ROWS)
+    except Exception as e:
+        print(f"API Error: {e}")
+    if sync:
+        # Also covers the offline case: whatever was synced before is still shown.
+        # Only the latest window is read; SQLite sorts on the indexed start time.
+        app_list = sync.local_store.get_store().query(
+            "appointments", between={"appointStartTime": (start_time, end_time)},
+            order_by="appointStartTime DESC", limit=DASHBOARD_ROWS)
 
     # --- PROCESS STATS ---
     real_total_visitors = 0
@@ -80,9 +95,7 @@ def fetch_dashboard_data(vars_dict, tree):
     # --- PROCESS GRID ---
     grid_rows = []
     
-    if data_app and data_app.get("code") == "0":
-        app_list = data_app.get("data", {}).get("list", [])
-        
+    if app_list:
         for r in app_list:
             v_info = r.get("visitorInfo", {})
             
@@ -152,7 +165,13 @@ def create_stat_card(parent, title, var, icon_char, color):
     
     tk.Label(inner, textvariable=var, font=("Segoe UI", 36, "bold"), fg=TEXT_PRI, bg=BG_CARD).pack(anchor="w", pady=(8,0))
 
+def refresh_home_screen():
+    """ Screen manager hook: reload the figures of the dashboard that is already on screen """
+    if dashboard_stats is None or dashboard_table is None: return
+    threading.Thread(target=fetch_dashboard_data, args=(dashboard_stats, dashboard_table), daemon=True).start()
+
 def load_home_screen(parent_frame):
+    global dashboard_stats, dashboard_table
     for w in parent_frame.winfo_children(): w.destroy()
     parent_frame.config(bg=BG_MAIN)
     
@@ -252,4 +271,5 @@ def load_home_screen(parent_frame):
     table.tag_configure("odd", background="white")
     table.tag_configure("even", background="#F9FAFB")
 
+    dashboard_stats, dashboard_table = stats, table
     threading.Thread(target=fetch_dashboard_data, args=(stats, table), daemon=True).start()
\ No newline at end of file
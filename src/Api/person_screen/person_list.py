@@ -5,13 +5,21 @@ import json
 
 # Try importing your API handler
 try:
-    import Api.Common_signature.common_signature_api as api_handler
+    import src.Api.Common_signature.common_signature_api as api_handler
+    from src.Api.Common_signature.async_client import call_api_async
+    from src.Api.Common_signature import local_store
+    from src.Api.Common_signature.live_search import LiveSearch
+    from src.Api.Common_signature.page_cache import PageCache
 except ImportError:
     api_handler = None
+    call_api_async = None
+    local_store = None
+    LiveSearch = None
+    PageCache = None
 
 # IMPORT THE ACTION GRID
 try:
-    from Api.Common_signature.action_grid import ActionGrid 
+    from src.Api.Common_signature.action_grid import ActionGrid 
 except ImportError:
     print("⚠️ ActionGrid not found. Icons will be missing.")
     ActionGrid = None
@@ -40,20 +48,27 @@ current_page = 1
 page_size = 15  
 total_records = 0
 person_cache = [] 
+load_seq = 0  # Bumped per request so late responses for old pages are ignored
+page_cache = PageCache() if PageCache else None  # Prefetched neighbour pages, so Next / Prev render at once
 
 table = None
 pagination_frame = None
 name_var = None
 id_var = None
+live_search = None
 main_frame_ref = None 
+saved_callback = None  # Caller's entry point for "back to the list" after a form save (Ui.show_person_list)
 
-def show_list(content_frame):
+def show_list(content_frame, on_saved=None):
     """
     Main entry point to render the Person List screen.
+    on_saved: called instead of rebuilding in place once a form opened from here saves.
     """
-    global table, pagination_frame, name_var, id_var, current_page, main_frame_ref
+    global table, pagination_frame, name_var, id_var, current_page, main_frame_ref, live_search, saved_callback
     main_frame_ref = content_frame
+    saved_callback = on_saved
     current_page = 1 
+    if page_cache: page_cache.invalidate()
 
     # 1. Clear previous content
     for widget in content_frame.winfo_children():
@@ -78,20 +93,23 @@ def show_list(content_frame):
     tk.Label(search_frame, text="Person Name:", bg=BG_COLOR, font=("Segoe UI", 10)).pack(side="left")
     entry_name = ttk.Entry(search_frame, textvariable=name_var, width=20)
     entry_name.pack(side="left", padx=(5, 15))
-    entry_name.bind("<Return>", lambda e: load_data(1))
+    entry_name.bind("<Return>", lambda e: run_search())
     
     tk.Label(search_frame, text="Person ID:", bg=BG_COLOR, font=("Segoe UI", 10)).pack(side="left")
     entry_id = ttk.Entry(search_frame, textvariable=id_var, width=15)
     entry_id.pack(side="left", padx=(5, 15))
-    entry_id.bind("<Return>", lambda e: load_data(1))
+    entry_id.bind("<Return>", lambda e: run_search())
 
     # Buttons
     tk.Button(search_frame, text="🔍 Search", bg=PRIMARY_COLOR, fg="white", bd=0, padx=15, 
-              command=lambda: load_data(1)).pack(side="left", padx=5)
+              command=run_search).pack(side="left", padx=5)
     
     tk.Button(search_frame, text="✖ Clear", bg="white", fg="#7F8C8D", bd=1, padx=10, 
               command=lambda: clear_search()).pack(side="left")
 
+    # Search as you type (debounced; one request once typing pauses)
+    live_search = LiveSearch(search_frame, [name_var, id_var], lambda: load_data(1)) if LiveSearch else None
+
     # --- ACTION GRID ---
     tree_frame = tk.Frame(content_frame, bg="white")
     tree_frame.pack(fill="both", expand=True, padx=20, pady=10)
@@ -110,7 +128,8 @@ def show_list(content_frame):
             tree_frame,
             columns=cols,
             edit_command=handle_edit_click,
-            delete_command=handle_delete_click
+            delete_command=handle_delete_click,
+            row_key="personCode"
         )
         table.pack(fill="both", expand=True)
     else:
@@ -126,7 +145,7 @@ def show_list(content_frame):
 # ================= LOGIC =================
 
 def load_data(page):
-    global current_page, total_records, person_cache
+    global current_page, load_seq
     current_page = page
     
     # 1. Base Payload
@@ -147,45 +166,110 @@ def load_data(page):
         # 'personId' is usually the hidden internal UUID.
         payload["personCode"] = p_id 
 
-    # 3. Call API
-    if api_handler:
-        res = api_handler.call_api(API_PERSON_LIST, payload)
-        
-        if res and str(res.get("code")) == "0":
-            data = res.get("data", {})
-            rows = data.get("list", [])
-            total_records = data.get("total", 0)
-            
-            person_cache = rows 
-
-            formatted_rows = []
-            for r in rows:
-                new_row = r.copy()
-                g_val = str(r.get("gender", ""))
-                new_row["gender"] = "Male" if g_val == "1" else "Female" if g_val == "2" else "-"
-
-                cards_list = r.get("cards", [])
-                if cards_list and len(cards_list) > 0:
-                    # Take the first card number
-                    new_row["cardNo"] = cards_list[0].get("cardNo", "-")
-                else:
-                    new_row["cardNo"] = "-"
-
-                formatted_rows.append(new_row)
-                if not new_row.get("orgPathName"):
-                    new_row["orgPathName"] = new_row.get("orgName", "-")
-                formatted_rows.append(new_row)
-
-
-            if table: table.render_data(formatted_rows)
-            render_pagination()
-        else:
-            if table: table.render_data([]) 
-            render_pagination()
+    # 3. Render instantly from the local mirror, then refresh from Artemis in the background
+    if api_handler and call_api_async:
+        load_seq += 1
+        seq = load_seq
+        filters = {k: v for k, v in payload.items() if k != "pageNo"}
+        cached = page_cache.get(filters, current_page) if page_cache else None
+        if cached is not None:
+            on_data_loaded(cached, seq, filters, from_cache=True)
+            return
+        if not show_cached_page() and table: table.show_loading()
+        call_api_async(
+            table or pagination_frame, API_PERSON_LIST, payload,
+            on_success=lambda res: on_data_loaded(res, seq, filters),
+            on_error=lambda e: on_data_failed(e, seq)
+        )
     else:
         if table: table.render_data([])
 
 
+def show_cached_page():
+    """ Renders the current page from SQLite; returns False when nothing is cached for it """
+    if not local_store: return False
+    where, like = {}, {}
+    if name_var.get().strip(): like["personName"] = name_var.get().strip()
+    if id_var.get().strip(): where["personCode"] = id_var.get().strip()
+
+    rows, total = local_store.cached_page("persons", current_page, page_size, where=where, like=like)
+    if not rows: return False
+    show_rows(rows, total)
+    return True
+
+
+def on_data_loaded(res, seq, filters=None, from_cache=False):
+    """ Renders a list response; from_cache=True for a PageCache hit (already stored, so only rendered) """
+    if seq != load_seq: return  # A newer page/search was requested meanwhile
+
+    if res and str(res.get("code")) == "0":
+        data = res.get("data", {})
+        rows = data.get("list", [])
+        if not from_cache:
+            if local_store: local_store.remember("persons", rows)
+            if page_cache and filters is not None: page_cache.put(filters, current_page, res)
+        show_rows(rows, data.get("total", 0))
+        prefetch_neighbours(filters)
+    else:
+        if table: table.render_data([]) 
+        render_pagination()
+
+
+def prefetch_neighbours(filters):
+    """ Loads the Next / Prev pages in the background once the current page has rendered """
+    if not page_cache or filters is None: return
+    total_pages = math.ceil(total_records / page_size) if total_records else 1
+    page_cache.prefetch(table or pagination_frame, filters, current_page, total_pages,
+                        lambda page: fetch_page(filters, page))
+
+
+def fetch_page(filters, page):
+    """ Worker thread: one list page (mirrored like a page that was shown), or None for an error code or a non-JSON-object body """
+    res = api_handler.request_json(API_PERSON_LIST, dict(filters, pageNo=page))
+    if not (isinstance(res, dict) and str(res.get("code")) == "0"): return None
+    if local_store: local_store.remember("persons", (res.get("data") or {}).get("list", []))
+    return res
+
+
+def show_rows(rows, total):
+    global total_records, person_cache
+    total_records = total
+    person_cache = rows 
+
+    formatted_rows = []
+    for r in rows:
+        new_row = r.copy()
+        g_val = str(r.get("gender", ""))
+        new_row["gender"] = "Male" if g_val == "1" else "Female" if g_val == "2" else "-"
+
+        cards_list = r.get("cards", [])
+        if cards_list and len(cards_list) > 0:
+            # Take the first card number
+            new_row["cardNo"] = cards_list[0].get("cardNo", "-")
+        else:
+            new_row["cardNo"] = "-"
+
+        if not new_row.get("orgPathName"):
+            new_row["orgPathName"] = new_row.get("orgName", "-")
+        formatted_rows.append(new_row)
+
+
+    if table: table.render_data(formatted_rows)
+    render_pagination()
+
+
+def on_data_failed(error, seq):
+    if seq != load_seq: return
+    # Host unreachable -> keep showing whatever the local mirror has
+    shown = show_cached_page()
+    if not shown:
+        if table: table.render_data([])
+        render_pagination()
+    # With the circuit open the header already says the host is down; only interrupt if nothing is cached
+    if not (shown and isinstance(error, api_handler.CircuitOpenError)):
+        api_handler.report_api_error(error)
+
+
 def render_pagination():
     for w in pagination_frame.winfo_children(): w.destroy()
     
@@ -207,14 +291,31 @@ def render_pagination():
     tk.Label(pagination_frame, text=f"(Total: {total_records})", bg=BG_COLOR, fg=LABEL_COLOR).pack(side="right", padx=20)
 
 
+def run_search():
+    """ Enter / Search button: search now instead of waiting for the debounce """
+    if live_search: live_search.flush()
+    else: load_data(1)
+
+
 def clear_search():
     name_var.set("")
     id_var.set("")
-    load_data(1)
+    run_search()
+
+
+def refresh():
+    """ Screen manager hook: the kept-alive list is shown again, reload the current page (it may have changed meanwhile) """
+    if page_cache: page_cache.invalidate()
+    load_data(current_page)
 
 
 # ================= ACTION HANDLERS =================
 
+def back_to_list():
+    """ Form success callback; going through the caller's entry point keeps its screen manager in sync """
+    if saved_callback: saved_callback()
+    else: show_list(main_frame_ref)
+
 def handle_edit_click(row_data):
     p_code = str(row_data.get("personCode"))
     person_obj = next((p for p in person_cache if str(p.get("personCode")) == p_code), row_data)
@@ -222,7 +323,7 @@ def handle_edit_click(row_data):
     if person_form:
         person_form.show_create_form(
             main_frame_ref, 
-            on_success_callback=lambda: show_list(main_frame_ref), 
+            on_success_callback=back_to_list, 
             edit_data=person_obj
         )
 
@@ -237,5 +338,7 @@ def handle_delete_click(row_data):
     if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete?\n\nName: {name}\nCode: {p_code}"):
         success = person_delete.delete_by_code(p_code)
         if success:
+            if local_store: local_store.forget("persons", personCode=p_code)
             messagebox.showinfo("Deleted", "Person deleted successfully.")
+            if page_cache: page_cache.invalidate()
             load_data(current_page)
\ No newline at end of file
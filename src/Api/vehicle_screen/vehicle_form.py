@@ -7,8 +7,10 @@ import json
 # --- IMPORTS ---
 try:
     from src.Api.Common_signature import common_signature_api
+    from src.Api.Common_signature.pagination import iter_records, fetch_all
 except ImportError:
     common_signature_api = None
+    iter_records = fetch_all = None
 
 # API Endpoints
 API_ADD_VEHICLE    = "/artemis/api/resource/v1/vehicle/single/add"
@@ -104,9 +106,8 @@ def show_vehicle_form(content_frame, on_success_callback=None, edit_data=None):
     def fetch_groups():
         if not common_signature_api: return
         try:
-            res = common_signature_api.call_api(API_GROUP_LIST, {"pageNo": 1, "pageSize": 100})
-            if res and str(res.get("code")) == "0":
-                rows = res.get("data", {}).get("list", [])
+            rows = fetch_all(API_GROUP_LIST)
+            if rows:
                 group_options = [f"{g['vehicleGroupIndexCode']} - {g['vehicleGroupName']}" for g in rows]
                 combo_group['values'] = group_options
                 
@@ -145,18 +146,20 @@ def show_vehicle_form(content_frame, on_success_callback=None, edit_data=None):
         code = var_search_code.get().strip()
         if not code: return
         if common_signature_api:
-            # Client-side filter for person code
-            res = common_signature_api.call_api(API_PERSON_LIST, {"pageNo": 1, "pageSize": 100})
-            if res and str(res.get("code")) == "0":
-                data = res.get("data", {}).get("list", [])
-                found = next((p for p in data if str(p.get("personCode")) == code), None)
-                if found:
-                    var_person_id.set(found.get("personId", ""))
-                    var_given_name.set(found.get("personName", ""))
-                    var_phone.set(found.get("phoneNo", ""))
-                    messagebox.showinfo("Found", f"Person: {found.get('personName')}")
-                else:
-                    messagebox.showerror("Not Found", "Person Code not found.")
+            # Client-side filter for person code; pages are streamed only until the match is found
+            try:
+                people = iter_records(API_PERSON_LIST, {"personCode": code})
+                found = next((p for p in people if str(p.get("personCode")) == code), None)
+            except Exception as e:
+                common_signature_api.report_api_error(e)
+                return
+            if found:
+                var_person_id.set(found.get("personId", ""))
+                var_given_name.set(found.get("personName", ""))
+                var_phone.set(found.get("phoneNo", ""))
+                messagebox.showinfo("Found", f"Person: {found.get('personName')}")
+            else:
+                messagebox.showerror("Not Found", "Person Code not found.")
 
     btn_search = tk.Button(search_container, text="🔍 Fetch", bg="#17a2b8", fg="white", bd=0, command=fetch_person)
     btn_search.pack(side="left", padx=5)
@@ -4,12 +4,18 @@ import math
 
 # --- IMPORTS ---
 try:
-    import Api.Common_signature.common_signature_api as api_handler
+    import src.Api.Common_signature.common_signature_api as api_handler
+    from src.Api.Common_signature import local_store
+    from src.Api.Common_signature.async_client import call_api_async
+    from src.Api.Common_signature.page_cache import PageCache
 except ImportError:
     api_handler = None
+    local_store = None
+    call_api_async = None
+    PageCache = None
 
 try:
-    from Api.Common_signature.action_grid import ActionGrid
+    from src.Api.Common_signature.action_grid import ActionGrid
 except ImportError:
     ActionGrid = None
 
@@ -35,16 +41,22 @@ current_page = 1
 page_size = 20
 total_records = 0
 group_cache = []
+load_seq = 0  # Bumped per request so late responses for old pages are ignored
+page_cache = PageCache() if PageCache else None  # Prefetched neighbour pages, so Next / Prev render at once
 
 table = None
 pagination_frame = None
 name_var = None
 main_frame_ref = None
+saved_callback = None  # Caller's entry point for "back to the list" after a form save (Ui.show_vehicle_group_list)
 
-def show_group_list(content_frame):
-    global table, pagination_frame, name_var, current_page, main_frame_ref
+def show_group_list(content_frame, on_saved=None):
+    """ on_saved: called instead of rebuilding in place once a form opened from here saves """
+    global table, pagination_frame, name_var, current_page, main_frame_ref, saved_callback
     main_frame_ref = content_frame
+    saved_callback = on_saved
     current_page = 1
+    if page_cache: page_cache.invalidate()
 
     # 1. Setup UI
     for widget in content_frame.winfo_children(): widget.destroy()
@@ -58,7 +70,7 @@ def show_group_list(content_frame):
     # Add New Button
     tk.Button(header, text="+ Add Group", bg="#28a745", fg="white", font=("Segoe UI", 10, "bold"),
               padx=15, pady=5, bd=0, cursor="hand2",
-              command=lambda: vehicle_group_form.show_group_form(content_frame, lambda: show_group_list(content_frame))
+              command=lambda: vehicle_group_form.show_group_form(content_frame, back_to_list)
               ).pack(side="right")
 
     # Search Bar
@@ -94,7 +106,8 @@ def show_group_list(content_frame):
             tree_frame,
             columns=cols,
             edit_command=handle_edit,
-            delete_command=handle_delete
+            delete_command=handle_delete,
+            row_key="vehicleGroupIndexCode"
         )
         table.pack(fill="both", expand=True)
     else:
@@ -108,7 +121,7 @@ def show_group_list(content_frame):
 
 # ================= LOGIC =================
 def load_data(page):
-    global current_page, total_records, group_cache
+    global current_page, load_seq
     current_page = page
     
     # Payload
@@ -120,20 +133,20 @@ def load_data(page):
     if name_var.get().strip():
         payload["vehicleGroupName"] = name_var.get().strip() # Also updated filter key
 
-    if api_handler:
-        res = api_handler.call_api(API_GROUP_LIST, payload)
-        
-        if res and str(res.get("code")) == "0":
-            data = res.get("data", {})
-            rows = data.get("list", [])
-            total_records = data.get("total", 0)
-            group_cache = rows 
-
-            if table: table.render_data(rows)
-            render_pagination()
-        else:
-            if table: table.render_data([])
-            render_pagination()
+    if api_handler and call_api_async:
+        load_seq += 1
+        seq = load_seq
+        filters = {k: v for k, v in payload.items() if k != "pageNo"}
+        cached = page_cache.get(filters, current_page) if page_cache else None
+        if cached is not None:
+            on_data_loaded(cached, seq, filters, from_cache=True)
+            return
+        if table: table.show_loading()
+        call_api_async(
+            table or pagination_frame, API_GROUP_LIST, payload,
+            on_success=lambda res: on_data_loaded(res, seq, filters),
+            on_error=lambda e: on_data_failed(e, seq)
+        )
     else:
         # Mock Data (Updated keys)
         if table: table.render_data([
@@ -141,6 +154,47 @@ def load_data(page):
             {"vehicleGroupIndexCode": "2", "vehicleGroupName": "Visitor", "parentIndexCode": "0", "description": "Guests"}
         ])
 
+def on_data_loaded(res, seq, filters=None, from_cache=False):
+    """ Renders a list response; from_cache=True for a PageCache hit (already stored, so only rendered) """
+    global total_records, group_cache
+    if seq != load_seq: return  # A newer page/search was requested meanwhile
+
+    if res and str(res.get("code")) == "0":
+        data = res.get("data", {})
+        rows = data.get("list", [])
+        total_records = data.get("total", 0)
+        group_cache = rows 
+        if not from_cache:
+            if local_store: local_store.remember("vehicle_groups", rows)
+            if page_cache and filters is not None: page_cache.put(filters, current_page, res)
+
+        if table: table.render_data(rows)
+        render_pagination()
+        prefetch_neighbours(filters)
+    else:
+        if table: table.render_data([])
+        render_pagination()
+
+def on_data_failed(error, seq):
+    if seq != load_seq: return
+    if table: table.render_data([])
+    render_pagination()
+    api_handler.report_api_error(error)
+
+def prefetch_neighbours(filters):
+    """ Loads the Next / Prev pages in the background once the current page has rendered """
+    if not page_cache or filters is None: return
+    total_pages = math.ceil(total_records / page_size) if total_records else 1
+    page_cache.prefetch(table or pagination_frame, filters, current_page, total_pages,
+                        lambda page: fetch_page(filters, page))
+
+def fetch_page(filters, page):
+    """ Worker thread: one list page (mirrored like a page that was shown), or None for an error code or a non-JSON-object body """
+    res = api_handler.request_json(API_GROUP_LIST, dict(filters, pageNo=page))
+    if not (isinstance(res, dict) and str(res.get("code")) == "0"): return None
+    if local_store: local_store.remember("vehicle_groups", (res.get("data") or {}).get("list", []))
+    return res
+
 def render_pagination():
     for w in pagination_frame.winfo_children(): w.destroy()
     
@@ -161,7 +215,17 @@ def render_pagination():
 
     tk.Label(pagination_frame, text=f"(Total: {total_records})", bg=BG_COLOR, fg="#7F8C8D").pack(side="right", padx=20)
 
+def refresh():
+    """ Screen manager hook: the kept-alive list is shown again, reload the current page (it may have changed meanwhile) """
+    if page_cache: page_cache.invalidate()
+    load_data(current_page)
+
 # ================= HANDLERS =================
+def back_to_list():
+    """ Form success callback; going through the caller's entry point keeps its screen manager in sync """
+    if saved_callback: saved_callback()
+    else: show_group_list(main_frame_ref)
+
 def handle_edit(row_data):
     # ✅ Corrected Key
     code = str(row_data.get("vehicleGroupIndexCode"))
@@ -170,7 +234,7 @@ def handle_edit(row_data):
     if vehicle_group_form:
         vehicle_group_form.show_group_form(
             main_frame_ref, 
-            on_success_callback=lambda: show_group_list(main_frame_ref), 
+            on_success_callback=back_to_list, 
             edit_data=obj
         )
 
@@ -181,5 +245,7 @@ def handle_delete(row_data):
     
     if messagebox.askyesno("Confirm Delete", f"Delete Group '{name}'?"):
         if vehicle_group_delete and vehicle_group_delete.delete_group(code):
+            if local_store: local_store.forget("vehicle_groups", key=code)
             messagebox.showinfo("Deleted", "Group deleted successfully.")
+            if page_cache: page_cache.invalidate()
             load_data(current_page)
\ No newline at end of file
@@ -4,12 +4,22 @@ import math
 
 # --- IMPORTS ---
 try:
-    import Api.Common_signature.common_signature_api as api_handler
+    import src.Api.Common_signature.common_signature_api as api_handler
+    from src.Api.Common_signature.async_client import call_api_async
+    from src.Api.Common_signature.pagination import fetch_all
+    from src.Api.Common_signature import local_store
+    from src.Api.Common_signature.live_search import LiveSearch
+    from src.Api.Common_signature.page_cache import PageCache
 except ImportError:
     api_handler = None
+    call_api_async = None
+    fetch_all = None
+    local_store = None
+    LiveSearch = None
+    PageCache = None
 
 try:
-    from Api.Common_signature.action_grid import ActionGrid
+    from src.Api.Common_signature.action_grid import ActionGrid
 except ImportError:
     ActionGrid = None
 
@@ -41,20 +51,27 @@ current_page = 1
 page_size = 10
 total_records = 0
 vehicle_cache = []
+load_seq = 0  # Bumped per request so late responses for old pages are ignored
+page_cache = PageCache() if PageCache else None  # Prefetched neighbour pages, so Next / Prev render at once
 
 table = None
 pagination_frame = None
 plate_var = None
 group_combo = None
 main_frame_ref = None
+live_search = None
+saved_callback = None  # Caller's entry point for "back to the list" after a form save (Ui.show_vehicle_list)
 
-def show_list(content_frame):
+def show_list(content_frame, on_saved=None):
     """
     Renamed to show_list to match other modules.
+    on_saved: called instead of rebuilding in place once a form opened from here saves.
     """
-    global table, pagination_frame, plate_var, group_combo, current_page, main_frame_ref
+    global table, pagination_frame, plate_var, group_combo, current_page, main_frame_ref, live_search, saved_callback
     main_frame_ref = content_frame
+    saved_callback = on_saved
     current_page = 1
+    if page_cache: page_cache.invalidate()
 
     # 1. Setup UI
     for widget in content_frame.winfo_children(): widget.destroy()
@@ -68,7 +85,7 @@ def show_list(content_frame):
     # Add Button
     tk.Button(header, text="+ Add Vehicle", bg="#28a745", fg="white", font=("Segoe UI", 10, "bold"),
               padx=15, pady=5, bd=0, cursor="hand2",
-              command=lambda: vehicle_form.show_vehicle_form(content_frame, lambda: show_list(content_frame))
+              command=lambda: vehicle_form.show_vehicle_form(content_frame, back_to_list)
               ).pack(side="right")
 
     # --- Search Bar ---
@@ -78,21 +95,27 @@ def show_list(content_frame):
     # Plate Filter
     plate_var = tk.StringVar()
     tk.Label(search_frame, text="Plate No:", bg=BG_COLOR, font=("Segoe UI", 10)).pack(side="left")
-    ttk.Entry(search_frame, textvariable=plate_var, width=15).pack(side="left", padx=(5, 15))
+    entry_plate = ttk.Entry(search_frame, textvariable=plate_var, width=15)
+    entry_plate.pack(side="left", padx=(5, 15))
+    entry_plate.bind("<Return>", lambda e: run_search())
 
     # Group Filter (Dropdown)
     tk.Label(search_frame, text="Group:", bg=BG_COLOR, font=("Segoe UI", 10)).pack(side="left")
     group_combo = ttk.Combobox(search_frame, width=20, state="readonly")
     group_combo.pack(side="left", padx=(5, 15))
+    group_combo.bind("<<ComboboxSelected>>", lambda e: run_search())
     
     load_group_options()
 
     tk.Button(search_frame, text="🔍 Search", bg=PRIMARY_COLOR, fg="white", bd=0, padx=15, 
-              command=lambda: load_data(1)).pack(side="left", padx=5)
+              command=run_search).pack(side="left", padx=5)
     
     tk.Button(search_frame, text="✖ Clear", bg="white", fg="#7F8C8D", bd=1, padx=10, 
               command=clear_search).pack(side="left")
 
+    # Search as you type (debounced; one request once typing pauses)
+    live_search = LiveSearch(search_frame, [plate_var], lambda: load_data(1)) if LiveSearch else None
+
     # --- Action Grid ---
     tree_frame = tk.Frame(content_frame, bg="white")
     tree_frame.pack(fill="both", expand=True, padx=20, pady=10)
@@ -110,7 +133,8 @@ def show_list(content_frame):
             tree_frame,
             columns=cols,
             edit_command=handle_edit,
-            delete_command=handle_delete
+            delete_command=handle_delete,
+            row_key="plateNo"
         )
         table.pack(fill="both", expand=True)
     else:
@@ -127,9 +151,9 @@ def load_group_options():
     """ Fetches vehicle groups to populate the search dropdown """
     if not api_handler: return
     try:
-        res = api_handler.call_api(API_GROUP_LIST, {"pageNo": 1, "pageSize": 100})
-        if res and str(res.get("code")) == "0":
-            rows = res.get("data", {}).get("list", [])
+        rows = fetch_all(API_GROUP_LIST)
+        if local_store: local_store.remember("vehicle_groups", rows)
+        if rows:
             options = ["All"] + [f"{g['vehicleGroupIndexCode']} - {g['vehicleGroupName']}" for g in rows]
             group_combo['values'] = options
             group_combo.current(0)
@@ -137,7 +161,7 @@ def load_group_options():
         pass
 
 def load_data(page):
-    global current_page, total_records, vehicle_cache
+    global current_page, load_seq
     current_page = page
     
     payload = {
@@ -153,32 +177,95 @@ def load_data(page):
         gid = group_val.split(" - ")[0]
         payload["vehicleGroupIndexCode"] = gid
 
-    if api_handler:
-        res = api_handler.call_api(API_VEHICLE_LIST, payload)
-        
-        if res and str(res.get("code")) == "0":
-            data = res.get("data", {})
-            rows = data.get("list", [])
-            total_records = data.get("total", 0)
-            vehicle_cache = rows 
-
-            formatted_rows = []
-            for r in rows:
-                new_row = r.copy()
-                c_id = r.get("vehicleColor")
-                try: c_id = int(c_id)
-                except: c_id = -1
-                new_row["vehicleColor"] = VEHICLE_COLORS.get(c_id, str(c_id))
-                formatted_rows.append(new_row)
-
-            if table: table.render_data(formatted_rows)
-            render_pagination()
-        else:
-            if table: table.render_data([])
-            render_pagination()
+    # Render instantly from the local mirror, then refresh from Artemis in the background
+    if api_handler and call_api_async:
+        load_seq += 1
+        seq = load_seq
+        filters = {k: v for k, v in payload.items() if k != "pageNo"}
+        cached = page_cache.get(filters, current_page) if page_cache else None
+        if cached is not None:
+            on_data_loaded(cached, seq, filters, from_cache=True)
+            return
+        if not show_cached_page() and table: table.show_loading()
+        call_api_async(
+            table or pagination_frame, API_VEHICLE_LIST, payload,
+            on_success=lambda res: on_data_loaded(res, seq, filters),
+            on_error=lambda e: on_data_failed(e, seq)
+        )
     else:
         if table: table.render_data([])
 
+def show_cached_page():
+    """ Renders the current page from SQLite; returns False when nothing is cached for it """
+    if not local_store: return False
+    where, like = {}, {}
+    if plate_var.get().strip(): like["plateNo"] = plate_var.get().strip()
+    group_val = group_combo.get()
+    if group_val and group_val != "All": where["vehicleGroupIndexCode"] = group_val.split(" - ")[0]
+
+    rows, total = local_store.cached_page("vehicles", current_page, page_size, where=where, like=like)
+    if not rows: return False
+    show_rows(rows, total)
+    return True
+
+def on_data_loaded(res, seq, filters=None, from_cache=False):
+    """ Renders a list response; from_cache=True for a PageCache hit (already stored, so only rendered) """
+    if seq != load_seq: return  # A newer page/search was requested meanwhile
+
+    if res and str(res.get("code")) == "0":
+        data = res.get("data", {})
+        rows = data.get("list", [])
+        if not from_cache:
+            if local_store: local_store.remember("vehicles", rows)
+            if page_cache and filters is not None: page_cache.put(filters, current_page, res)
+        show_rows(rows, data.get("total", 0))
+        prefetch_neighbours(filters)
+    else:
+        if table: table.render_data([])
+        render_pagination()
+
+def prefetch_neighbours(filters):
+    """ Loads the Next / Prev pages in the background once the current page has rendered """
+    if not page_cache or filters is None: return
+    total_pages = math.ceil(total_records / page_size) if total_records else 1
+    page_cache.prefetch(table or pagination_frame, filters, current_page, total_pages,
+                        lambda page: fetch_page(filters, page))
+
+def fetch_page(filters, page):
+    """ Worker thread: one list page (mirrored like a page that was shown), or None for an error code or a non-JSON-object body """
+    res = api_handler.request_json(API_VEHICLE_LIST, dict(filters, pageNo=page))
+    if not (isinstance(res, dict) and str(res.get("code")) == "0"): return None
+    if local_store: local_store.remember("vehicles", (res.get("data") or {}).get("list", []))
+    return res
+
+def show_rows(rows, total):
+    global total_records, vehicle_cache
+    total_records = total
+    vehicle_cache = rows 
+
+    formatted_rows = []
+    for r in rows:
+        new_row = r.copy()
+        c_id = r.get("vehicleColor")
+        try: c_id = int(c_id)
+        except: c_id = -1
+        new_row["vehicleColor"] = VEHICLE_COLORS.get(c_id, str(c_id))
+        formatted_rows.append(new_row)
+
+    if table: table.render_data(formatted_rows)
+    render_pagination()
+
+def on_data_failed(error, seq):
+    if seq != load_seq: return
+    # Host unreachable -> keep showing whatever the local mirror has
+    shown = show_cached_page()
+    if not shown:
+        if table: table.render_data([])
+        render_pagination()
+    # With the circuit open the header already says the host is down; only interrupt if nothing is cached
+    if not (shown and isinstance(error, api_handler.CircuitOpenError)):
+        api_handler.report_api_error(error)
+
 def render_pagination():
     for w in pagination_frame.winfo_children(): w.destroy()
     total_pages = math.ceil(total_records / page_size) if total_records else 1
@@ -198,12 +285,27 @@ def render_pagination():
 
     tk.Label(pagination_frame, text=f"(Total: {total_records})", bg=BG_COLOR, fg="#7F8C8D").pack(side="right", padx=20)
 
+def run_search():
+    """ Enter / Search button / group change: search now instead of waiting for the debounce """
+    if live_search: live_search.flush()
+    else: load_data(1)
+
 def clear_search():
     plate_var.set("")
     if group_combo['values']: group_combo.current(0)
-    load_data(1)
+    run_search()
+
+def refresh():
+    """ Screen manager hook: the kept-alive list is shown again, reload the current page (it may have changed meanwhile) """
+    if page_cache: page_cache.invalidate()
+    load_data(current_page)
 
 # ================= HANDLERS =================
+def back_to_list():
+    """ Form success callback; going through the caller's entry point keeps its screen manager in sync """
+    if saved_callback: saved_callback()
+    else: show_list(main_frame_ref)
+
 def handle_edit(row_data):
     plate = row_data.get("plateNo")
     full_obj = next((v for v in vehicle_cache if v.get("plateNo") == plate), row_data)
@@ -211,7 +313,7 @@ def handle_edit(row_data):
     if vehicle_form:
         vehicle_form.show_vehicle_form(
             main_frame_ref, 
-            on_success_callback=lambda: show_list(main_frame_ref), 
+            on_success_callback=back_to_list, 
             edit_data=full_obj
         )
 
@@ -220,5 +322,7 @@ def handle_delete(row_data):
     
     if messagebox.askyesno("Confirm Delete", f"Delete Vehicle '{plate}'?"):
         if vehicle_delete and vehicle_delete.delete_vehicle(plate):
+            if local_store: local_store.forget("vehicles", plateNo=plate)
             messagebox.showinfo("Deleted", "Vehicle deleted successfully.")
+            if page_cache: page_cache.invalidate()
             load_data(current_page)
\ No newline at end of file
@@ -7,7 +7,7 @@ import threading
 
 # Try to import your API handler
 try:
-    import Api.Common_signature.common_signature_api as api_handler
+    import src.Api.Common_signature.common_signature_api as api_handler
 except ImportError:
     api_handler = None
 
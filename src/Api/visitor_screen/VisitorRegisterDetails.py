@@ -5,7 +5,7 @@ from datetime import datetime, timedelta
 
 # Try to import your API handler
 try:
-    import Api.Common_signature.common_signature_api as api_handler
+    import src.Api.Common_signature.common_signature_api as api_handler
 except ImportError:
     api_handler = None
 
@@ -1,6 +1,6 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import Api.Common_signature.common_signature_api as api_handler
+import src.Api.Common_signature.common_signature_api as api_handler
 
 # ===== CONFIG =====
 DELETE_API_PATH = "/artemis/api/visitor/v1/appointment/single/delete"
@@ -2,7 +2,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from tkcalendar import DateEntry
 from datetime import datetime
-import Api.Common_signature.common_signature_api as api_handler
+import src.Api.Common_signature.common_signature_api as api_handler
 
 # ===== COLORS =====
 BG_COLOR = "#F4F6F7"
@@ -13,7 +13,7 @@ except ImportError:
 
 # Try importing the API handler safely
 try:
-    import Api.Common_signature.common_signature_api as api_handler
+    import src.Api.Common_signature.common_signature_api as api_handler
 except ImportError:
     api_handler = None
 
@@ -5,18 +5,27 @@ from datetime import date
 import urllib3
 urllib3.disable_warnings()
 
-from Api.Common_signature.common_signature_api import get_visitor_list
-from Api.visitor_screen.visitor_registerment import show_register_screen
-from Api.visitor_screen.visitor_delete import delete_appointment_logic
+from src.Api.Common_signature.common_signature_api import get_visitor_list
+from src.Api.Common_signature import local_store
+from src.Api.Common_signature.async_client import run_async
+from src.Api.Common_signature.live_search import LiveSearch
+from src.Api.Common_signature import search_index
+from src.Api.Common_signature.page_cache import PageCache
+from src.Api.visitor_screen.visitor_registerment import show_register_screen
+from src.Api.visitor_screen.visitor_delete import delete_appointment_logic
 
 # IMPORT THE NEW GRID CLASS
-from Api.Common_signature.action_grid import ActionGrid 
+from src.Api.Common_signature.action_grid import ActionGrid 
 
 # ================= CONFIG =================
 PAGE_SIZE = 15
+SEARCH_LIMIT = 200   # Max matches shown when searching all cached appointments
 current_page = 1
 appointments_cache = []
 filtered_cache = []
+search_mode = False  # True while the grid shows index matches instead of the current page
+load_seq = 0  # Bumped per request so late responses for old pages are ignored
+page_cache = PageCache()  # Prefetched neighbour pages, so Next / Prev render at once
 
 table = None
 pagination_frame = None
@@ -24,12 +33,14 @@ from_picker = None
 to_picker = None
 search_var = None
 content_frame = None  
+live_search = None
 
 # ================= MAIN SCREEN =================
 def show_single_visitor_list(root):
     global content_frame
     content_frame = root  
-    global table, pagination_frame, from_picker, to_picker, search_var
+    page_cache.invalidate()
+    global table, pagination_frame, from_picker, to_picker, search_var, live_search
 
     for w in root.winfo_children(): w.destroy()
     root.configure(bg="white")
@@ -59,6 +70,9 @@ def show_single_visitor_list(root):
     tk.Button(search_frame, text="🔍 Search", bg="#3498DB", fg="white", bd=0, padx=15, command=lambda: load_data(1)).pack(side="left", padx=10)
     tk.Button(search_frame, text="✖ Clear", bg="white", fg="#7F8C8D", bd=1, padx=10, command=clear_search).pack(side="left")
 
+    # Search all cached appointments as you type (debounced); Enter / Search reloads from Artemis
+    live_search = LiveSearch(search_frame, [search_var], lambda: apply_search(search_var.get()))
+
     # --- ACTION GRID ---
     tree_frame = tk.Frame(root, bg="white")
     tree_frame.pack(fill="both", expand=True, padx=20, pady=10)
@@ -78,7 +92,8 @@ def show_single_visitor_list(root):
         tree_frame,
         columns=cols,
         edit_command=handle_edit_click,
-        delete_command=handle_delete_click
+        delete_command=handle_delete_click,
+        row_key="appointID"
     )
     table.pack(fill="both", expand=True)
 
@@ -86,25 +101,62 @@ def show_single_visitor_list(root):
     pagination_frame = tk.Frame(root, bg="#F4F6F7", pady=10)
     pagination_frame.pack(fill="x")
 
+    search_index.warm_up()
     load_data(1)
 
 
 # ================= LOAD DATA =================
 def load_data(page):
-    global current_page, appointments_cache
+    global current_page, load_seq
     current_page = page
     start = from_picker.get_date().strftime("%Y-%m-%dT00:00:00+05:30")
     end = to_picker.get_date().strftime("%Y-%m-%dT23:59:59+05:30")
 
-    appointments_cache = get_visitor_list(page_no=current_page, page_size=PAGE_SIZE, appoint_start=start, appoint_end=end)
+    # Fetch in the background; only the latest request's result is rendered
+    load_seq += 1
+    seq = load_seq
+    filters = {"start": start, "end": end}
+    cached = page_cache.get(filters, current_page)
+    if cached is not None:
+        on_data_loaded(cached, seq, filters, from_cache=True)
+        return
+    table.show_loading()
+    run_async(table, get_visitor_list, current_page, PAGE_SIZE, start, end,
+              on_success=lambda rows: on_data_loaded(rows, seq, filters))
+
+def on_data_loaded(rows, seq, filters, from_cache=False):
+    """ Renders a page of appointments; from_cache=True for a PageCache hit (already stored, so only rendered) """
+    global appointments_cache
+    if seq != load_seq: return
+    appointments_cache = rows
+    if not from_cache:
+        local_store.remember("appointments", appointments_cache)
+        if rows: page_cache.put(filters, current_page, rows)
+    if live_search: live_search.cancel()
     apply_search(search_var.get())
 
+    # The list endpoint gives no total here; a full page means there may be a next one
+    last_page = current_page + 1 if len(rows) >= PAGE_SIZE else current_page
+    page_cache.prefetch(table, filters, current_page, last_page, lambda page: fetch_page(filters, page))
+
+def fetch_page(filters, page):
+    """ Worker thread: one prefetched page (None when empty), mirrored like a page that was shown """
+    rows = get_visitor_list(page, PAGE_SIZE, filters["start"], filters["end"])
+    if not rows: return None
+    local_store.remember("appointments", rows)
+    return rows
+
 # ================= SEARCH & RENDER =================
 def apply_search(text):
-    global filtered_cache
+    global filtered_cache, search_mode
     text = text.lower().strip()
     
+    # Search covers every appointment in the local store via the inverted index; until the index
+    # has been built (first search) fall back to filtering the visible page
+    matches = search_index.search_appointments(text, limit=SEARCH_LIMIT) if text else None
+    search_mode = matches is not None
     if not text: filtered_cache = appointments_cache
+    elif matches is not None: filtered_cache = matches
     else: filtered_cache = [v for v in appointments_cache if text in str(v).lower()]
 
     flat_data = []
@@ -137,19 +189,27 @@ def handle_delete_click(row_data):
     appoint_id = row_data.get("appointID")
     if messagebox.askyesno("Confirm Delete", f"Delete Appointment {appoint_id}?"):
         if delete_appointment_logic(appoint_id):
+            local_store.forget("appointments", appointID=appoint_id)
             messagebox.showinfo("Deleted", "Appointment deleted successfully.")
+            page_cache.invalidate()
             load_data(current_page) 
         else:
             messagebox.showerror("Error", "Failed to delete appointment.")
 
 def open_registration_for_edit(appoint_id):
-    record = next((r for r in appointments_cache if str(r.get("appointID")) == str(appoint_id)), None)
+    record = next((r for r in filtered_cache + appointments_cache if str(r.get("appointID")) == str(appoint_id)), None)
     if not record: return
     show_register_screen(root_instance=content_frame, show_main_screen_callback=lambda: show_single_visitor_list(content_frame), edit_data=record.get("visitorInfo", {}))
 
 # ================= PAGINATION =================
 def render_pagination():
     for w in pagination_frame.winfo_children(): w.destroy()
+
+    if search_mode:
+        found = f"{SEARCH_LIMIT}+" if len(filtered_cache) >= SEARCH_LIMIT else str(len(filtered_cache))
+        tk.Label(pagination_frame, text=f"{found} matches in cached appointments", bg="#F4F6F7",
+                 font=("Segoe UI", 10, "bold")).pack(side="left", padx=10)
+        return
     
     state = "normal" if current_page > 1 else "disabled"
     tk.Button(pagination_frame, text="◀ Prev", command=lambda: load_data(current_page - 1), state=state, bg="white", bd=1).pack(side="left", padx=10)
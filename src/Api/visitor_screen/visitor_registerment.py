@@ -4,8 +4,8 @@ import os
 from tkinter import ttk, messagebox
 from datetime import datetime, timedelta
 from tkcalendar import DateEntry
-import Api.Common_signature.common_signature_api as api_handler
-import Api.visitor_screen.visitor_appointment as visitor_appointment 
+import src.Api.Common_signature.common_signature_api as api_handler
+import src.Api.visitor_screen.visitor_appointment as visitor_appointment 
 import json
 
 # ==========================================
@@ -0,0 +1,354 @@
+"""
+Benchmark harness for the API layer and list rendering.
+
+Runs everything against tools/mock_artemis_server.py (started in-process) and writes a JSON report
+with p50/p95/p99 latencies per benchmark and the process's peak RSS:
+
+    python tools/benchmark.py --output bench_main.json
+    python tools/benchmark.py --output bench_branch.json --compare bench_main.json
+
+Tk benchmarks need a display; without DISPLAY the harness starts Xvfb when it is installed,
+otherwise those benchmarks are reported as skipped.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# benchmark.py
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+for path in (BASE_DIR, os.path.dirname(os.path.abspath(__file__))):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import mock_artemis_server as mock
+
+GRID_SIZES = (10, 100, 1000, 10000)
+REGRESSION_THRESHOLD = 1.20   # --compare fails when a p50 grows by more than 20%
+
+API_ENDPOINTS = {
+    "personList": ("/artemis/api/resource/v1/person/personList", {"pageNo": 1, "pageSize": 100}),
+    "vehicleList": ("/artemis/api/resource/v1/vehicle/vehicleList", {"pageNo": 1, "pageSize": 100}),
+    "appointmentlist": ("/artemis/api/visitor/v1/appointment/appointmentlist", {"pageNo": 1, "pageSize": 100}),
+    "acsDeviceList": ("/artemis/api/resource/v1/acsDevice/acsDeviceList", {"pageNo": 1, "pageSize": 100}),
+}
+
+
+# ------------------------------------------------------------
+# MEASUREMENT HELPERS
+# ------------------------------------------------------------
+def percentile(samples, pct):
+    """ Nearest-rank percentile of a list of numbers """
+    if not samples: return None
+    ordered = sorted(samples)
+    rank = max(1, int(round(pct / 100.0 * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def peak_rss_kb():
+    """ Process-wide high-water mark (ru_maxrss): never goes down, so it is not a per-benchmark figure """
+    if resource is None: return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak   # macOS reports bytes
+
+
+def summarize(samples_ms, **extra):
+    result = {
+        "runs": len(samples_ms),
+        "p50_ms": round(percentile(samples_ms, 50), 3),
+        "p95_ms": round(percentile(samples_ms, 95), 3),
+        "p99_ms": round(percentile(samples_ms, 99), 3),
+        "mean_ms": round(sum(samples_ms) / len(samples_ms), 3),
+        "process_peak_rss_kb": peak_rss_kb(),   # high-water mark of the whole run so far
+    }
+    result.update(extra)
+    return result
+
+
+def timed(fn, runs, warmup=1):
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+# ------------------------------------------------------------
+# VIRTUAL DISPLAY
+# ------------------------------------------------------------
+def ensure_display():
+    """ Returns (xvfb_process or None, reason-if-unavailable or None) """
+    if sys.platform.startswith("win") or sys.platform == "darwin" or os.environ.get("DISPLAY"):
+        return None, None
+    xvfb = shutil.which("Xvfb")
+    if not xvfb:
+        return None, "no DISPLAY and Xvfb is not installed"
+    display = ":97"
+    proc = subprocess.Popen([xvfb, display, "-screen", "0", "1600x1200x24", "-nolisten", "tcp"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(0.5)
+    if proc.poll() is not None:
+        return None, "Xvfb failed to start"
+    os.environ["DISPLAY"] = display
+    return proc, None
+
+
+# ------------------------------------------------------------
+# API BENCHMARKS
+# ------------------------------------------------------------
+def bench_call_api(api, runs, concurrency):
+    results = {}
+    for name, (path, payload) in API_ENDPOINTS.items():
+        samples = timed(lambda: api.call_api(path, payload), runs)
+        results[f"call_api.{name}"] = summarize(samples)
+
+    # Throughput: person pages fired from a thread pool over the shared keep-alive session.
+    # Every request asks for a different page (cycling over 'concurrency' * 4 of them), so requests in
+    # flight together are never identical and single-flight cannot fold them into one call.
+    path, payload = API_ENDPOINTS["personList"]
+    total = runs * concurrency
+    latencies = []
+
+    def one(i):
+        started = time.perf_counter()
+        api.request_json(path, dict(payload, pageNo=1 + i % (concurrency * 4)))
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(total)))
+    elapsed = time.perf_counter() - started
+    results["call_api.throughput"] = summarize(latencies, concurrency=concurrency,
+                                               requests_per_sec=round(total / elapsed, 1))
+    return results
+
+
+# ------------------------------------------------------------
+# TK BENCHMARKS
+# ------------------------------------------------------------
+def pump_until(root, done, timeout=30):
+    deadline = time.perf_counter() + timeout
+    while not done():
+        root.update()
+        if time.perf_counter() > deadline:
+            raise TimeoutError("screen did not finish loading")
+        time.sleep(0.0005)
+    root.update_idletasks()
+
+
+def bench_load_data(root, runs):
+    """ End-to-end load_data(1) per list screen: request, response, formatting and grid render """
+    import tkinter as tk
+    from src.Api.person_screen import person_list
+    from src.Api.vehicle_screen import vehicle_list
+    from src.Api.vehicle_screen import vehicle_group_list
+    from src.Api.visitor_screen import visitor_list_Info
+
+    results = {}
+    frame = tk.Frame(root)
+    frame.pack(fill="both", expand=True)
+
+    def async_screen(name, module, show):
+        # Async screens finish in on_data_loaded; wrap it to know when the response was rendered
+        state = {"done": False}
+        original = module.on_data_loaded
+
+        def wrapped(res, seq, *args):
+            original(res, seq, *args)
+            if seq == module.load_seq: state["done"] = True
+
+        module.on_data_loaded = wrapped
+        try:
+            show(frame)
+            pump_until(root, lambda: state["done"])
+
+            def run():
+                state["done"] = False
+                # Otherwise PageCache answers every run after the first (a dict lookup, not a load)
+                if getattr(module, "page_cache", None): module.page_cache.invalidate()
+                module.load_data(1)
+                pump_until(root, lambda: state["done"])
+            results[f"load_data.{name}"] = summarize(timed(run, runs))
+        finally:
+            module.on_data_loaded = original
+
+    async_screen("person_list", person_list, person_list.show_list)
+    async_screen("vehicle_list", vehicle_list, vehicle_list.show_list)
+    async_screen("vehicle_group_list", vehicle_group_list, vehicle_group_list.show_group_list)
+    async_screen("visitor_list_Info", visitor_list_Info, visitor_list_Info.show_single_visitor_list)
+
+    frame.destroy()
+    return results
+
+
+def bench_render(root, sizes, runs):
+    """ ActionGrid.render_data: first render into an empty grid, then a same-keys re-render (diff path) """
+    import tkinter as tk
+    from src.Api.Common_signature.action_grid import ActionGrid
+
+    cols = [("personCode", "Person ID", 2), ("personName", "Name", 3), ("gender", "Gender", 2),
+            ("cardNo", "Card No", 4), ("phoneNo", "Phone", 2)]
+    results = {}
+    for virtual in (False, True):
+        mode = "virtual" if virtual else "grid"
+        for size in sizes:
+            rows = [{"personCode": f"EMP{i:05d}", "personName": f"Person {i}", "gender": "Male",
+                     "cardNo": f"{i:010d}", "phoneNo": f"98{i:08d}"} for i in range(size)]
+            # Large non-virtual grids are slow by design; fewer runs keep the suite usable
+            n = max(1, runs // 10) if size >= 1000 else runs
+            first, again = [], []
+            for _ in range(n):
+                host = tk.Frame(root, width=1200, height=800)
+                host.pack(fill="both", expand=True)
+                grid = ActionGrid(host, columns=cols, virtual=virtual, row_key="personCode")
+                grid.pack(fill="both", expand=True)
+                root.update()
+
+                started = time.perf_counter()
+                grid.render_data(rows)
+                root.update_idletasks()
+                first.append((time.perf_counter() - started) * 1000)
+
+                started = time.perf_counter()
+                grid.render_data(rows)
+                root.update_idletasks()
+                again.append((time.perf_counter() - started) * 1000)
+
+                host.destroy()
+                root.update()
+            results[f"render_data.{mode}.{size}"] = summarize(first)
+            results[f"render_data.{mode}.{size}.rerender"] = summarize(again)
+    return results
+
+
+# ------------------------------------------------------------
+# REPORT
+# ------------------------------------------------------------
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(report, baseline_path, threshold=REGRESSION_THRESHOLD):
+    """ Prints p50 ratios against a previous report; returns the names that regressed """
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    regressions = []
+    print(f"\n📊 Compared with {baseline_path}")
+    for name, current in sorted(report["results"].items()):
+        before = baseline.get(name)
+        if not before or not isinstance(current, dict) or "p50_ms" not in current or not before.get("p50_ms"):
+            continue
+        ratio = current["p50_ms"] / before["p50_ms"]
+        flag = "❌" if ratio > threshold else "  "
+        print(f"{flag} {name:45s} {before['p50_ms']:>10.2f} -> {current['p50_ms']:>10.2f} ms  x{ratio:.2f}")
+        if ratio > threshold: regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API + grid benchmarks against the mock Artemis server")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--sizes", default=",".join(map(str, GRID_SIZES)), help="grid row counts")
+    parser.add_argument("--latency-ms", type=float, default=0, help="mock server latency")
+    parser.add_argument("--persons", type=int, default=5000)
+    parser.add_argument("--with-cache", action="store_true", help="keep the response cache on (default: off)")
+    parser.add_argument("--skip-ui", action="store_true")
+    parser.add_argument("--compare", help="previous report to diff against; exit 1 on regression")
+    args = parser.parse_args()
+
+    # --- Mock host (must be configured before the API modules are imported) ---
+    dataset = mock.MockDataset(persons=args.persons, vehicles=args.persons // 2, appointments=args.persons)
+    server, base_url = mock.start_in_thread(dataset=dataset, faults=mock.FaultConfig(latency_ms=args.latency_ms))
+    os.environ["ARTEMIS_BASE_URL"] = base_url
+
+    # Keep the benchmark out of the real local mirror
+    tmp_dir = tempfile.mkdtemp(prefix="vms_bench_")
+    import src.Api.Common_signature.local_store as local_store
+    local_store.configure(os.path.join(tmp_dir, "bench.sqlite3"))
+
+    import src.Api.Common_signature.common_signature_api as api
+    if not args.with_cache:
+        api.response_cache.ttl.clear()
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "mock": {"persons": args.persons, "latency_ms": args.latency_ms},
+            "runs": args.runs,
+            "response_cache": args.with_cache,
+        },
+        "results": {},
+    }
+
+    print("⏱️ call_api ...")
+    report["results"].update(bench_call_api(api, args.runs, args.concurrency))
+
+    xvfb = None
+    if args.skip_ui:
+        report["meta"]["ui_skipped"] = "--skip-ui"
+    else:
+        xvfb, reason = ensure_display()
+        try:
+            import tkinter as tk
+            root = None if reason else tk.Tk()
+        except Exception as e:
+            root, reason = None, f"Tk unavailable: {e}"
+
+        if root is None:
+            print(f"⚠️ Skipping Tk benchmarks: {reason}")
+            report["meta"]["ui_skipped"] = reason
+        else:
+            root.geometry("1400x900")
+            sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+            print("⏱️ load_data ...")
+            report["results"].update(bench_load_data(root, args.runs))
+            print("⏱️ render_data ...")
+            report["results"].update(bench_render(root, sizes, args.runs))
+            root.destroy()
+
+    report["meta"]["process_peak_rss_kb"] = peak_rss_kb()
+    report["meta"]["session"] = api.session_stats()
+    server.shutdown()
+    if xvfb: xvfb.terminate()
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"✅ Wrote {args.output}")
+    for name, r in sorted(report["results"].items()):
+        print(f"   {name:45s} p50 {r['p50_ms']:>9.2f}  p95 {r['p95_ms']:>9.2f}  p99 {r['p99_ms']:>9.2f} ms")
+
+    if args.compare:
+        regressions = compare(report, args.compare)
+        if regressions:
+            print(f"❌ {len(regressions)} regression(s) above x{REGRESSION_THRESHOLD}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
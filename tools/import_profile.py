@@ -0,0 +1,109 @@
+"""
+Cold-start import cost of every screen registered in Ui.py.
+
+Each screen module is imported in a fresh interpreter under `python -X importtime`, so the numbers
+match a first click on a kiosk PC (nothing shared with previously opened screens except the
+interpreter itself):
+
+    python tools/import_profile.py
+    python tools/import_profile.py --top 10 --runs 7 --json import_profile.json
+
+The baseline (interpreter + tkinter) and every screen are the fastest of --runs cold starts; deltas
+smaller than the baseline's own run-to-run spread are reported as noise.
+
+For the in-app view (modules already loaded by earlier screens are free), start the app with
+`python main.py --profile-imports`.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# import_profile.py
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+HOMEPAGE_DIR = os.path.join(BASE_DIR, "src", "Api", "Homepage")
+IMPORT_PATHS = [BASE_DIR, HOMEPAGE_DIR]   # same sys.path as main.py
+
+
+def screen_modules():
+    """ Module paths of Ui.LazyScreen.registry (Ui.py only builds proxies at import time) """
+    code = ("import sys; sys.path[:0] = %r; import Ui; print('\\n'.join(Ui.LazyScreen.registry))" % IMPORT_PATHS)
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=BASE_DIR)
+    if out.returncode != 0:
+        raise SystemExit(f"Could not load Ui.py:\n{out.stderr}")
+    return [line for line in out.stdout.splitlines() if line.startswith("src.")]
+
+
+def profile(module_path):
+    """ (total_ms, rows) where rows = [(self_us, cumulative_us, name)] from -X importtime """
+    code = "import sys; sys.path[:0] = %r; import %s" % (IMPORT_PATHS, module_path)
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, cwd=BASE_DIR)
+
+    rows, error = [], None
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:"):
+            if line.strip(): error = line.strip()
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit(): continue   # header line
+        rows.append((int(parts[0]), int(parts[1]), parts[2][1:].rstrip()))   # keep the nesting indent
+
+    if out.returncode != 0:
+        return None, rows, error
+    # Top-level entries (no indentation) add up to the whole interpreter + module import
+    total_us = sum(cum for _, cum, name in rows if not name.startswith(" "))
+    return total_us / 1000, rows, None
+
+
+def profile_best(module_path, runs):
+    """ Fastest of 'runs' cold imports as (total_ms, rows, error), plus the spread (max - min) in ms """
+    best, totals = None, []
+    for _ in range(max(1, runs)):
+        result = profile(module_path)
+        if result[0] is None:
+            return result, 0.0
+        totals.append(result[0])
+        if best is None or result[0] < best[0]: best = result
+    return best, max(totals) - min(totals)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold import time of each Ui.py screen")
+    parser.add_argument("--top", type=int, default=5, help="slowest modules (self time) listed per screen")
+    parser.add_argument("--runs", type=int, default=5, help="cold starts per module; the fastest one counts")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    (baseline, _, error), noise = profile_best("tkinter", args.runs)
+    if baseline is None:
+        raise SystemExit(f"Could not import tkinter: {error}")
+    results = []
+    for module_path in screen_modules():
+        (total_ms, rows, error), _ = profile_best(module_path, args.runs)
+        delta = None if total_ms is None else total_ms - baseline
+        results.append({"screen": module_path, "total_ms": total_ms, "error": error,
+                        "over_baseline_ms": None if delta is None else max(delta, 0.0),
+                        "within_noise": delta is not None and delta <= noise,
+                        "slowest": [{"module": name.strip(), "self_ms": s / 1000, "cumulative_ms": c / 1000}
+                                    for s, c, name in sorted(rows, reverse=True)[:args.top]]})
+
+    print(f"Baseline (interpreter + tkinter): {baseline:.1f} ms (best of {args.runs}, ±{noise:.1f} ms spread)\n")
+    for r in sorted(results, key=lambda r: -(r["total_ms"] or 0)):
+        if r["total_ms"] is None:
+            print(f"❌ {r['screen']}: {r['error']}")
+            continue
+        over = "within noise of the baseline" if r["within_noise"] else f"{r['over_baseline_ms']:+.1f} ms over baseline"
+        print(f"⏱ {r['screen']}: {r['total_ms']:.1f} ms ({over})")
+        for s in r["slowest"]:
+            print(f"    self {s['self_ms']:8.1f} ms | cumulative {s['cumulative_ms']:8.1f} ms | {s['module']}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"baseline_ms": baseline, "baseline_noise_ms": noise, "runs": args.runs, "screens": results}, f, indent=2)
+        print(f"\nWritten to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
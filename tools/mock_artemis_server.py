@@ -0,0 +1,574 @@
+"""
+Local stand-in for the Artemis / HikCentral OpenAPI host.
+
+Serves synthetic data for every endpoint the app calls, verifies the X-Ca-Signature
+produced by common_signature_api.create_signature, and can inject latency and errors.
+
+    python tools/mock_artemis_server.py --port 8080 --persons 5000 --latency-ms 40 --error-rate 0.02
+    ARTEMIS_BASE_URL=http://127.0.0.1:8080 python main.py
+
+Standard library only.
+"""
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import random
+import ssl
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# mock_artemis_server.py
+
+# --- Credentials (same defaults as common_signature_api) ---
+APP_KEY = "11566257"
+APP_SECRET = "DBntId5f4LZPfW1Ik5Yh"
+
+# --- Dataset Defaults ---
+DEFAULT_SIZES = {
+    "persons": 500,
+    "vehicles": 300,
+    "vehicle_groups": 10,
+    "appointments": 1000,
+    "devices": 20,
+    "doors_per_device": 4,
+    "regions": 30,
+}
+
+IST = timezone(timedelta(hours=5, minutes=30))
+
+# 1x1 white PNG, returned by visitor/qr/get
+QR_PNG = ("iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAAAAAA6fptVAAAACklEQVR4nGP4DwABAQEAG7buVgAAAABJRU5ErkJggg==")
+
+FIRST_NAMES = ["Arun", "Priya", "Karthik", "Divya", "Suresh", "Meena", "Vijay", "Lakshmi", "Ravi", "Anitha"]
+LAST_NAMES = ["Kumar", "Raj", "Sharma", "Iyer", "Nair", "Reddy", "Das", "Pillai", "Menon", "Rao"]
+REASONS = ["Meeting", "Interview", "Delivery", "Maintenance", "Audit"]
+
+
+def _iso(dt):
+    return dt.astimezone(IST).replace(microsecond=0).isoformat()
+
+
+def _parse(value):
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except (TypeError, ValueError):
+        return None
+
+
+# ------------------------------------------------------------
+# SIGNATURE CHECK (mirror of create_signature)
+# ------------------------------------------------------------
+def expected_signature(method, headers, body, api_path, app_secret=APP_SECRET):
+    accept = headers.get("Accept", "")
+    content_type = headers.get("Content-Type", "")
+    content_md5 = headers.get("Content-MD5", "")
+
+    signed = [h.strip().lower() for h in headers.get("X-Ca-Signature-Headers", "").split(",") if h.strip()]
+    headers_to_sign = "".join(f"{h}:{headers.get(h, '')}\n" for h in sorted(signed))
+
+    string_to_sign = f"{method}\n{accept}\n{content_md5}\n{content_type}\n{headers_to_sign}{api_path}"
+    digest = hmac.new(app_secret.encode("utf-8"), string_to_sign.encode("utf-8"), hashlib.sha256).digest()
+    return base64.b64encode(digest).decode("utf-8")
+
+
+def verify_request(method, headers, body, api_path, app_key=APP_KEY, app_secret=APP_SECRET):
+    """ Returns None when the request is correctly signed, otherwise the reason """
+    if headers.get("X-Ca-Key") != app_key:
+        return "unknown X-Ca-Key"
+    md5 = base64.b64encode(hashlib.md5(body).digest()).decode("utf-8")
+    if headers.get("Content-MD5") != md5:
+        return "Content-MD5 mismatch"
+    signature = headers.get("X-Ca-Signature", "")
+    if not hmac.compare_digest(signature, expected_signature(method, headers, body, api_path, app_secret)):
+        return "signature mismatch"
+    return None
+
+
+# ------------------------------------------------------------
+# SYNTHETIC DATASET
+# ------------------------------------------------------------
+class MockDataset:
+    """ In-memory records for every resource; writes from the app mutate it like the real host would """
+
+    def __init__(self, seed=7, **sizes):
+        self.sizes = dict(DEFAULT_SIZES, **{k: v for k, v in sizes.items() if v is not None})
+        self.rng = random.Random(seed)
+        self.lock = threading.RLock()
+        self._next_id = 10_000_000
+        self._generate()
+
+    def next_id(self):
+        with self.lock:
+            self._next_id += 1
+            return str(self._next_id)
+
+    def _name(self):
+        return self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+
+    def _generate(self):
+        rng = self.rng
+        n = self.sizes
+
+        self.regions = [{"indexCode": "root000000", "name": "Root", "parentIndexCode": "-1", "treeCode": "0"}]
+        for i in range(1, n["regions"]):
+            parent = self.regions[rng.randrange(len(self.regions))]["indexCode"]
+            self.regions.append({"indexCode": f"region{i:04d}", "name": f"Area {i}", "parentIndexCode": parent,
+                                 "treeCode": "0"})
+
+        self.vehicle_groups = [{"vehicleGroupIndexCode": str(i + 1), "vehicleGroupName": f"Group {i + 1}",
+                                "parentIndexCode": "0", "description": "Synthetic group"}
+                               for i in range(n["vehicle_groups"])]
+
+        self.persons = []
+        for i in range(n["persons"]):
+            given, family = self._name()
+            self.persons.append({
+                "personId": str(1000 + i), "personCode": f"EMP{i:05d}",
+                "personName": f"{given} {family}", "personGivenName": given, "personFamilyName": family,
+                "gender": rng.choice([1, 2]), "phoneNo": f"98{rng.randrange(10**8):08d}",
+                "orgIndexCode": "1", "orgName": "All Departments", "orgPathName": "All Departments",
+                "cards": [{"cardNo": f"{rng.randrange(10**9):010d}"}] if rng.random() < 0.7 else [],
+            })
+
+        self.vehicles = []
+        for i in range(n["vehicles"]):
+            owner = self.persons[i % len(self.persons)] if self.persons else {}
+            group = self.vehicle_groups[i % len(self.vehicle_groups)] if self.vehicle_groups else {}
+            self.vehicles.append({
+                "vehicleId": str(5000 + i), "plateNo": f"TN{i % 99:02d}AB{i:04d}",
+                "personId": owner.get("personId"), "personName": owner.get("personName"),
+                "vehicleColor": rng.randrange(0, 10), "vehicleType": 1,
+                "vehicleGroupIndexCode": group.get("vehicleGroupIndexCode"),
+                "vehicleGroupName": group.get("vehicleGroupName"),
+            })
+
+        self.devices, self.doors = [], []
+        for d in range(n["devices"]):
+            dev_code = f"dev{d:04d}"
+            self.devices.append({"acsDevIndexCode": dev_code, "acsDevName": f"Controller {d + 1}",
+                                 "acsDevIp": f"10.0.{d // 250}.{d % 250 + 1}", "acsDevPort": "8000",
+                                 "treatyType": "hiksdk_net", "status": rng.choice([0, 1])})
+            for k in range(n["doors_per_device"]):
+                self.doors.append({"doorIndexCode": f"{dev_code}-door{k + 1}", "doorName": f"Door {d + 1}-{k + 1}",
+                                   "acsDevIndexCode": dev_code, "doorNo": str(k + 1),
+                                   "regionIndexCode": self.regions[d % len(self.regions)]["indexCode"],
+                                   "doorState": rng.choice([0, 1, 2])})
+
+        now = datetime.now(IST)
+        self.visitors, self.appointments = {}, []
+        for i in range(n["appointments"]):
+            given, family = self._name()
+            visitor_id = str(20000 + i)
+            visitor = {"visitorId": visitor_id, "visitorName": f"{given} {family}", "visitorGivenName": given,
+                       "visitorFamilyName": family, "gender": rng.choice([1, 2]),
+                       "phoneNo": f"97{rng.randrange(10**8):08d}", "certificateNo": f"ID{i:06d}"}
+            self.visitors[visitor_id] = visitor
+
+            start = now + timedelta(days=rng.randint(-60, 30), hours=rng.randint(8, 17))
+            end = start + timedelta(hours=rng.choice([1, 2, 4]))
+            self.appointments.append({
+                "appointID": str(600000000000000000 + i), "appointRecordId": str(600000000000000000 + i),
+                "appointStartTime": _iso(start), "appointEndTime": _iso(end),
+                "visitorReasonName": rng.choice(REASONS), "receptionistName": "Admin",
+                "visitorStatus": rng.choice([0, 1, 2]), "visitorInfo": visitor,
+            })
+
+    # ---------------- helpers ----------------
+    def visit_records(self):
+        return [{"recordId": a["appointID"], "visitorStatus": str(a["visitorStatus"]),
+                 "visitorBaseInfo": {"fullName": a["visitorInfo"]["visitorName"],
+                                     "visitStartTime": a["appointStartTime"], "visitEndTime": a["appointEndTime"]}}
+                for a in self.appointments]
+
+
+# ------------------------------------------------------------
+# ENDPOINTS
+# ------------------------------------------------------------
+class ApiError(Exception):
+    def __init__(self, code, msg):
+        super().__init__(msg)
+        self.code = code
+        self.msg = msg
+
+
+def _page(rows, body):
+    page_no = max(int(body.get("pageNo") or 1), 1)
+    page_size = max(int(body.get("pageSize") or 20), 1)
+    start = (page_no - 1) * page_size
+    return {"total": len(rows), "pageNo": page_no, "pageSize": page_size, "list": rows[start:start + page_size]}
+
+
+def _contains(value, needle):
+    return str(needle).lower() in str(value or "").lower()
+
+
+def _in_window(rows, body, start_key, end_key, field):
+    start, end = _parse(body.get(start_key)), _parse(body.get(end_key))
+    if not start or not end: return rows
+    return [r for r in rows if (t := _parse(field(r))) and start <= t <= end]
+
+
+def _find(rows, key, value):
+    for r in rows:
+        if str(r.get(key)) == str(value):
+            return r
+    raise ApiError("0x00052102", f"{key} {value} does not exist")
+
+
+def build_routes(ds):
+    R = "/artemis/api/resource/v1"
+    V = "/artemis/api/visitor/v1"
+
+    def person_list(b):
+        rows = ds.persons
+        if b.get("personName"): rows = [r for r in rows if _contains(r["personName"], b["personName"])]
+        if b.get("personCode"): rows = [r for r in rows if r["personCode"] == str(b["personCode"])]
+        return _page(rows, b)
+
+    def person_add(b):
+        if any(p["personCode"] == b.get("personCode") for p in ds.persons):
+            raise ApiError("0x00052101", "personCode already exists")
+        given, family = b.get("personGivenName", ""), b.get("personFamilyName", "")
+        record = dict(b, personId=ds.next_id(), personName=f"{given} {family}".strip(), orgName="All Departments")
+        ds.persons.append(record)
+        return record["personId"]
+
+    def person_update(b):
+        record = _find(ds.persons, "personId" if b.get("personId") else "personCode", b.get("personId") or b.get("personCode"))
+        record.update(b)
+        return None
+
+    def person_delete(b):
+        record = _find(ds.persons, "personCode", b.get("personCode"))
+        ds.persons.remove(record)
+        return None
+
+    def vehicle_list(b):
+        rows = ds.vehicles
+        if b.get("plateNo"): rows = [r for r in rows if _contains(r["plateNo"], b["plateNo"])]
+        if b.get("vehicleGroupIndexCode"):
+            rows = [r for r in rows if r["vehicleGroupIndexCode"] == str(b["vehicleGroupIndexCode"])]
+        return _page(rows, b)
+
+    def vehicle_add(b):
+        if any(v["plateNo"] == b.get("plateNo") for v in ds.vehicles):
+            raise ApiError("0x00052301", "plateNo already exists")
+        record = dict(b, vehicleId=ds.next_id())
+        ds.vehicles.append(record)
+        return record["vehicleId"]
+
+    def vehicle_update(b):
+        _find(ds.vehicles, "plateNo", b.get("plateNo")).update(b)
+        return None
+
+    def vehicle_delete(b):
+        ds.vehicles.remove(_find(ds.vehicles, "plateNo", b.get("plateNo")))
+        return None
+
+    def group_list(b):
+        rows = ds.vehicle_groups
+        if b.get("vehicleGroupName"): rows = [r for r in rows if _contains(r["vehicleGroupName"], b["vehicleGroupName"])]
+        return _page(rows, b)
+
+    def group_add(b):
+        record = dict(b, vehicleGroupIndexCode=ds.next_id())
+        ds.vehicle_groups.append(record)
+        return {"vehicleGroupIndexCode": record["vehicleGroupIndexCode"]}
+
+    def group_update(b):
+        _find(ds.vehicle_groups, "vehicleGroupIndexCode", b.get("vehicleGroupIndexCode")).update(b)
+        return None
+
+    def group_delete(b):
+        ds.vehicle_groups.remove(_find(ds.vehicle_groups, "vehicleGroupIndexCode", b.get("vehicleGroupIndexCode")))
+        return None
+
+    def regions(b):
+        return _page(ds.regions, b)
+
+    def sub_regions(b):
+        parent = b.get("parentIndexCode")
+        return _page([r for r in ds.regions if r["parentIndexCode"] == parent], b)
+
+    def org_add(b):
+        record = {"indexCode": b.get("orgIndexCode") or ds.next_id(), "name": b.get("orgName", "New Org"),
+                  "parentIndexCode": b.get("parentIndexCode", "root000000"), "treeCode": "0"}
+        ds.regions.append(record)
+        return {"orgIndexCode": record["indexCode"]}
+
+    def appointment_list(b):
+        rows = _in_window(ds.appointments, b, "appointStartTime", "appointEndTime", lambda r: r["appointStartTime"])
+        return _page(rows, b)
+
+    def appointment_delete(b):
+        ds.appointments.remove(_find(ds.appointments, "appointID", b.get("appointRecordId")))
+        return None
+
+    def appointment_create(b):
+        info = (b.get("VisitorInfo") or b.get("visitorInfo") or {})
+        visitor = ds.visitors.get(str(info.get("visitorId"))) or {"visitorId": ds.next_id(), "visitorName": "Guest"}
+        record_id = ds.next_id()
+        now = datetime.now(IST)
+        ds.appointments.append({
+            "appointID": record_id, "appointRecordId": record_id,
+            "appointStartTime": b.get("appointStartTime") or _iso(now),
+            "appointEndTime": b.get("appointEndTime") or _iso(now + timedelta(hours=2)),
+            "visitorReasonName": "Meeting", "receptionistName": "Admin", "visitorStatus": 0, "visitorInfo": visitor,
+        })
+        return {"appointRecordId": record_id, "visitorId": visitor["visitorId"], "qrCodeImage": QR_PNG}
+
+    def appointment_update(b):
+        record = _find(ds.appointments, "appointID", b.get("appointRecordId") or b.get("appointID"))
+        for key in ("appointStartTime", "appointEndTime", "visitStartTime", "visitEndTime"):
+            if b.get(key): record[key.replace("visit", "appoint")] = b[key]
+        return None
+
+    def registerment(b):
+        entries = b.get("visitorInfoList") or [{}]
+        info = entries[0].get("VisitorInfo") or {}
+        visitor_id = str(info.get("visitorId") or ds.next_id())
+        ds.visitors.setdefault(visitor_id, {"visitorId": visitor_id})
+        ds.visitors[visitor_id].update(info, visitorId=visitor_id)
+        return {"visitorId": visitor_id}
+
+    def visitor_info(b):
+        rows = list(ds.visitors.values())
+        return {"total": len(rows), "VisitorInfo": rows[:int(b.get("pageSize") or 20)]}
+
+    def single_visitor(b):
+        visitor = ds.visitors.get(str(b.get("visitorId")))
+        if not visitor: raise ApiError("0x00072001", "visitor does not exist")
+        return visitor
+
+    def query_visitors(b):
+        rows = list(ds.visitors.values())
+        if b.get("visitorName"): rows = [r for r in rows if _contains(r.get("visitorName"), b["visitorName"])]
+        return _page(rows, b)
+
+    def visitor_out(b):
+        _find(ds.appointments, "appointID", b.get("appointRecordId"))["visitorStatus"] = 2
+        return None
+
+    def visitor_status(b):
+        record = next((a for a in ds.appointments if a["visitorInfo"]["visitorId"] == str(b.get("visitorId"))), None)
+        if not record: raise ApiError("0x00072001", "visitor does not exist")
+        return {"visitorStatus": record["visitorStatus"], "appointRecordId": record["appointID"]}
+
+    def register_records(b):
+        rows = _in_window(ds.visit_records(), b, "visitStartTime", "visitEndTime",
+                          lambda r: r["visitorBaseInfo"]["visitStartTime"])
+        return _page(rows, b)
+
+    def qr_get(b):
+        single_visitor(b)
+        return {"qrCodeInfo": {"qrCodeImage": QR_PNG}}
+
+    def visitor_group_create(b):
+        return {"visitorGroupId": ds.next_id(), "visitorGroupName": b.get("visitorGroupName")}
+
+    def visitor_group_info(b):
+        return _page([], b.get("VisitorListRequest") or {})
+
+    def device_list(b):
+        return _page(ds.devices, b)
+
+    def door_list(b):
+        rows = ds.doors
+        if b.get("acsDevIndexCode"): rows = [d for d in rows if d["acsDevIndexCode"] == b["acsDevIndexCode"]]
+        return _page(rows, b)
+
+    return {
+        f"{R}/person/personList": person_list,
+        f"{R}/person/single/add": person_add,
+        f"{R}/person/single/update": person_update,
+        f"{R}/person/single/delete": person_delete,
+        f"{R}/vehicle/vehicleList": vehicle_list,
+        f"{R}/vehicle/single/add": vehicle_add,
+        f"{R}/vehicle/single/update": vehicle_update,
+        f"{R}/vehicle/single/delete": vehicle_delete,
+        f"{R}/vehicleGroup/vehicleGroupList": group_list,
+        f"{R}/vehicleGroup/single/add": group_add,
+        f"{R}/vehicleGroup/single/update": group_update,
+        f"{R}/vehicleGroup/single/delete": group_delete,
+        f"{R}/regions": regions,
+        f"{R}/regions/subRegions": sub_regions,
+        f"{R}/org/single/add": org_add,
+        f"{R}/acsDevice/acsDeviceList": device_list,
+        f"{R}/acsDoor/acsDoorList": door_list,
+        f"{R}/acsDoor/advance/acsDoorList": door_list,
+        f"{V}/appointment/appointmentlist": appointment_list,
+        f"{V}/appointment/single/delete": appointment_delete,
+        f"{V}/appointment/getVisitorStatus": visitor_status,
+        "/artemis/api/visitor/v2/appointment": appointment_create,
+        "/artemis/api/visitor/v2/appointment/update": appointment_update,
+        f"{V}/registerment": registerment,
+        f"{V}/registerment/update": registerment,
+        f"{V}/visitor/visitorInfo": visitor_info,
+        f"{V}/visitor/single/visitorinfo": single_visitor,
+        f"{V}/visitor/queryVisitorList": query_visitors,
+        f"{V}/visitor/out": visitor_out,
+        f"{V}/visitor/qr/get": qr_get,
+        f"{V}/register/getVistorRegisterRecord": register_records,
+        f"{V}/visitorgroups": visitor_group_create,
+        f"{V}/visitorgroups/groupinfo": visitor_group_info,
+    }
+
+
+# ------------------------------------------------------------
+# HTTP SERVER
+# ------------------------------------------------------------
+class FaultConfig:
+    """
+    latency_ms / jitter_ms : delay added before every response
+    error_rate             : fraction of requests answered with HTTP 500
+    api_error_rate         : fraction answered 200 with a non-"0" Artemis code
+    drop_rate              : fraction whose connection is closed without a response
+    """
+
+    def __init__(self, latency_ms=0, jitter_ms=0, error_rate=0.0, api_error_rate=0.0, drop_rate=0.0, seed=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.api_error_rate = api_error_rate
+        self.drop_rate = drop_rate
+        self.rng = random.Random(seed)
+
+
+class MockArtemisServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, dataset=None, faults=None, verify_signature=True,
+                 app_key=APP_KEY, app_secret=APP_SECRET, quiet=True):
+        super().__init__(address, ArtemisHandler)
+        self.dataset = dataset or MockDataset()
+        self.routes = build_routes(self.dataset)
+        self.faults = faults or FaultConfig()
+        self.verify_signature = verify_signature
+        self.app_key = app_key
+        self.app_secret = app_secret
+        self.quiet = quiet
+        self.request_count = 0
+
+
+class ArtemisHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive, like the real host
+    disable_nagle_algorithm = True  # headers and body go out in separate writes; avoid the 40 ms delayed-ACK stall
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def log_message(self, fmt, *args):
+        if not self.server.quiet:
+            super().log_message(fmt, *args)
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, method):
+        server = self.server
+        faults = server.faults
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        server.request_count += 1
+
+        delay = faults.latency_ms + (faults.rng.uniform(-faults.jitter_ms, faults.jitter_ms) if faults.jitter_ms else 0)
+        if delay > 0: time.sleep(delay / 1000.0)
+
+        roll = faults.rng.random()
+        if roll < faults.drop_rate:
+            self.close_connection = True
+            return
+        roll -= faults.drop_rate
+        if roll < faults.error_rate:
+            return self._send(500, {"code": "500", "msg": "injected server error"})
+        roll -= faults.error_rate
+        if roll < faults.api_error_rate:
+            return self._send(200, {"code": "0x00052002", "msg": "injected API error", "data": None})
+
+        api_path = self.path.split("?", 1)[0]
+        if server.verify_signature:
+            reason = verify_request(method, self.headers, raw, api_path, server.app_key, server.app_secret)
+            if reason:
+                return self._send(401, {"code": "0x02401007", "msg": f"signature verification failed: {reason}"})
+
+        handler = server.routes.get(api_path)
+        if handler is None:
+            return self._send(404, {"code": "404", "msg": f"unknown API {api_path}"})
+
+        try:
+            body = json.loads(raw or b"{}")
+        except ValueError:
+            return self._send(200, {"code": "0x00052001", "msg": "invalid JSON body", "data": None})
+
+        try:
+            with server.dataset.lock:
+                data = handler(body)
+        except ApiError as e:
+            return self._send(200, {"code": e.code, "msg": e.msg, "data": None})
+        except (TypeError, ValueError) as e:
+            return self._send(200, {"code": "0x00052001", "msg": f"invalid parameter: {e}", "data": None})
+        self._send(200, {"code": "0", "msg": "Success", "data": data})
+
+
+def start_in_thread(port=0, host="127.0.0.1", dataset=None, faults=None, **server_options):
+    """ Starts a server on a daemon thread; returns (server, base_url). Stop with server.shutdown(). """
+    server = MockArtemisServer((host, port), dataset=dataset, faults=faults, **server_options)
+    threading.Thread(target=server.serve_forever, name="mock-artemis", daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock Artemis OpenAPI host for offline testing and benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--seed", type=int, default=7)
+    for name, size in DEFAULT_SIZES.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=int, default=size, help=f"default {size}")
+    parser.add_argument("--latency-ms", type=float, default=0)
+    parser.add_argument("--jitter-ms", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction answered with HTTP 500")
+    parser.add_argument("--api-error-rate", type=float, default=0.0, help="fraction answered with a non-0 code")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="fraction of connections closed unanswered")
+    parser.add_argument("--no-verify", action="store_true", help="accept unsigned requests")
+    parser.add_argument("--tls-cert", help="PEM certificate; serves HTTPS when given with --tls-key")
+    parser.add_argument("--tls-key")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    sizes = {name: getattr(args, name) for name in DEFAULT_SIZES}
+    dataset = MockDataset(seed=args.seed, **sizes)
+    faults = FaultConfig(args.latency_ms, args.jitter_ms, args.error_rate, args.api_error_rate, args.drop_rate, args.seed)
+    server = MockArtemisServer((args.host, args.port), dataset=dataset, faults=faults,
+                               verify_signature=not args.no_verify, quiet=not args.verbose)
+
+    scheme = "http"
+    if args.tls_cert and args.tls_key:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(args.tls_cert, args.tls_key)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+        scheme = "https"
+
+    print(f"🧪 Mock Artemis on {scheme}://{args.host}:{args.port} ({sizes})")
+    print(f"   ARTEMIS_BASE_URL={scheme}://{args.host}:{args.port} python main.py")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()